@@ -0,0 +1,40 @@
+import datetime
+import hashlib
+import sys
+import tracemalloc
+
+from blockchain import Block
+from block_store import ChainColumns
+
+# ----------------- Block Memory Benchmark ---------------- #
+class DictBlock:
+    # The previous Block layout: per-instance __dict__, ISO string, hex hashes
+    def __init__(self, vehicle_id, action, previous_hash):
+        self.vehicle_id = vehicle_id
+        self.action = action
+        self.timestamp = datetime.datetime.now().isoformat()
+        self.previous_hash = previous_hash
+        self.hash = hashlib.sha256(f"{vehicle_id}{action}{self.timestamp}{previous_hash}".encode()).hexdigest()
+
+def bytes_per_block(block_cls, chain, n):
+    tracemalloc.start()
+    prev_hash = "0"
+    for i in range(n):
+        block = block_cls(f"PSN-{i % 50000}", "revoked", prev_hash)
+        chain.append(block)
+        prev_hash = block.hash
+    del block
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / n
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print(f"{n} blocks")
+    results = [
+        ("list of __dict__ blocks (before)", bytes_per_block(DictBlock, [], n)),
+        ("list of __slots__ blocks", bytes_per_block(Block, [], n)),
+        ("ChainColumns (Blockchain.chain)", bytes_per_block(Block, ChainColumns(Block, "action"), n)),
+    ]
+    for name, per_block in results:
+        print(f"{name:<34} {per_block:6.0f} bytes/block ({per_block * n / 2**20:,.0f} MiB)")
@@ -0,0 +1,49 @@
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+from certificate_authority import Blockchain
+from key_registry import KeyRegistry
+from vanet_engine import SimulationEngine
+
+# ----------------- Sparse Scenario Benchmark ---------------- #
+# A quiet stretch with only a few revocations: the old fixed one-second tick
+# loop (every RSU polls the CA every tick) versus the event-driven engine,
+# where RSUs only sync after a revocation.
+
+def make_engine(tmp, name):
+    blockchain = Blockchain(os.path.join(tmp, name + ".jsonl"), fsync_policy="never")
+    return SimulationEngine(0, blockchain=blockchain, key_registry=KeyRegistry(os.path.join(tmp, name + ".db")),
+                            start_time=0.0)
+
+def fixed_ticks(engine, seconds, revocations):
+    due = dict(revocations)
+    for second in range(1, seconds + 1):
+        engine.scheduler.now = float(second)
+        for rsu in engine.rsus:
+            engine.sync(rsu)
+        if second in due:
+            engine.ca.revoke_certificate(due[second].vehicle_id)
+
+def event_driven(engine, seconds, revocations):
+    for second, v in revocations:
+        engine.scheduler.at(float(second), engine.revoke, v)
+    engine.run(seconds)
+
+if __name__ == "__main__":
+    seconds = int(float(sys.argv[1]) * 3600) if len(sys.argv) > 1 else 3600
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    revocations = [(seconds * (i + 1) // (count + 1), SimpleNamespace(vehicle_id=f"PSN-{i}"))
+                   for i in range(count)]
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, runner in (("fixed 1 s ticks", fixed_ticks), ("event-driven", event_driven)):
+            engine = make_engine(tmp, label.split()[0])
+            start = time.perf_counter()
+            runner(engine, seconds, revocations)
+            elapsed = time.perf_counter() - start
+            heights = {rsu.revocation_log.height for rsu in engine.rsus}
+            engine.close()
+            print(f"{label:<16} {seconds / 3600:g} h simulated, {count} revocations: {elapsed:7.3f} s "
+                  f"(RSUs at height {sorted(heights)})")
@@ -0,0 +1,46 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from key_registry import KeyRegistry
+from signatures import get_scheme
+
+# ----------------- Sybil Registry Benchmark ---------------- #
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size, elapsed
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    scheme = get_scheme()
+    pem_size = len(scheme.public_bytes(scheme.generate_private_key().public_key()))
+    # Random stand-ins of the real PEM length; generating n real keys would dominate the run
+    keys = [os.urandom(pem_size) for _ in range(n)]
+
+    pem_set, pem_bytes, _ = measure(lambda: {bytes(bytearray(k)) for k in keys})  # fresh copies, as the CA held them
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = KeyRegistry(os.path.join(tmp, "keys.db"))
+        _, fp_bytes, elapsed = measure(lambda: sum(registry.register(k, str(i)) for i, k in enumerate(keys)))
+        print(f"{n} {scheme.name} keys ({pem_size}-byte PEM)")
+        print(f"in-memory PEM set:      {pem_bytes / n:6.0f} bytes/key")
+        print(f"fingerprint registry:   {fp_bytes / n:6.0f} bytes/key in Python memory, "
+              f"{os.path.getsize(os.path.join(tmp, 'keys.db')) / n:.0f} bytes/key on disk")
+        print(f"register:               {n / elapsed:9,.0f} keys/sec (one commit each)")
+
+        start = time.perf_counter()
+        assert not any(registry.register(k, "sybil") for k in keys)
+        print(f"duplicate check:        {n / (time.perf_counter() - start):9,.0f} lookups/sec")
+        registry.close()
+
+        reopened = KeyRegistry(os.path.join(tmp, "keys.db"))
+        start = time.perf_counter()
+        assert all(k in reopened for k in keys[:10000])
+        print(f"after restart:          {10000 / (time.perf_counter() - start):9,.0f} lookups/sec")
+        reopened.close()
@@ -0,0 +1,32 @@
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+from mobility import LaneFollowing, RandomWalk
+
+# ----------------- Mobility Benchmark ---------------- #
+def per_object_walk(vehicles):
+    # The old Vehicle.move: two random.randint calls per vehicle per tick
+    for v in vehicles:
+        v.x += random.randint(-5, 5)
+        v.y += random.randint(-5, 5)
+
+def ticks_per_sec(step, ticks):
+    start = time.perf_counter()
+    for _ in range(ticks):
+        step()
+    return ticks / (time.perf_counter() - start)
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    ticks = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    rng = random.Random(1)
+    xs = [rng.uniform(0, 800) for _ in range(n)]
+    ys = [rng.uniform(0, 600) for _ in range(n)]
+    objects = [SimpleNamespace(x=x, y=y) for x, y in zip(xs, ys)]
+
+    print(f"{n} vehicles")
+    print(f"per-object random walk: {ticks_per_sec(lambda: per_object_walk(objects), max(1, ticks // 20)):9,.1f} ticks/sec")
+    print(f"vectorized random walk: {ticks_per_sec(RandomWalk(xs, ys, rng=1).step, ticks):9,.1f} ticks/sec")
+    print(f"vectorized lanes:       {ticks_per_sec(LaneFollowing(xs, ys, 800, rng=1).step, ticks):9,.1f} ticks/sec")
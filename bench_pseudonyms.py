@@ -0,0 +1,39 @@
+import os
+import sys
+import tempfile
+import time
+
+from certificate_authority import Blockchain, CertificateAuthority
+from key_registry import KeyRegistry
+
+# ----------------- Pseudonym Issuance Benchmark ---------------- #
+def issue_one_by_one(ca, vehicle_ids, count):
+    # What a pseudonym pool costs through the single-certificate path: one block and one commit each
+    for vehicle_id in vehicle_ids:
+        for i in range(count):
+            ca.blockchain.add_block(vehicle_id, f"Cert-{vehicle_id}-{i}")
+
+if __name__ == "__main__":
+    vehicles = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    vehicle_ids = [f"V{i}" for i in range(vehicles)]
+    with tempfile.TemporaryDirectory() as tmp:
+        ca = CertificateAuthority(Blockchain(os.path.join(tmp, "batch.jsonl")),
+                                  key_registry=KeyRegistry(os.path.join(tmp, "batch.db")))
+        start = time.perf_counter()
+        pools = ca.issue_pseudonyms(vehicle_ids, count)
+        elapsed = time.perf_counter() - start
+        issued = sum(len(p) for p in pools.values())
+        print(f"batch:      {issued} pseudonyms for {vehicles} vehicles in {elapsed:.2f} s "
+              f"({issued / elapsed:,.0f} certs/sec)")
+
+        sample = vehicle_ids[:max(1, vehicles // 100)]
+        ca.public_key_registry.close()
+        ca = CertificateAuthority(Blockchain(os.path.join(tmp, "single.jsonl")),
+                                  key_registry=KeyRegistry(os.path.join(tmp, "single.db")))
+        start = time.perf_counter()
+        issue_one_by_one(ca, sample, count)
+        elapsed = time.perf_counter() - start
+        print(f"one by one: {len(sample) * count} certificates in {elapsed:.2f} s "
+              f"({len(sample) * count / elapsed:,.0f} certs/sec)")
+        ca.public_key_registry.close()
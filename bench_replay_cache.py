@@ -0,0 +1,37 @@
+import os
+import sys
+import time
+
+from replay_cache import ReplayCache
+
+# ----------------- Replay Cache Benchmark ---------------- #
+# Drive one RSU's cache with a simulated clock at a fixed request rate and
+# replay a captured request now and then.
+
+if __name__ == "__main__":
+    per_hour = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    hours = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    n = int(per_hour * hours)
+    cache = ReplayCache.for_rate(per_hour / 3600)
+    step = 3600.0 / per_hour
+    nonces = [os.urandom(16).hex() for _ in range(10000)]
+    now = 1.7e9
+    captured = []
+    fresh_rejected = replays_accepted = 0
+    start = time.perf_counter()
+    for i in range(n):
+        now += step
+        key = f"V{i % 5000}|{nonces[i % 10000]}{i}"
+        if not cache.check(key, now, now):
+            fresh_rejected += 1
+        if i % 1000 == 0:
+            captured.append((key, now))
+        if i % 1000 == 500:
+            key, sent = captured[-1]
+            if cache.check(key, sent, now):
+                replays_accepted += 1
+    elapsed = time.perf_counter() - start
+    print(f"{n} requests at {per_hour:,}/hour ({hours} h simulated) in {elapsed:.1f} s: "
+          f"{n / elapsed:,.0f} checks/sec")
+    print(f"memory {cache.nbytes() / 1024:.0f} KiB (fixed), fresh requests rejected {fresh_rejected}, "
+          f"replays accepted {replays_accepted} of {len(captured)}")
@@ -0,0 +1,33 @@
+import os
+import sys
+import tempfile
+import time
+
+from blockchain import Blockchain
+
+# ----------------- Revocation Throughput Benchmark ---------------- #
+def run(batch_size, total, fsync_policy):
+    """
+    Revoke `total` vehicles in batches of `batch_size` and return revocations/sec.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        blockchain = Blockchain(os.path.join(tmp, "chain.jsonl"), fsync_policy)
+        vehicle_ids = [f"V{i+1}" for i in range(total)]
+        start = time.perf_counter()
+        for i in range(0, total, batch_size):
+            batch = vehicle_ids[i:i + batch_size]
+            if batch_size == 1:
+                blockchain.add_block(batch[0], "revoked")
+            else:
+                blockchain.add_blocks((v, "revoked") for v in batch)
+        elapsed = time.perf_counter() - start
+        blockchain.journal.close()
+    return total / elapsed
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    fsync_policy = sys.argv[2] if len(sys.argv) > 2 else "always"
+    print(f"{total} revocations, fsync={fsync_policy}")
+    for batch_size in (1, 100, 10000):
+        rate = run(batch_size, total, fsync_policy)
+        print(f"batch size {batch_size:>6}: {rate:>12,.0f} revocations/sec")
@@ -0,0 +1,35 @@
+import sys
+import time
+import tracemalloc
+
+from revocation_filter import RevocationFilter
+
+# ----------------- Revocation Filter Benchmark ---------------- #
+def measure(n, fp_rate):
+    revoked = [f"PSN-{i:08d}" for i in range(n)]
+    revocation_filter = RevocationFilter.from_ids(revoked, fp_rate)
+
+    probes = [f"PSN-{n + i:08d}" for i in range(100000)]  # never revoked
+    start = time.perf_counter()
+    false_positives = sum(1 for p in probes if p in revocation_filter)
+    lookup_us = (time.perf_counter() - start) / len(probes) * 1e6
+    return revocation_filter.nbytes(), false_positives / len(probes), lookup_us
+
+def set_bytes(n):
+    # Memory of the exact in-memory set the CA holds today
+    tracemalloc.start()
+    revoked = {f"PSN-{i:08d}" for i in range(n)}
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del revoked
+    return size
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print(f"{n} revoked pseudonyms")
+    print(f"exact set:          {set_bytes(n) / n:6.1f} bytes/entry")
+    for fp_rate in (0.01, 0.001, 0.0001):
+        nbytes, observed, lookup_us = measure(n, fp_rate)
+        print(f"filter fp={fp_rate:<7} {nbytes / n:6.2f} bytes/entry "
+              f"({nbytes / 2**20:.2f} MiB per {n}), observed fp={observed:.4%}, "
+              f"{lookup_us:.2f} us/lookup")
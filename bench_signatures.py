@@ -0,0 +1,29 @@
+import sys
+import time
+
+from signatures import SCHEMES
+
+# ----------------- Signature Scheme Benchmark ---------------- #
+def rate(fn, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return n / (time.perf_counter() - start)
+
+def bench(scheme, n):
+    message = b"auth_request"
+    private_key = scheme.generate_private_key()
+    public_key = private_key.public_key()
+    signature = scheme.sign(private_key, message)
+    keygen_n = max(1, n // 20) if scheme.name == "rsa2048" else n  # RSA keygen is slow
+    return (rate(scheme.generate_private_key, keygen_n),
+            rate(lambda: scheme.sign(private_key, message), n),
+            rate(lambda: scheme.verify(public_key, signature, message), n),
+            len(signature), len(scheme.public_bytes(public_key)))
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    print(f"{'scheme':<11} {'keygen/s':>10} {'sign/s':>10} {'verify/s':>10} {'sig bytes':>10} {'PEM bytes':>10}")
+    for name, scheme in SCHEMES.items():
+        keygen, sign, verify, sig_len, key_len = bench(scheme, n)
+        print(f"{name:<11} {keygen:>10,.0f} {sign:>10,.0f} {verify:>10,.0f} {sig_len:>10} {key_len:>10}")
@@ -0,0 +1,41 @@
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+from spatial_index import RSUGrid
+
+# ----------------- RSU Proximity Benchmark ---------------- #
+# One tick's proximity checks: every vehicle against every RSU, versus one
+# grid cell lookup per vehicle. RSUs are spread over a square city so that
+# each covers about the same share of it as the two RSUs of the GUI map.
+
+def brute_force(vehicles, rsus, radius):
+    return [[rsu for rsu in rsus if abs(v.x - rsu.x) < radius and abs(v.y - rsu.y) < radius]
+            for v in vehicles]
+
+def grid_lookup(vehicles, grid):
+    return [grid.covering(v.x, v.y) for v in vehicles]
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+if __name__ == "__main__":
+    n_vehicles = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    n_rsus = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    radius = 50
+    side = int((n_rsus * 800 * 600 / 2) ** 0.5)
+    rng = random.Random(1)
+    rsus = [SimpleNamespace(x=rng.uniform(0, side), y=rng.uniform(0, side)) for _ in range(n_rsus)]
+    vehicles = [SimpleNamespace(x=rng.uniform(0, side), y=rng.uniform(0, side)) for _ in range(n_vehicles)]
+
+    grid, build = timed(RSUGrid, rsus, radius)
+    expected, brute = timed(brute_force, vehicles, rsus, radius)
+    found, lookup = timed(grid_lookup, vehicles, grid)
+    assert found == expected
+    in_range = sum(1 for f in found if f)
+    print(f"{n_vehicles} vehicles x {n_rsus} RSUs on a {side}x{side} map, {in_range} vehicles in range")
+    print(f"all pairs:  {brute * 1000:9.1f} ms/tick")
+    print(f"grid:       {lookup * 1000:9.1f} ms/tick ({brute / lookup:,.0f}x), built in {build * 1000:.1f} ms")
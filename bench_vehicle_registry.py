@@ -0,0 +1,41 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+from signatures import get_scheme
+from veh1 import VANET, create_db
+
+# ----------------- Registry Startup Benchmark ---------------- #
+def populate(db_path, count, scheme):
+    # Every row shares one key; only the startup path is being measured
+    pem = scheme.public_bytes(scheme.generate_private_key().public_key()).decode()
+    create_db(db_path)
+    conn = sqlite3.connect(db_path)
+    conn.executemany("INSERT INTO vehicles (vehicle_id, public_key, revoked) VALUES (?, ?, ?)",
+                     ((f"V{i:06d}", pem, i % 100 == 0) for i in range(count)))
+    conn.commit()
+    conn.close()
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    scheme = get_scheme()
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "vanet.db")
+        populate(db_path, count, scheme)
+
+        start = time.perf_counter()
+        vanet = VANET(db_path, scheme)
+        opened = time.perf_counter() - start
+        print(f"opened {len(vanet.vehicles)} vehicles in {opened * 1000:.1f} ms")
+
+        start = time.perf_counter()
+        for i in range(0, count, max(1, count // 1000)):
+            vanet.vehicles[f"V{i:06d}"].public_key
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        for i in range(0, count, max(1, count // 1000)):
+            vanet.vehicles[f"V{i:06d}"].public_key
+        cached = time.perf_counter() - start
+        print(f"1000 public keys: {first * 1000:.1f} ms first use, {cached * 1000:.1f} ms cached")
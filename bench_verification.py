@@ -0,0 +1,42 @@
+import os
+import sys
+import time
+
+from signatures import get_scheme
+from verification_engine import VerificationEngine, verify_batch
+
+# ----------------- RSU Verification Throughput Benchmark ---------------- #
+def make_requests(scheme, vehicles, n):
+    keys = [scheme.generate_private_key() for _ in range(vehicles)]
+    requests = []
+    for i in range(n):
+        private_key = keys[i % vehicles]
+        message = f"auth_request-{i}".encode()
+        requests.append((scheme.public_bytes(private_key.public_key()), message,
+                         scheme.sign(private_key, message)))
+    return requests
+
+def run(scheme_name, requests, workers, batch_size):
+    engine = VerificationEngine(scheme_name, workers=workers, batch_size=batch_size)
+    engine.submit(*requests[0]).result()  # start the worker processes
+    start = time.perf_counter()
+    futures = [engine.submit(*r) for r in requests]
+    valid = sum(f.result() for f in futures)
+    elapsed = time.perf_counter() - start
+    engine.close()
+    assert valid == len(requests)
+    return len(requests) / elapsed
+
+if __name__ == "__main__":
+    scheme_name = sys.argv[1] if len(sys.argv) > 1 else "rsa2048"
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    scheme = get_scheme(scheme_name)
+    requests = make_requests(scheme, vehicles=50, n=n)
+
+    start = time.perf_counter()
+    verify_batch(scheme.name, requests)
+    print(f"{scheme.name}, {n} auth requests from 50 vehicles")
+    print(f"inline (no engine):  {n / (time.perf_counter() - start):>9,.0f} verifications/sec")
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        rate = run(scheme.name, requests, workers, batch_size=64)
+        print(f"engine, {workers:>2} workers:  {rate:>9,.0f} verifications/sec")
@@ -0,0 +1,341 @@
+import datetime
+import json
+import mmap
+import os
+import struct
+import sys
+
+from journal import ChainJournal
+
+# ----------------- Compact Binary Block Format ---------------- #
+# <path>          16-byte header, then one fixed-size record per block:
+#                   hash (32 raw bytes), previous_hash (32 raw bytes),
+#                   timestamp (int64 microseconds since 1970-01-01),
+#                   vehicle_id, payload, entries (uint32 string-table ids)
+# <path>.strings        interned strings' UTF-8 bytes, back to back
+# <path>.strings.index  one uint64 end offset into .strings per string, id = position
+#
+# Block i lives at HEADER_SIZE + i * RECORD_SIZE and string i between two
+# fixed-width offsets, so both can be read straight out of an mmap without
+# parsing anything before them.
+
+MAGIC = b"VBLK"
+VERSION = 2  # 1 kept the strings as JSON lines
+HEADER = struct.Struct("<4sBB10x")
+RECORD = struct.Struct("<32s32sqIII")
+STRING_END = struct.Struct("<Q")
+HEADER_SIZE = HEADER.size
+RECORD_SIZE = RECORD.size
+NO_ENTRIES = 0xFFFFFFFF
+PAYLOAD_FIELDS = ("action", "certificate")  # revocation chain, certificate chain
+EPOCH = datetime.datetime(1970, 1, 1)
+ONE_US = datetime.timedelta(microseconds=1)
+
+def pack_hash(hex_hash):
+    # The genesis block's previous_hash is the literal "0"
+    return bytes(32) if hex_hash == "0" else bytes.fromhex(hex_hash)
+
+def unpack_hash(raw):
+    return "0" if raw == bytes(32) else raw.hex()
+
+def pack_timestamp(timestamp):
+    micros = (datetime.datetime.fromisoformat(timestamp) - EPOCH) // ONE_US
+    if unpack_timestamp(micros) != timestamp:
+        raise ValueError(f"Timestamp {timestamp!r} does not round-trip through the binary format")
+    return micros
+
+def unpack_timestamp(micros):
+    return (EPOCH + micros * ONE_US).isoformat()
+
+class PackedBlock:
+    """
+    Base for both chains' Block classes. The timestamp is stored as int
+    microseconds and the hashes as raw 32-byte digests, and exposed as the
+    same ISO / hex strings the block hash is computed over. Subclasses list
+    _timestamp, _previous_hash and _hash in their __slots__.
+    """
+    __slots__ = ()
+
+    @property
+    def timestamp(self):
+        return unpack_timestamp(self._timestamp)
+
+    @timestamp.setter
+    def timestamp(self, value):
+        self._timestamp = pack_timestamp(value)
+
+    @property
+    def previous_hash(self):
+        return unpack_hash(self._previous_hash)
+
+    @previous_hash.setter
+    def previous_hash(self, value):
+        self._previous_hash = pack_hash(value)
+
+    @property
+    def hash(self):
+        return self._hash.hex()
+
+    @hash.setter
+    def hash(self, value):
+        self._hash = bytes.fromhex(value)
+
+def map_file(f):
+    # mmap refuses empty files
+    size = os.fstat(f.fileno()).st_size
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+class StringTable:
+    """
+    Writer side of the string table. Opening it only trims a torn tail;
+    the value -> id map new strings are checked against is built on the
+    first intern(), so readers never pay for it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.blob = open(path, "a+b")
+        self.index = open(path + ".index", "a+b")
+        self.recover()
+        self.ids = None
+
+    def recover(self):
+        # Strings are written before their index entries, so drop index
+        # entries past the end of the blob, then blob bytes no entry covers
+        count = os.fstat(self.index.fileno()).st_size // STRING_END.size
+        blob_size = os.fstat(self.blob.fileno()).st_size
+        end = 0
+        while count:
+            self.index.seek((count - 1) * STRING_END.size)
+            end, = STRING_END.unpack(self.index.read(STRING_END.size))
+            if end <= blob_size:
+                break
+            count -= 1
+            end = 0
+        self.index.truncate(count * STRING_END.size)
+        self.blob.truncate(end)
+        self.count = count
+        self.end = end
+
+    def load_ids(self):
+        if self.ids is None:
+            reader = StringReader(self.path)
+            self.ids = {}
+            for i in range(self.count):
+                self.ids.setdefault(reader[i], i)
+            reader.close()
+        return self.ids
+
+    def intern(self, value, pending):
+        """
+        Id for `value`; new strings are queued in `pending` for write().
+        """
+        ids = self.load_ids()
+        if value not in ids:
+            ids[value] = self.count
+            self.count += 1
+            data = value.encode()
+            self.end += len(data)
+            pending.append((data, STRING_END.pack(self.end)))
+        return ids[value]
+
+    def write(self, pending, durable):
+        if not pending:
+            return
+        for f, part in ((self.blob, 0), (self.index, 1)):
+            f.write(b"".join(item[part] for item in pending))
+            f.flush()
+            if durable:
+                os.fsync(f.fileno())
+
+    def reset(self):
+        self.blob.truncate(0)
+        self.index.truncate(0)
+        self.count = self.end = 0
+        self.ids = {}
+
+    def close(self):
+        self.blob.close()
+        self.index.close()
+
+class StringReader:
+    """
+    Strings of a table decoded on demand from its memory maps.
+    """
+
+    def __init__(self, path):
+        self.blob_file = open(path, "rb")
+        self.index_file = open(path + ".index", "rb")
+        self.blob = map_file(self.blob_file)
+        self.index = map_file(self.index_file)
+        self.count = len(self.index) // STRING_END.size
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        start = STRING_END.unpack_from(self.index, (i - 1) * STRING_END.size)[0] if i else 0
+        end, = STRING_END.unpack_from(self.index, i * STRING_END.size)
+        return bytes(self.blob[start:end]).decode()
+
+    def close(self):
+        for view in (self.blob, self.index):
+            if isinstance(view, mmap.mmap):
+                view.close()
+        self.blob_file.close()
+        self.index_file.close()
+
+class BinaryChainJournal(ChainJournal):
+    """
+    Drop-in replacement for ChainJournal that stores fixed-size binary
+    records instead of JSON lines (selected by a .vbc path, see open_journal).
+    """
+
+    def __init__(self, path, fsync_policy="always", fsync_interval=1.0):
+        super().__init__(path, fsync_policy, fsync_interval)
+        self.table = StringTable(path + ".strings")
+        self.payload_field = None
+
+    def append(self, record):
+        self.append_many([record])
+
+    def append_many(self, records):
+        pending = []
+        packed = []
+        for record in records:
+            packed.append(self.pack(record, pending))
+        if self.file.tell() == 0 and packed:
+            self.file.write(HEADER.pack(MAGIC, VERSION, PAYLOAD_FIELDS.index(self.payload_field)))
+        # Strings go down first so a record never points at a missing string
+        self.table.write(pending, self.fsync_policy == "always")
+        self.file.write(b"".join(packed))
+        self.sync()
+
+    def pack(self, record, pending):
+        if self.payload_field is None:
+            self.payload_field = "action" if "action" in record else "certificate"
+        entries = record.get("entries")
+        return RECORD.pack(
+            pack_hash(record["hash"]),
+            pack_hash(record["previous_hash"]),
+            pack_timestamp(record["timestamp"]),
+            self.table.intern(record["vehicle_id"], pending),
+            self.table.intern(record[self.payload_field], pending),
+            self.table.intern(json.dumps(entries), pending) if entries else NO_ENTRIES)
+
+    def reset(self):
+        super().reset()
+        self.table.reset()
+        self.payload_field = None
+
+    def load(self, offset=0, end=None):
+        # Offsets are byte positions from tell(), as for the JSON-lines journal
+        self.file.flush()
+        size = os.path.getsize(self.path)
+        if size < HEADER_SIZE:
+            if size:
+                self.file.truncate(0)  # torn header
+                self.sync()
+            return []
+        good_size = size - (size - HEADER_SIZE) % RECORD_SIZE
+        if good_size < size:
+            self.file.truncate(good_size)  # torn last record
+            self.sync()
+        reader = BinaryChainReader(self.path)
+        self.payload_field = reader.payload_field
+        first = (offset - HEADER_SIZE) // RECORD_SIZE if offset else 0
+        last = len(reader) if end is None else (end - HEADER_SIZE) // RECORD_SIZE
+        records = [reader.record(i) for i in range(first, min(last, len(reader)))]
+        reader.close()
+        return records
+
+    def load_tail(self, count, end=None):
+        # Fixed-size records: the tail starts a known distance before `end`
+        end = self.tell() if end is None else end
+        return self.load(max(HEADER_SIZE, end - count * RECORD_SIZE), end) if count else []
+
+    def close(self):
+        super().close()
+        self.table.close()
+
+# ----------------- Memory-mapped Reader ---------------- #
+class BinaryChainReader:
+    """
+    Random access to block records without loading the whole chain:
+    reader[i] decodes only record i from the memory map.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, kind = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a binary chain file")
+        self.payload_field = PAYLOAD_FIELDS[kind]
+        self.strings = StringReader(path + ".strings")
+        self.count = (len(self.map) - HEADER_SIZE) // RECORD_SIZE
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("block index out of range")
+        return self.record(index)
+
+    def record(self, index):
+        block_hash, previous_hash, micros, vehicle_idx, payload_idx, entries_idx = \
+            RECORD.unpack_from(self.map, HEADER_SIZE + index * RECORD_SIZE)
+        record = {
+            "vehicle_id": self.strings[vehicle_idx],
+            self.payload_field: self.strings[payload_idx],
+            "timestamp": unpack_timestamp(micros),
+            "previous_hash": unpack_hash(previous_hash),
+            "hash": block_hash.hex()
+        }
+        if entries_idx != NO_ENTRIES:
+            record["entries"] = json.loads(self.strings[entries_idx])
+        return record
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+        self.strings.close()
+
+# ----------------- Converter ---------------- #
+def read_records(path):
+    """
+    Records from a JSON export (blockchain.json / revocation_blockchain.json)
+    or a JSON-lines journal. Older exports without previous_hash get it
+    filled in from the preceding block.
+    """
+    with open(path) as f:
+        if path.endswith(".jsonl"):
+            records = [json.loads(line) for line in f if line.endswith("\n")]
+        else:
+            records = json.load(f)
+    prev_hash = "0"
+    for record in records:
+        record.setdefault("previous_hash", prev_hash)
+        prev_hash = record["hash"]
+    return records
+
+def convert(src_path, dst_path):
+    journal = BinaryChainJournal(dst_path, fsync_policy="never")
+    journal.reset()
+    records = read_records(src_path)
+    journal.append_many(records)
+    journal.close()
+    return len(records)
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("usage: python binary_chain.py <chain.json|chain.jsonl> <chain.vbc>")
+        sys.exit(1)
+    src, dst = sys.argv[1:]
+    count = convert(src, dst)
+    dst_size = sum(os.path.getsize(dst + suffix) for suffix in ("", ".strings", ".strings.index"))
+    print(f"Converted {count} blocks: {os.path.getsize(src)} bytes -> {dst_size} bytes "
+          f"({RECORD_SIZE} bytes/block + string table)")
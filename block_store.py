@@ -0,0 +1,104 @@
+from array import array
+
+# ----------------- Columnar Chain Storage ---------------- #
+class ChainColumns:
+    """
+    List-like storage for Blockchain.chain that keeps each field in its own
+    packed column instead of one Python object per block:
+
+      hashes / previous   32 raw bytes per block in one bytearray each
+      timestamps          int64 microseconds (array "q")
+      vehicle_ids, payloads   uint32 ids into a shared string table
+
+    chain[i], chain[-1], chain[1:], len(chain), iteration, append and extend
+    behave like the old list of Blocks. Indexing builds a fresh Block from the
+    columns, so changing a returned block does not change the stored chain.
+
+    When restored from a snapshot the columns start at height `base`; blocks
+    below it are read through `history` the first time one is needed.
+    tail() only needs the newest blocks, and gets the ones below `base`
+    from `history_tail(count)` without loading the rest.
+    """
+
+    def __init__(self, block_cls, payload_field, blocks=(), base=0, history=None, history_tail=None):
+        self.block_cls = block_cls
+        self.payload_field = payload_field
+        self.base = base
+        self.history = history
+        self.history_tail = history_tail
+        self.hashes = bytearray()
+        self.previous = bytearray()
+        self.timestamps = array("q")
+        self.vehicle_ids = array("I")
+        self.payloads = array("I")
+        self.strings = []
+        self.string_ids = {}
+        self.entries = {}  # block height -> Merkle batch entries
+        self.extend(blocks)
+
+    def intern(self, value):
+        string_id = self.string_ids.get(value)
+        if string_id is None:
+            string_id = self.string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string_id
+
+    def append(self, block):
+        if getattr(block, "entries", None):
+            self.entries[len(self)] = block.entries
+        self.hashes += block._hash
+        self.previous += block._previous_hash
+        self.timestamps.append(block._timestamp)
+        self.vehicle_ids.append(self.intern(block.vehicle_id))
+        self.payloads.append(self.intern(getattr(block, self.payload_field)))
+
+    def extend(self, blocks):
+        for block in blocks:
+            self.append(block)
+
+    def __len__(self):
+        return self.base + len(self.timestamps)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("block index out of range")
+        if index < self.base:
+            self.load_history()
+        return self.block(index)
+
+    def __iter__(self):
+        if self.base:
+            self.load_history()
+        for i in range(len(self)):
+            yield self.block(i)
+
+    def tail(self, count):
+        """
+        The newest `count` blocks, oldest first.
+        """
+        start = max(0, len(self) - count)
+        if start >= self.base or self.history_tail is None:
+            return self[start:]
+        older = list(self.history_tail(self.base - start))
+        return older + [self.block(i) for i in range(self.base, len(self))]
+
+    def load_history(self):
+        history = ChainColumns(self.block_cls, self.payload_field, self.history())
+        history.extend(self.block(i) for i in range(self.base, len(self)))
+        self.__dict__.update(history.__dict__)
+
+    def block(self, height):
+        i = height - self.base
+        block = self.block_cls.__new__(self.block_cls)
+        block.vehicle_id = self.strings[self.vehicle_ids[i]]
+        setattr(block, self.payload_field, self.strings[self.payloads[i]])
+        block._timestamp = self.timestamps[i]
+        block._previous_hash = bytes(self.previous[32 * i:32 * i + 32])
+        block._hash = bytes(self.hashes[32 * i:32 * i + 32])
+        if "entries" in self.block_cls.__slots__:
+            block.entries = self.entries.get(height)
+        return block
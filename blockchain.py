@@ -1,43 +1,186 @@
 import tkinter as tk
 from tkinter import messagebox
 import datetime
+import functools
 import hashlib
+import itertools
 import json
 import random
+import sys
+from binary_chain import PackedBlock
+from journal import JournaledChain
+from log_view import LogView
+from merkle import build_levels, entry_leaf, merkle_root, proof_from_levels, verify_proof
 
 # ----------------- Blockchain Components ---------------- #
-class Block:
-    def __init__(self, vehicle_id, action, previous_hash):
-        self.vehicle_id = vehicle_id
-        self.action = action  # e.g., "revoked"
-        self.timestamp = datetime.datetime.now().isoformat()
+JOURNAL_PATH = "revocation_blockchain.jsonl"
+MERKLE_CACHE_SIZE = 64  # batch blocks whose Merkle tree levels are kept for proofs
+
+class Block(PackedBlock):
+    # Slots and packed fields keep multi-million-block chains in memory:
+    # timestamp as int microseconds, hashes as raw 32-byte digests
+    __slots__ = ("vehicle_id", "action", "_timestamp", "_previous_hash", "entries", "_hash")
+
+    def __init__(self, vehicle_id, action, previous_hash, timestamp=None, entries=None):
+        self.vehicle_id = sys.intern(vehicle_id)
+        self.action = sys.intern(action)  # e.g., "revoked"
+        self.timestamp = timestamp or datetime.datetime.now().isoformat()
         self.previous_hash = previous_hash
+        self.entries = entries  # [vehicle_id, action] pairs for a Merkle batch block
         self.hash = self.compute_hash()
 
     def compute_hash(self):
-        block_data = f"{self.vehicle_id}{self.action}{self.timestamp}{self.previous_hash}"
+        # The Merkle root is derived from the entries, so tampering with any entry breaks the hash
+        block_data = f"{self.vehicle_id}{self.action}{self.timestamp}{self.previous_hash}{self.merkle_root()}"
         return hashlib.sha256(block_data.encode()).hexdigest()
 
-class Blockchain:
-    def __init__(self):
-        self.chain = [Block("Genesis", "Init", "0")]
+    def merkle_root(self):
+        if not self.entries:
+            return ""
+        return merkle_root([entry_leaf(v, a) for v, a in self.entries])
+
+    def revocations(self):
+        """
+        (vehicle_id, action) pairs recorded by this block.
+        """
+        if self.entries:
+            return [tuple(e) for e in self.entries]
+        return [(self.vehicle_id, self.action)]
+
+    def to_record(self):
+        record = {
+            "vehicle_id": self.vehicle_id,
+            "action": self.action,
+            "timestamp": self.timestamp,
+            "previous_hash": self.previous_hash,
+            "hash": self.hash
+        }
+        if self.entries:
+            record["entries"] = self.entries
+        return record
+
+    @classmethod
+    def from_record(cls, record):
+        # Keep the stored hash; verification is a separate step
+        block = cls.__new__(cls)
+        block.vehicle_id = sys.intern(record["vehicle_id"])
+        block.action = sys.intern(record["action"])
+        block.timestamp = record["timestamp"]
+        block.previous_hash = record["previous_hash"]
+        block.entries = record.get("entries")
+        block.hash = record["hash"]
+        return block
+
+class Blockchain(JournaledChain):
+    block_cls = Block
+    payload_field = "action"
+    genesis_payload = "Init"
+
+    def __init__(self, journal_path=JOURNAL_PATH, **options):
+        # options: fsync_policy, checkpoint_interval, snapshot_interval (see JournaledChain)
+        self.revoked = {}  # vehicle_id -> height of the block that revoked it
+        self.batch_index = {}  # vehicle_id -> (block index, leaf index) of batched entries
+        # Proofs for one batch tend to be asked for together, so keep its tree
+        self.merkle_levels = functools.lru_cache(maxsize=MERKLE_CACHE_SIZE)(self.build_merkle_levels)
+        super().__init__(journal_path, **options)
 
-    def add_block(self, vehicle_id, action):
-        prev_hash = self.chain[-1].hash
-        new_block = Block(vehicle_id, action, prev_hash)
-        self.chain.append(new_block)
-        self.save_chain()
+    def restore_state(self, state):
+        self.revoked = state["revoked"]
+        self.batch_index = {v: tuple(loc) for v, loc in state["batch_index"].items()}
+
+    def snapshot_state(self):
+        return {"revoked": self.revoked, "batch_index": self.batch_index}
+
+    def apply(self, height, block):
+        for leaf_index, (vehicle_id, action) in enumerate(block.revocations()):
+            if action != "revoked":
+                continue
+            self.revoked.setdefault(vehicle_id, height)
+            if block.entries:
+                self.batch_index[vehicle_id] = (height, leaf_index)
+
+    def add_revocation_batch(self, vehicle_ids, action="revoked"):
+        """
+        Record many revocations as one block whose hash covers the Merkle
+        root of its entries, so each entry can later be proven on its own.
+        """
+        entries = [[v, action] for v in vehicle_ids]
+        if not entries:
+            # A block without entries would read back as one entry for "Batch"
+            raise ValueError("A revocation batch needs at least one vehicle")
+        return self.append_block(Block("Batch", action, self.chain[-1].hash, entries=entries))
+
+    def build_merkle_levels(self, block_index):
+        block = self.chain[block_index]
+        return build_levels([entry_leaf(v, a) for v, a in block.entries])
+
+    def revocation_proof(self, vehicle_id):
+        """
+        Proof that `vehicle_id` was revoked: the block header plus, for a
+        batch block, log2(batch size) sibling hashes. A vehicle revoked by a
+        single add_block is its block's own header, so its proof has no
+        siblings and an empty Merkle root. None if it was never revoked.
+        """
+        if vehicle_id in self.batch_index:
+            block_index, leaf_index = self.batch_index[vehicle_id]
+            block = self.chain[block_index]
+            levels = self.merkle_levels(block_index)
+            entry = block.entries[leaf_index]
+            proof = proof_from_levels(levels, leaf_index)
+            root = levels[-1][0].hex()
+        elif vehicle_id in self.revoked:
+            block_index = self.revoked[vehicle_id]
+            block = self.chain[block_index]
+            entry = [block.vehicle_id, block.action]
+            proof = []
+            root = ""
+        else:
+            return None
+        return {
+            "height": block_index,
+            "entry": entry,
+            "proof": proof,
+            "header": {
+                "vehicle_id": block.vehicle_id,
+                "action": block.action,
+                "timestamp": block.timestamp,
+                "previous_hash": block.previous_hash,
+                "merkle_root": root
+            },
+            "hash": block.hash
+        }
 
     def save_chain(self):
+        # Full pretty-printed export; the journal is the append path
         data = [{
             "vehicle_id": b.vehicle_id,
             "action": b.action,
             "timestamp": b.timestamp,
-            "hash": b.hash
+            "previous_hash": b.previous_hash,
+            "hash": b.hash,
+            **({"entries": b.entries} if b.entries else {})
         } for b in self.chain]
         with open("revocation_blockchain.json", "w") as f:
             json.dump(data, f, indent=4)
 
+def verify_revocation_proof(proof, vehicle_id, trusted_hash):
+    """
+    RSU-side check that `vehicle_id` is revoked in the block with a hash it
+    already trusts, without downloading the chain.
+    """
+    header = proof["header"]
+    if list(proof["entry"]) != [vehicle_id, "revoked"]:
+        return False  # a valid proof, but about some other entry
+    if header["merkle_root"] == "":
+        # Single-revocation block: the entry is the header itself
+        if [header["vehicle_id"], header["action"]] != [vehicle_id, "revoked"]:
+            return False
+    elif not verify_proof(entry_leaf(vehicle_id, "revoked"), proof["proof"], header["merkle_root"]):
+        return False
+    block_data = (f"{header['vehicle_id']}{header['action']}{header['timestamp']}"
+                  f"{header['previous_hash']}{header['merkle_root']}")
+    return hashlib.sha256(block_data.encode()).hexdigest() == trusted_hash
+
 # ----------------- Main Application ---------------- #
 class RevocationApp:
     def __init__(self, root):
@@ -46,16 +189,17 @@ class RevocationApp:
 
         self.blockchain = Blockchain()
         self.vehicles = [f"V{i+1}" for i in range(5)]
-        self.revoked_vehicles = set()
+        # Restored from the persisted chain so revocations survive restarts
+        self.revoked_vehicles = set(self.blockchain.revoked)
 
         tk.Label(root, text="Registered Vehicles", font=("Arial", 14, "bold")).pack(pady=10)
 
-        self.vehicle_listbox = tk.Listbox(root, width=30, font=("Arial", 12))
+        self.vehicle_listbox = tk.Listbox(root, width=30, font=("Arial", 12), selectmode=tk.EXTENDED)
         self.vehicle_listbox.pack(pady=5)
         for v in self.vehicles:
             self.vehicle_listbox.insert(tk.END, v)
 
-        self.revoke_btn = tk.Button(root, text="Revoke Selected Vehicle", font=("Arial", 12),
+        self.revoke_btn = tk.Button(root, text="Revoke Selected Vehicles", font=("Arial", 12),
                                     bg="red", fg="white", command=self.revoke_selected)
         self.revoke_btn.pack(pady=10)
 
@@ -67,7 +211,7 @@ class RevocationApp:
                                              command=self.show_blockchain)
         self.show_blockchain_btn.pack(pady=5)
 
-        self.output_box = tk.Text(root, height=12, width=60)
+        self.output_box = LogView(root, height=12, width=60)
         self.output_box.pack(pady=10)
 
     def revoke_selected(self):
@@ -75,28 +219,37 @@ class RevocationApp:
         if not selected:
             messagebox.showwarning("Select Vehicle", "Please select a vehicle to revoke.")
             return
-        vehicle_id = self.vehicle_listbox.get(selected[0])
-        if vehicle_id in self.revoked_vehicles:
-            messagebox.showinfo("Already Revoked", f"{vehicle_id} is already revoked.")
+        vehicle_ids = [self.vehicle_listbox.get(i) for i in selected]
+        new_ids = [v for v in vehicle_ids if v not in self.revoked_vehicles]
+        if not new_ids:
+            messagebox.showinfo("Already Revoked", f"{', '.join(vehicle_ids)} already revoked.")
             return
-        self.revoked_vehicles.add(vehicle_id)
-        self.blockchain.add_block(vehicle_id, "revoked")
-        messagebox.showinfo("Revoked", f"{vehicle_id} has been revoked and recorded to blockchain.")
-        self.output_box.insert(tk.END, f"{vehicle_id} revoked at {datetime.datetime.now().strftime('%H:%M:%S')}\n")
-        self.output_box.see(tk.END)
+        # One Merkle batch block for the whole selection (e.g. a misbehaving platoon)
+        self.revoked_vehicles.update(new_ids)
+        if len(new_ids) == 1:
+            self.blockchain.add_block(new_ids[0], "revoked")
+        else:
+            self.blockchain.add_revocation_batch(new_ids)
+        messagebox.showinfo("Revoked", f"{', '.join(new_ids)} revoked and recorded to blockchain.")
+        ts = datetime.datetime.now().strftime('%H:%M:%S')
+        for vehicle_id in new_ids:
+            self.output_box.write(f"{vehicle_id} revoked at {ts}")
 
     def show_revoked(self):
-        self.output_box.delete("1.0", tk.END)
-        self.output_box.insert(tk.END, "Revoked Vehicles:\n")
-        for v in sorted(self.revoked_vehicles):
-            self.output_box.insert(tk.END, f"• {v}\n")
+        self.output_box.show(itertools.chain(
+            ["Revoked Vehicles:"], (f"• {v}" for v in sorted(self.revoked_vehicles))))
 
     def show_blockchain(self):
-        self.output_box.delete("1.0", tk.END)
-        self.output_box.insert(tk.END, "Blockchain Revocation Log:\n\n")
-        for block in self.blockchain.chain[1:]:  # Skip genesis block
-            self.output_box.insert(tk.END,
-                f"[{block.timestamp}] {block.vehicle_id} => {block.action}\n")
+        # Only the newest entries fit in the view. Every block after genesis
+        # adds at least one line, so that many blocks from the tip is enough,
+        # and a chain resumed from a snapshot reads them from the journal tail
+        chain = self.blockchain.chain
+        room = self.output_box.lines - 2
+        lines = []
+        for block in reversed(chain.tail(min(room, len(chain) - 1))):
+            for vehicle_id, action in reversed(block.revocations()):
+                lines.append(f"[{block.timestamp}] {vehicle_id} => {action}")
+        self.output_box.show(["Blockchain Revocation Log:", ""] + lines[:room][::-1])
 
 # ----------------- Launch GUI ---------------- #
 if __name__ == "__main__":
@@ -0,0 +1,138 @@
+import datetime
+import hashlib
+import json
+import secrets
+import sys
+import time
+from binary_chain import PackedBlock
+from journal import CHECKPOINT_INTERVAL, SNAPSHOT_INTERVAL, JournaledChain  # intervals re-exported for simulation.py
+from key_registry import KeyRegistry, registry_path
+from rsu_sync import RevocationLog, SyncServer
+from signatures import get_scheme
+# Blockchain components
+JOURNAL_PATH = "blockchain.jsonl"
+
+class Block(PackedBlock):
+    # Slots and packed fields: timestamp as int microseconds, hashes as raw 32-byte digests
+    __slots__ = ("vehicle_id", "certificate", "_timestamp", "_previous_hash", "_hash")
+
+    def __init__(self, vehicle_id, certificate, previous_hash, timestamp=None):
+        self.vehicle_id = sys.intern(vehicle_id)
+        self.certificate = sys.intern(certificate)
+        self.timestamp = timestamp or datetime.datetime.now().isoformat()
+        self.previous_hash = previous_hash
+        self.hash = self.compute_hash()
+
+    def compute_hash(self):
+        block_string = f"{self.vehicle_id}{self.certificate}{self.timestamp}{self.previous_hash}"
+        return hashlib.sha256(block_string.encode()).hexdigest()
+
+    def to_record(self):
+        return {"vehicle_id": self.vehicle_id, "certificate": self.certificate, "timestamp": self.timestamp,
+                "previous_hash": self.previous_hash, "hash": self.hash}
+
+    @classmethod
+    def from_record(cls, record):
+        # Keep the stored hash; verification is a separate step
+        block = cls.__new__(cls)
+        block.vehicle_id = sys.intern(record["vehicle_id"])
+        block.certificate = sys.intern(record["certificate"])
+        block.timestamp = record["timestamp"]
+        block.previous_hash = record["previous_hash"]
+        block.hash = record["hash"]
+        return block
+
+class Blockchain(JournaledChain):
+    block_cls = Block
+    payload_field = "certificate"
+    genesis_payload = "Initial Block"
+
+    def __init__(self, journal_path=JOURNAL_PATH, **options):
+        # options: fsync_policy, checkpoint_interval, snapshot_interval (see JournaledChain)
+        self.revoked = {}  # vehicle_id -> height of the block that revoked it
+        self.certificates = {}  # vehicle_id -> every certificate issued, oldest first
+        super().__init__(journal_path, **options)
+
+    def restore_state(self, state):
+        self.revoked = state["revoked"]
+        # Older snapshots kept only the latest certificate per vehicle
+        self.certificates = {v: certs if isinstance(certs, list) else [certs]
+                             for v, certs in state["certificates"].items()}
+
+    def snapshot_state(self):
+        return {"revoked": self.revoked, "certificates": self.certificates}
+
+    def apply(self, height, block):
+        if block.certificate == "Revoked":
+            self.revoked.setdefault(block.vehicle_id, height)
+        elif height:
+            self.certificates.setdefault(block.vehicle_id, []).append(block.certificate)
+
+    def save_to_json(self):
+        # Full pretty-printed export; the journal is the append path
+        data = [b.to_record() for b in self.chain]
+        with open("blockchain.json", "w") as f:
+            json.dump(data, f, indent=4)
+
+# Certificate Authority
+class CertificateAuthority:
+    def __init__(self, blockchain, scheme=None, key_registry=None):
+        self.blockchain = blockchain
+        self.scheme = scheme or get_scheme()
+        # Revocations keyed by block height; RSUs pull deltas of this log
+        self.revocation_log = RevocationLog()
+        for vehicle_id, height in sorted(blockchain.revoked.items(), key=lambda item: item[1]):
+            self.revocation_log.add(height, vehicle_id)
+        self.revoked_certs = self.revocation_log.revoked
+        # Fingerprints of certified keys, persistent and shared between CA processes
+        self.public_key_registry = key_registry or KeyRegistry(registry_path(blockchain.journal.path))
+
+    def issue_certificate(self, vehicle_id, public_key):
+        serialized_key = self.scheme.public_bytes(public_key)
+        if not self.public_key_registry.register(serialized_key, vehicle_id):
+            return "Sybil-Detected"
+        cert = f"Cert-{vehicle_id}"
+        self.blockchain.add_block(vehicle_id, cert)
+        return cert
+
+    def issue_pseudonyms(self, vehicle_ids, count):
+        """
+        Issue `count` pseudonym certificates to each vehicle in one chain commit.
+        Returns vehicle_id -> list of certificates; revoked vehicles get an empty list.
+        """
+        pools = {v: [] for v in dict.fromkeys(vehicle_ids)}
+        entries = []
+        for vehicle_id, pool in pools.items():
+            if vehicle_id in self.revoked_certs:
+                continue
+            for _ in range(count):
+                # Random names, so a pseudonym does not give away the vehicle behind it
+                cert = f"PC-{secrets.token_hex(8)}"
+                pool.append(cert)
+                entries.append((vehicle_id, cert))
+        self.blockchain.add_blocks(entries)
+        return pools
+
+    def revoke_certificate(self, vehicle_id):
+        start_time = time.time()
+        self.blockchain.add_block(vehicle_id, "Revoked")
+        self.revocation_log.add(len(self.blockchain.chain) - 1, vehicle_id)
+        latency = round((time.time() - start_time)*1000, 2)  # in ms
+        return latency
+
+    def revoke_certificates(self, vehicle_ids):
+        start_time = time.time()
+        new_ids = [v for v in dict.fromkeys(vehicle_ids) if v not in self.revoked_certs]
+        blocks = self.blockchain.add_blocks((v, "Revoked") for v in new_ids)
+        first_height = len(self.blockchain.chain) - len(blocks)
+        for i, block in enumerate(blocks):
+            self.revocation_log.add(first_height + i, block.vehicle_id)
+        latency = round((time.time() - start_time)*1000, 2)  # in ms
+        return latency
+
+    def is_revoked(self, vehicle_id):
+        return vehicle_id in self.revoked_certs
+
+    def serve_revocations(self, port=0):
+        # Loopback endpoint RSUs pull revocation deltas from
+        return SyncServer(self.revocation_log, port=port).start()
@@ -0,0 +1,348 @@
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+
+from block_store import ChainColumns
+
+FSYNC_POLICIES = ("always", "interval", "never")
+TAIL_CHUNK = 64 * 1024  # bytes read at a time when reading the journal backwards
+CHECKPOINT_INTERVAL = 1000  # blocks between verification checkpoints
+SNAPSHOT_INTERVAL = 10000  # blocks between derived-state snapshots
+
+# ----------------- Append-only Chain Journal ---------------- #
+class ChainJournal:
+    """
+    Append-only block journal: one compact JSON record per line.
+
+    Appending a block writes only that block's record, so the cost of an
+    append does not depend on how long the chain already is.
+
+    fsync_policy controls durability:
+      "always"   - fsync after every append (survives power loss)
+      "interval" - fsync at most once every fsync_interval seconds
+      "never"    - flush to the OS only and let it decide when to write
+    """
+
+    def __init__(self, path, fsync_policy="always", fsync_interval=1.0):
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync_policy}")
+        self.path = path
+        self.fsync_policy = fsync_policy
+        self.fsync_interval = fsync_interval
+        self.last_fsync = time.monotonic()
+        self.checkpoint_path = path + ".checkpoint"
+        self.snapshot_path = path + ".snapshot"
+        self.file = open(path, "ab")
+
+    def append(self, record):
+        """
+        Append one block record to the end of the journal.
+        """
+        self.file.write(self.encode(record))
+        self.sync()
+
+    def append_many(self, records):
+        """
+        Append a batch of records with a single write and a single sync,
+        so a burst of N blocks costs one durable write instead of N.
+        """
+        self.file.write(b"".join(self.encode(r) for r in records))
+        self.sync()
+
+    def sync(self, force=False):
+        """
+        Push buffered records to the OS and fsync according to the policy.
+        """
+        self.file.flush()
+        now = time.monotonic()
+        if (force or self.fsync_policy == "always" or
+                (self.fsync_policy == "interval" and now - self.last_fsync >= self.fsync_interval)):
+            os.fsync(self.file.fileno())
+            self.last_fsync = now
+
+    def reset(self):
+        """
+        Discard every record in the journal, and the checkpoint and snapshot
+        that described it.
+        """
+        self.file.truncate(0)
+        self.file.seek(0)
+        self.sync()
+        for path in (self.checkpoint_path, self.snapshot_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def load(self, offset=0, end=None):
+        """
+        Read back complete records in append order, starting at byte `offset`
+        (a value previously returned by tell()) and stopping before `end`.
+        A torn last line (crash in the middle of a write) is cut off so
+        later appends start on a clean line.
+        """
+        self.file.flush()
+        records = []
+        good_size = offset
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if end is not None and good_size >= end:
+                    return records
+                if not line.endswith(b"\n"):
+                    break
+                records.append(json.loads(line))
+                good_size += len(line)
+        if good_size < os.path.getsize(self.path):
+            self.file.truncate(good_size)
+            self.sync()
+        return records
+
+    def load_tail(self, count, end=None):
+        """
+        The last `count` complete records before byte `end` (the end of the
+        journal if None), oldest first. Reads backwards from `end`, so the
+        cost depends on `count`, not on how long the journal is.
+        """
+        self.file.flush()
+        with open(self.path, "rb") as f:
+            pos = end = os.path.getsize(self.path) if end is None else end
+            data = b""
+            while pos > 0 and data.count(b"\n") <= count:
+                step = min(TAIL_CHUNK, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+        lines = data.split(b"\n")[:-1]  # the last piece is empty or torn
+        if pos > 0:
+            lines = lines[1:]  # may start mid-record
+        return [json.loads(line) for line in lines[len(lines) - count:]] if count else []
+
+    def tell(self):
+        """
+        Journal offset just past the last appended record.
+        """
+        self.file.flush()
+        return self.file.tell()
+
+    def read_checkpoint(self):
+        """
+        Return (height, hash) of the last block known to be verified, or None.
+        """
+        try:
+            with open(self.checkpoint_path) as f:
+                checkpoint = json.load(f)
+            return checkpoint["height"], checkpoint["hash"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def write_checkpoint(self, height, block_hash):
+        # Write-then-rename so a crash never leaves a half-written checkpoint
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"height": height, "hash": block_hash}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def trusted_height(self, chain, floor=0):
+        """
+        Height up to which the loaded chain matches the last checkpoint.
+        Falls back to `floor` (0 verifies everything) if the checkpoint is
+        missing, stale or older than the floor.
+        """
+        checkpoint = self.read_checkpoint()
+        if checkpoint is None:
+            return floor
+        height, block_hash = checkpoint
+        if floor <= height < len(chain) and chain[height].hash == block_hash:
+            return height
+        return floor
+
+    def read_snapshot(self):
+        try:
+            with open(self.snapshot_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def write_snapshot(self, snapshot):
+        """
+        Atomically replace the snapshot of derived chain state. It records the
+        tip block and the journal offset after it, so a restart only has to
+        replay what was appended since.
+        """
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+    def close(self):
+        if not self.file.closed:
+            self.sync(force=self.fsync_policy != "never")
+            self.file.close()
+
+    @staticmethod
+    def encode(record):
+        return json.dumps(record, separators=(",", ":")).encode() + b"\n"
+
+def open_journal(path, fsync_policy="always"):
+    """
+    JSON-lines journal by default; paths ending in .vbc use the fixed-size
+    binary format from binary_chain.py.
+    """
+    if path.endswith(".vbc"):
+        from binary_chain import BinaryChainJournal
+        return BinaryChainJournal(path, fsync_policy)
+    return ChainJournal(path, fsync_policy)
+
+def load_chain(journal, block_cls, payload_field, genesis):
+    """
+    Rebuild a chain from `journal` for Blockchain.__init__.
+
+    With a usable snapshot only the snapshot's tip block and the records
+    after it are read; older blocks are loaded lazily on first access.
+    Blocks past the last trusted point (checkpoint or snapshot) are verified.
+
+    Returns (chain, snapshot state or None, first height to replay).
+    """
+    snapshot = journal.read_snapshot()
+    if snapshot is not None and snapshot["offset"] <= journal.tell():
+        height, offset = snapshot["height"], snapshot["offset"]
+        # The history ends with the snapshot's tip record, which is already in the columns
+        chain = ChainColumns(block_cls, payload_field, base=height,
+                             history=lambda: map(block_cls.from_record, journal.load(0, offset)[:height]),
+                             history_tail=lambda count: map(block_cls.from_record,
+                                                            journal.load_tail(count + 1, offset)[:-1]))
+        chain.append(block_cls.from_record(snapshot["tip"]))
+        chain.extend(block_cls.from_record(r) for r in journal.load(offset))
+        broken = find_broken_link(chain, journal.trusted_height(chain, floor=height) + 1)
+        if broken is None:
+            return chain, snapshot["state"], height + 1
+        # Snapshot does not match this journal; fall back to a full replay
+
+    chain = ChainColumns(block_cls, payload_field, (block_cls.from_record(r) for r in journal.load()))
+    if not chain:
+        chain.append(genesis)
+        journal.append(genesis.to_record())
+    trusted = journal.trusted_height(chain)
+    broken = find_broken_link(chain, trusted + 1 if trusted else 0)
+    if broken is not None:
+        raise ValueError(f"Block {broken} in {journal.path} failed verification")
+    return chain, None, 0
+
+def find_broken_link(chain, start=0):
+    """
+    Recompute hashes and previous_hash links for chain[start:].
+    Returns the index of the first block that fails, or None if all verify.
+    """
+    if start == 0:
+        if chain and chain[0].compute_hash() != chain[0].hash:
+            return 0
+        start = 1
+    for i in range(start, len(chain)):
+        block = chain[i]
+        if block.previous_hash != chain[i - 1].hash or block.compute_hash() != block.hash:
+            return i
+    return None
+
+# ----------------- Journaled Chain ---------------- #
+class JournaledChain(ABC):
+    """
+    Persistence shared by the revocation and certificate chains: blocks go
+    to a journal, verification checkpoints and derived-state snapshots are
+    written every checkpoint_interval / snapshot_interval blocks, and a
+    restart resumes from the newest snapshot, replays only the blocks after
+    it and re-verifies only what follows the last checkpoint.
+
+    Subclasses set block_cls (constructed as block_cls(vehicle_id, payload,
+    previous_hash)), payload_field and genesis_payload, create their derived
+    state before calling __init__, and keep it current in apply(height,
+    block). snapshot_state() and restore_state(state) save and load it.
+    """
+    block_cls = None
+    payload_field = None
+    genesis_payload = None
+
+    def __init__(self, journal_path, fsync_policy="always",
+                 checkpoint_interval=CHECKPOINT_INTERVAL, snapshot_interval=SNAPSHOT_INTERVAL):
+        self.journal = open_journal(journal_path, fsync_policy)
+        self.checkpoint_interval = checkpoint_interval
+        self.snapshot_interval = snapshot_interval
+        self.chain, state, replay_from = load_chain(self.journal, self.block_cls, self.payload_field,
+                                                    self.block_cls("Genesis", self.genesis_payload, "0"))
+        if state:
+            self.restore_state(state)
+        for height in range(replay_from, len(self.chain)):
+            self.apply(height, self.chain[height])
+        self.snapshot_height = replay_from - 1 if state else 0
+        self.checkpoint()
+        self.maybe_checkpoint()
+
+    @abstractmethod
+    def apply(self, height, block):
+        """
+        Fold one block into the derived state that snapshots capture.
+        """
+
+    @abstractmethod
+    def snapshot_state(self):
+        """
+        The derived state as JSON-serialisable data.
+        """
+
+    @abstractmethod
+    def restore_state(self, state):
+        """
+        Load derived state saved by snapshot_state().
+        """
+
+    def checkpoint(self):
+        self.checkpoint_height = len(self.chain) - 1
+        self.journal.write_checkpoint(self.checkpoint_height, self.chain[-1].hash)
+
+    def snapshot(self):
+        self.snapshot_height = len(self.chain) - 1
+        self.journal.write_snapshot({
+            "height": self.snapshot_height,
+            "offset": self.journal.tell(),
+            "tip": self.chain[-1].to_record(),
+            "state": self.snapshot_state()
+        })
+
+    def maybe_checkpoint(self):
+        height = len(self.chain) - 1
+        if height - self.checkpoint_height >= self.checkpoint_interval:
+            self.checkpoint()
+        if height - self.snapshot_height >= self.snapshot_interval:
+            self.snapshot()
+
+    def append_block(self, block):
+        self.chain.append(block)
+        self.apply(len(self.chain) - 1, block)
+        self.journal.append(block.to_record())
+        self.maybe_checkpoint()
+        return block
+
+    def add_block(self, vehicle_id, payload):
+        return self.append_block(self.block_cls(vehicle_id, payload, self.chain[-1].hash))
+
+    def add_blocks(self, entries):
+        """
+        Group commit: chain one block per (vehicle_id, payload) pair and
+        persist the whole batch with one journal write.
+        """
+        new_blocks = []
+        prev_hash = self.chain[-1].hash
+        for vehicle_id, payload in entries:
+            block = self.block_cls(vehicle_id, payload, prev_hash)
+            new_blocks.append(block)
+            prev_hash = block.hash
+        first_height = len(self.chain)
+        self.chain.extend(new_blocks)
+        for i, block in enumerate(new_blocks):
+            self.apply(first_height + i, block)
+        self.journal.append_many(b.to_record() for b in new_blocks)
+        self.maybe_checkpoint()
+        return new_blocks
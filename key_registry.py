@@ -0,0 +1,56 @@
+import hashlib
+import sqlite3
+
+# ----------------- Persistent Sybil Key Registry ---------------- #
+FINGERPRINT_SIZE = 16  # bytes of blake2b over the serialized public key
+
+def fingerprint(public_key_bytes):
+    return hashlib.blake2b(public_key_bytes, digest_size=FINGERPRINT_SIZE).digest()
+
+def registry_path(journal_path):
+    # Beside the chain journal, like its .checkpoint and .snapshot files
+    return journal_path + ".keys.db"
+
+class KeyRegistry:
+    """
+    Fingerprints of every public key the CA has certified, kept in sqlite so
+    Sybil detection survives restarts and is shared by every CA process using
+    the same file. Registration is a single INSERT OR IGNORE on the primary
+    key, so two processes can never both register the same key. Nothing is
+    held in memory per key; lookups go to the primary-key index.
+
+    Without a path the registry is a private in-memory database that lasts
+    as long as the object. A CertificateAuthority given no registry opens
+    one at registry_path() next to its chain instead, so the two persist
+    (or not) together.
+    """
+
+    def __init__(self, path=None):
+        self.conn = sqlite3.connect(path or ":memory:", timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")  # readers never wait for another CA's writes
+        self.conn.execute('''CREATE TABLE IF NOT EXISTS key_fingerprints (
+                                fingerprint BLOB PRIMARY KEY,
+                                vehicle_id TEXT) WITHOUT ROWID''')
+        self.conn.commit()
+
+    def register(self, public_key_bytes, vehicle_id):
+        """
+        True if the key was new and is now registered to vehicle_id,
+        False if it was already registered (a Sybil attempt).
+        """
+        with self.conn:
+            added = self.conn.execute("INSERT OR IGNORE INTO key_fingerprints VALUES (?, ?)",
+                                      (fingerprint(public_key_bytes), vehicle_id)).rowcount
+        return added == 1
+
+    def __contains__(self, public_key_bytes):
+        return self.conn.execute("SELECT 1 FROM key_fingerprints WHERE fingerprint = ?",
+                                 (fingerprint(public_key_bytes),)).fetchone() is not None
+
+    def owner(self, public_key_bytes):
+        row = self.conn.execute("SELECT vehicle_id FROM key_fingerprints WHERE fingerprint = ?",
+                                (fingerprint(public_key_bytes),)).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        self.conn.close()
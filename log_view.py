@@ -0,0 +1,96 @@
+import collections
+import itertools
+import tempfile
+import tkinter as tk
+
+# ----------------- Bounded Log View ---------------- #
+# A long simulation logs hundreds of thousands of lines. Inserting every one
+# into a tk.Text and scrolling to it makes the widget (and the whole GUI)
+# slower the longer it runs, so the widget only ever shows the newest
+# VIEW_LINES lines and is redrawn at most once per REDRAW_INTERVAL ms. The
+# complete log is appended to a history file instead of being held in memory,
+# and read back from there for exporting.
+
+VIEW_LINES = 500
+REDRAW_INTERVAL = 250  # ms, i.e. at most four redraws a second
+
+class LogView:
+    """
+    tk.Text showing a ring buffer of the most recent log lines.
+    write() only queues a line; queued lines reach the widget on the next
+    coalesced redraw. Every line also goes to the history file at
+    history_path, or to an anonymous temporary file without one.
+    """
+
+    def __init__(self, root, lines=VIEW_LINES, interval=REDRAW_INTERVAL, history_path=None, **text_options):
+        self.root = root
+        self.lines = lines
+        self.interval = interval
+        self.text = tk.Text(root, **text_options)
+        self.recent = collections.deque(maxlen=lines)
+        # Append mode, so reading the history back never moves where lines are written
+        if history_path is None:
+            self.history = tempfile.TemporaryFile("a+", encoding="utf-8")
+        else:
+            self.history = open(history_path, "a+", encoding="utf-8")
+        self.shown = 0     # lines currently in the widget
+        self.unshown = 0   # lines in self.recent not drawn yet
+        self.pending = None
+
+    def pack(self, **options):
+        self.text.pack(**options)
+
+    def write(self, line):
+        self.history.write(line + "\n")
+        self.recent.append(line)
+        self.unshown += 1
+        self.schedule()
+
+    def show(self, lines):
+        """
+        Replace what is displayed with `lines` (e.g. a report), leaving the
+        history alone. Later write()s append below it as before.
+        """
+        self.recent.clear()
+        self.recent.extend(lines)
+        self.shown = None  # forces a full redraw
+        self.unshown = len(self.recent)
+        self.schedule()
+
+    def history_lines(self):
+        """
+        Every line written so far, oldest first, streamed from the history file.
+        """
+        self.history.flush()
+        self.history.seek(0)
+        for line in iter(self.history.readline, ""):
+            yield line[:-1]
+
+    def close(self):
+        if self.pending is not None:
+            self.root.after_cancel(self.pending)
+            self.pending = None
+        self.history.close()
+
+    def schedule(self):
+        if self.pending is None:
+            self.pending = self.root.after(self.interval, self.redraw)
+
+    def redraw(self):
+        self.pending = None
+        maxlen = self.recent.maxlen
+        new = min(self.unshown, len(self.recent))
+        if self.shown is None or new >= maxlen:
+            # Too much changed; rebuilding is cheaper than patching
+            self.text.delete("1.0", tk.END)
+            self.text.insert(tk.END, "".join(line + "\n" for line in self.recent))
+            self.shown = len(self.recent)
+        else:
+            added = itertools.islice(self.recent, len(self.recent) - new, None)
+            self.text.insert(tk.END, "".join(line + "\n" for line in added))
+            excess = self.shown + new - maxlen
+            if excess > 0:
+                self.text.delete("1.0", f"{excess + 1}.0")
+            self.shown = min(self.shown + new, maxlen)
+        self.unshown = 0
+        self.text.see(tk.END)
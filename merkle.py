@@ -0,0 +1,63 @@
+import hashlib
+import json
+
+# ----------------- Merkle Tree for Batched Revocations ---------------- #
+# Leaves and inner nodes are hashed with different prefixes so an inner node
+# can never be passed off as a leaf. An odd node at the end of a level is
+# carried up unchanged rather than duplicated.
+
+def entry_leaf(vehicle_id, action):
+    # Unambiguous leaf encoding for one (vehicle_id, action) revocation entry
+    return json.dumps([vehicle_id, action])
+
+def leaf_hash(data):
+    return hashlib.sha256(b"\x00" + data.encode()).digest()
+
+def node_hash(left, right):
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+def build_levels(leaves):
+    """
+    All levels of the tree, from the leaf hashes up to the root.
+    """
+    level = [leaf_hash(d) for d in leaves]
+    levels = [level]
+    while len(level) > 1:
+        nxt = [node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            nxt.append(level[-1])
+        levels.append(nxt)
+        level = nxt
+    return levels
+
+def merkle_root(leaves):
+    if not leaves:
+        return ""
+    return build_levels(leaves)[-1][0].hex()
+
+def merkle_proof(leaves, index):
+    """
+    Sibling hashes from leaf `index` to the root, as [sibling_hex, side] pairs
+    where side says whether the sibling sits on the "L" or "R".
+    """
+    return proof_from_levels(build_levels(leaves), index)
+
+def proof_from_levels(levels, index):
+    # Same as merkle_proof, for a caller that keeps the built levels around
+    proof = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append([level[sibling].hex(), "L" if sibling < index else "R"])
+        index //= 2
+    return proof
+
+def verify_proof(leaf, proof, root):
+    """
+    Check that `leaf` is included under `root` using log2(n) hashes.
+    """
+    digest = leaf_hash(leaf)
+    for sibling_hex, side in proof:
+        sibling = bytes.fromhex(sibling_hex)
+        digest = node_hash(sibling, digest) if side == "L" else node_hash(digest, sibling)
+    return digest.hex() == root
@@ -0,0 +1,129 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+# ----------------- Vectorized Mobility Models ---------------- #
+class Mobility(ABC):
+    """
+    Positions of a whole fleet held in NumPy arrays (vehicle i at x[i], y[i]).
+    step() advances every vehicle in one call; renderers read the arrays
+    only when they draw.
+    """
+
+    def __init__(self, x, y, rng=None):
+        self.x = np.array(x, dtype=np.float64)
+        self.y = np.array(y, dtype=np.float64)
+        self.rng = rng if isinstance(rng, np.random.Generator) else np.random.default_rng(rng)
+
+    def __len__(self):
+        return len(self.x)
+
+    def add(self, x, y, **extra):
+        """
+        Append one vehicle and return its index.
+        """
+        self.x = np.append(self.x, x)
+        self.y = np.append(self.y, y)
+        return len(self.x) - 1
+
+    def remove(self, mask):
+        """
+        Drop the vehicles where `mask` is True; the rest keep their order.
+        Returns what add() needs to re-create each removed vehicle elsewhere.
+        """
+        removed = [{"x": float(x), "y": float(y)} for x, y in zip(self.x[mask], self.y[mask])]
+        self.x = self.x[~mask]
+        self.y = self.y[~mask]
+        return removed
+
+    @abstractmethod
+    def step(self):
+        """
+        Move every vehicle one time step.
+        """
+
+    def advance(self, steps):
+        # Step by step, so a run that skips ticks ends up exactly where a
+        # run that visits every tick does
+        for _ in range(steps):
+            self.step()
+
+    def steps_to_reach(self, index, centers_x, centers_y, radius):
+        """
+        For the vehicles at `index`, a lower bound on the steps before each
+        could be inside one of the open squares of half-width `radius`
+        around the centers (0 if it may be inside one now). The bound may
+        be too low, never too high; this default knows nothing about the
+        motion and returns 0.
+        """
+        return np.zeros(len(index))
+
+class RandomWalk(Mobility):
+    """
+    Every vehicle moves a random whole number of units in
+    [-max_step, max_step] along each axis per step.
+    """
+
+    def __init__(self, x, y, max_step=5, rng=None):
+        super().__init__(x, y, rng)
+        self.max_step = max_step
+
+    def step(self):
+        n = len(self.x)
+        self.x += self.rng.integers(-self.max_step, self.max_step + 1, n)
+        self.y += self.rng.integers(-self.max_step, self.max_step + 1, n)
+
+    def steps_to_reach(self, index, centers_x, centers_y, radius):
+        # At most max_step closer per axis per step
+        gap = np.maximum(np.abs(self.x[index, None] - centers_x),
+                         np.abs(self.y[index, None] - centers_y)) - radius
+        return (np.floor(np.maximum(gap, 0) / self.max_step).min(axis=1) if len(centers_x)
+                else np.full(len(index), np.inf))
+
+class LaneFollowing(Mobility):
+    """
+    Vehicles drive left to right along their lane (fixed y) at their own
+    constant speed; one that passes `width` re-enters at `wrap_to`.
+    """
+
+    def __init__(self, x, y, width, speed_range=(1.0, 2.5), wrap_to=-70, rng=None):
+        super().__init__(x, y, rng)
+        self.width = width
+        self.speed_range = speed_range
+        self.wrap_to = wrap_to
+        self.speed = self.rng.uniform(*speed_range, len(self.x))
+
+    def add(self, x, y, speed=None, **extra):
+        speed = self.rng.uniform(*self.speed_range) if speed is None else speed
+        self.speed = np.append(self.speed, speed)
+        return super().add(x, y)
+
+    def remove(self, mask):
+        removed = super().remove(mask)
+        for state, speed in zip(removed, self.speed[mask]):
+            state["speed"] = float(speed)
+        self.speed = self.speed[~mask]
+        return removed
+
+    def step(self):
+        self.x += self.speed
+        self.x[self.x > self.width] = self.wrap_to
+
+    def steps_to_reach(self, index, centers_x, centers_y, radius):
+        # Only squares across the vehicle's lane count. One still ahead is
+        # reached by driving on; one behind only after the drive to `width`
+        # and on from wrap_to. The distance over speed is always short of
+        # the true (whole) step count, so flooring it leaves a step to
+        # spare for rounding in the repeated additions.
+        if not len(centers_x):
+            return np.full(len(index), np.inf)
+        x = self.x[index, None]
+        entry = centers_x - radius  # x must pass this to be inside
+        exit = centers_x + radius
+        after_wrap = np.where(self.wrap_to < exit, np.maximum(entry - self.wrap_to, 0), np.inf)
+        distance = np.where(x < exit, entry - x, self.width - x + after_wrap)
+        missed = (np.abs(self.y[index, None] - centers_y) >= radius) | (entry >= self.width)
+        distance[missed] = np.inf
+        return np.floor(np.maximum(distance.min(axis=1), 0) / self.speed[index])
+
+MODELS = {"random_walk": RandomWalk, "lane": LaneFollowing}
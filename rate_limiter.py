@@ -0,0 +1,48 @@
+import collections
+import time
+
+# ----------------- RSU Rate Limiter ---------------- #
+class RateLimiter:
+    """
+    Token bucket per vehicle id / pseudonym, owned by the RSU: `rate`
+    requests per second on average, up to `burst` back to back.
+
+    Each bucket is stored as one number, the time at which it will be full
+    again (the GCRA form of a token bucket). A bucket that is full holds no
+    information, so it is dropped; entries are kept least recently seen
+    first and idle ones are evicted from the front on every call. At most
+    `max_entries` identities are tracked; beyond that the least recently
+    seen is forgotten, which can only ever let that identity through early.
+    """
+
+    def __init__(self, rate=1.0, burst=1, max_entries=1000000):
+        self.interval = 1.0 / rate
+        self.burst_time = burst * self.interval
+        self.max_entries = max_entries
+        self.full_at = collections.OrderedDict()  # identity -> time its bucket is full again
+
+    def allow(self, identity, now=None):
+        now = time.monotonic() if now is None else now
+        full_at = self.full_at.get(identity, now)
+        if full_at < now:
+            full_at = now
+        allowed = full_at + self.interval - now <= self.burst_time
+        if allowed:
+            self.full_at[identity] = full_at + self.interval
+            self.full_at.move_to_end(identity)
+        self.evict(now)
+        return allowed
+
+    def evict(self, now):
+        full_at = self.full_at
+        while full_at:
+            identity = next(iter(full_at))
+            if full_at[identity] > now and len(full_at) <= self.max_entries:
+                break
+            del full_at[identity]
+
+    def forget(self, identity):
+        self.full_at.pop(identity, None)
+
+    def __len__(self):
+        return len(self.full_at)
@@ -0,0 +1,120 @@
+import collections
+import hashlib
+import hmac
+import math
+import os
+import time
+
+from revocation_filter import BloomFilter
+
+# ----------------- Replay Protection ---------------- #
+# Authentication requests carry the vehicle's timestamp and the nonce the RSU
+# challenged it with:
+#   b"auth_request|<unix time>|<32 hex nonce>"
+# The nonce is a random salt plus a tag under the RSU's own key, so an RSU
+# can tell its challenges apart without storing them, and a request captured
+# at one RSU is worthless at another. An RSU accepts a request only if the
+# nonce is one of its challenges to that vehicle, the timestamp is within
+# `window` seconds of its own clock and it has not accepted the same nonce
+# from that vehicle before.
+
+REPLAY_WINDOW = 30.0  # seconds either side of the RSU clock
+MIN_CAPACITY = 64  # requests per generation, however quiet the RSU
+REPLAY_FP_RATE = 1e-6  # fresh requests taken for replays; each one also makes a run irreproducible
+
+def challenge_tag(key, vehicle_id, salt):
+    return hmac.new(key, f"{vehicle_id}|{salt}".encode(), hashlib.sha256).hexdigest()[:16]
+
+def issue_challenge(key, vehicle_id):
+    salt = os.urandom(8).hex()
+    return salt + challenge_tag(key, vehicle_id, salt)
+
+def is_challenge(key, vehicle_id, nonce):
+    """
+    True if `nonce` came from issue_challenge(key, vehicle_id).
+    """
+    salt, tag = nonce[:16], nonce[16:]
+    return hmac.compare_digest(challenge_tag(key, vehicle_id, salt), tag)
+
+def auth_request(nonce, now=None):
+    timestamp = time.time() if now is None else now
+    return f"auth_request|{timestamp:.6f}|{nonce}".encode()
+
+def parse_request(message):
+    """
+    (timestamp, nonce) from an auth request, or None if it is malformed.
+    A timestamp that is not a finite number (nan, inf) is malformed: nan
+    would compare as inside every freshness window.
+    """
+    try:
+        kind, timestamp, nonce = message.decode().split("|")
+        timestamp = float(timestamp)
+    except ValueError:
+        return None
+    return (timestamp, nonce) if kind == "auth_request" and math.isfinite(timestamp) else None
+
+class ReplayCache:
+    """
+    Nonces an RSU accepted recently, in fixed memory.
+
+    A request older than `window` is rejected on its timestamp alone, so a
+    nonce only has to be remembered for 2 * window. The cache is a ring of
+    `generations` Bloom filters, each covering an equal slice of that time;
+    the oldest filter is dropped and a blank one started as time moves on.
+    Each check hashes the nonce once and probes every generation.
+
+    Memory does not grow with traffic. If more than `capacity` requests
+    land in one slice, the filter still works but a fresh request is more
+    likely to be mistaken for a replay (the client retries with a new nonce).
+    """
+
+    def __init__(self, window=REPLAY_WINDOW, capacity=100000, fp_rate=1e-4, generations=5):
+        self.window = window
+        self.span = 2 * window / (generations - 1)
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.filters = collections.deque(BloomFilter(capacity, fp_rate) for _ in range(generations))
+        self.slot = None  # time slot of filters[0]
+
+    @classmethod
+    def for_rate(cls, rate, window=REPLAY_WINDOW, fp_rate=REPLAY_FP_RATE, generations=5):
+        """
+        Cache sized for an RSU expected to see `rate` requests per second:
+        each generation covers 2 * window / (generations - 1) seconds of them.
+        A check probes every generation, so `fp_rate` (the chance a fresh
+        request is taken for a replay) is split between them.
+        """
+        span = 2 * window / (generations - 1)
+        return cls(window, max(MIN_CAPACITY, math.ceil(rate * span)), fp_rate / generations, generations)
+
+    def rotate(self, now):
+        slot = int(now // self.span)
+        if self.slot is None:
+            self.slot = slot
+        for _ in range(min(slot - self.slot, len(self.filters))):
+            self.filters.pop()
+            self.filters.appendleft(BloomFilter(self.capacity, self.fp_rate))
+        self.slot = max(self.slot, slot)
+
+    def check(self, key, timestamp, now=None):
+        """
+        True if the request is fresh, in which case `key` is remembered;
+        False if it is stale, from the future, or a replay.
+        """
+        now = time.time() if now is None else now
+        if abs(now - timestamp) > self.window:
+            return False
+        self.rotate(now)
+        positions = self.filters[0].positions(key)
+        for bloom in self.filters:
+            bits = bloom.bits
+            if all(bits[pos >> 3] & (1 << (pos & 7)) for pos in positions):
+                return False
+        current = self.filters[0]
+        for pos in positions:
+            current.bits[pos >> 3] |= 1 << (pos & 7)
+        current.count += 1
+        return True
+
+    def nbytes(self):
+        return sum(bloom.nbytes() for bloom in self.filters)
@@ -0,0 +1,97 @@
+import hashlib
+import math
+
+# ----------------- Probabilistic Revocation Filter ---------------- #
+def item_hashes(item):
+    # Triple hashing: one 192-bit digest gives every position in every filter.
+    # Plain double hashing (h1 + i * h2) puts an item's bits on a straight
+    # line, and two items on the same line share nearly all of them, which
+    # sets a floor under the false-positive rate however big the filter is
+    digest = hashlib.blake2b(item.encode(), digest_size=24).digest()
+    return (int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:16], "little"),
+            int.from_bytes(digest[16:], "little"))
+
+class BloomFilter:
+    """
+    Fixed-capacity Bloom filter over vehicle ids / pseudonyms.
+    "Not present" answers are always correct; "present" answers are wrong
+    with probability of about fp_rate once `capacity` ids have been added.
+    """
+
+    def __init__(self, capacity, fp_rate=0.01):
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def positions(self, item):
+        h1, h2, h3 = item_hashes(item)
+        return [(h1 + i * h2 + i * i * h3) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item):
+        for pos in self.positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return self.contains_hashes(*item_hashes(item))
+
+    def contains_hashes(self, h1, h2, h3):
+        """
+        Membership test from item_hashes(item); stops at the first clear bit.
+        """
+        bits = self.bits
+        num_bits = self.num_bits
+        for i in range(self.num_hashes):
+            pos = (h1 + i * h2 + i * i * h3) % num_bits
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def nbytes(self):
+        return len(self.bits)
+
+class RevocationFilter:
+    """
+    Growable revocation snapshot for the RSU fast path.
+
+    A chain of Bloom filters: when the newest stage is full a new stage with
+    twice the capacity and half the false-positive rate is started, so the
+    overall rate stays below fp_rate however many revocations arrive.
+    """
+
+    def __init__(self, initial_capacity=1024, fp_rate=0.01):
+        self.fp_rate = fp_rate
+        self.stages = [BloomFilter(initial_capacity, fp_rate / 2)]
+
+    @classmethod
+    def from_ids(cls, vehicle_ids, fp_rate=0.01):
+        vehicle_ids = list(vehicle_ids)
+        revocation_filter = cls(max(1024, len(vehicle_ids)), fp_rate)
+        for vehicle_id in vehicle_ids:
+            revocation_filter.add(vehicle_id)
+        return revocation_filter
+
+    def add(self, vehicle_id):
+        stage = self.stages[-1]
+        if stage.count >= stage.capacity:
+            stage = BloomFilter(stage.capacity * 2, stage.fp_rate / 2)
+            self.stages.append(stage)
+        stage.add(vehicle_id)
+
+    def might_contain(self, vehicle_id):
+        h1, h2, h3 = item_hashes(vehicle_id)
+        for stage in self.stages:
+            if stage.contains_hashes(h1, h2, h3):
+                return True
+        return False
+
+    __contains__ = might_contain
+
+    def __len__(self):
+        return sum(stage.count for stage in self.stages)
+
+    def nbytes(self):
+        return sum(stage.nbytes() for stage in self.stages)
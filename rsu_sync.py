@@ -0,0 +1,200 @@
+import bisect
+import json
+import random
+import socket
+import socketserver
+import sys
+import threading
+import time
+from multiprocessing import Event, Process, Queue
+
+from revocation_filter import RevocationFilter
+
+# ----------------- Revocation Log ---------------- #
+REVOCATION_CAPACITY = 1024
+REVOCATION_FP_RATE = 0.01
+
+class RevocationLog:
+    """
+    Every revocation the CA (or a relaying peer) knows about, keyed by the
+    chain height of the block that recorded them, so it can serve deltas.
+    `height` is the last block height seen, so a peer only ever asks for
+    what came after it.
+    """
+
+    def __init__(self):
+        self.height = 0
+        self.heights = []
+        self.vehicle_ids = []
+        self.revoked = set()
+        self.lock = threading.Lock()
+
+    def add(self, height, vehicle_id):
+        with self.lock:
+            self.apply(height, [[height, vehicle_id]])
+
+    def apply(self, height, entries):
+        for entry_height, vehicle_id in entries:
+            if entry_height <= self.height or vehicle_id in self.revoked:
+                continue
+            self.heights.append(entry_height)
+            self.vehicle_ids.append(vehicle_id)
+            self.revoked.add(vehicle_id)
+        self.height = max(self.height, height)
+
+    def entries_since(self, height):
+        with self.lock:
+            start = bisect.bisect_right(self.heights, height)
+            entries = [[h, v] for h, v in zip(self.heights[start:], self.vehicle_ids[start:])]
+            return self.height, entries
+
+    def is_revoked(self, vehicle_id):
+        return vehicle_id in self.revoked
+
+class RevocationFilterLog:
+    """
+    What an RSU keeps of the revocation list: the last height it pulled and
+    a RevocationFilter over the ids, a byte or two per revocation instead of
+    the ids themselves. "Not revoked" is definite; a hit may be a false
+    positive, so the RSU confirms it with the CA (see RSU.precheck). It can
+    pull deltas but not serve them.
+
+    `capacity` is the number of revocations expected, and `fp_rate` the
+    filter's false-positive rate; the filter grows past `capacity`, at the
+    cost of an extra stage to probe on every lookup.
+    """
+
+    def __init__(self, capacity=REVOCATION_CAPACITY, fp_rate=REVOCATION_FP_RATE):
+        self.height = 0
+        self.revocation_filter = RevocationFilter(capacity, fp_rate)
+        self.lock = threading.Lock()
+
+    def add(self, height, vehicle_id):
+        with self.lock:
+            self.apply(height, [[height, vehicle_id]])
+
+    def apply(self, height, entries):
+        for entry_height, vehicle_id in entries:
+            if entry_height > self.height:
+                self.revocation_filter.add(vehicle_id)
+        self.height = max(self.height, height)
+
+    def might_be_revoked(self, vehicle_id):
+        return self.revocation_filter.might_contain(vehicle_id)
+
+    def nbytes(self):
+        return self.revocation_filter.nbytes()
+
+# ----------------- Delta Sync Protocol ---------------- #
+# One JSON line each way over TCP:
+#   request:  {"since": <height>}
+#   response: {"height": <tip height>, "entries": [[height, vehicle_id], ...]}
+
+class SyncHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        request = json.loads(self.rfile.readline())
+        height, entries = self.server.log.entries_since(request["since"])
+        self.wfile.write(json.dumps({"height": height, "entries": entries},
+                                    separators=(",", ":")).encode() + b"\n")
+
+class SyncServer(socketserver.ThreadingTCPServer):
+    """
+    Serves a RevocationLog to peers on a loopback port (port 0 picks a free one).
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, log, host="127.0.0.1", port=0):
+        super().__init__((host, port), SyncHandler)
+        self.log = log
+
+    @property
+    def address(self):
+        return self.server_address
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+def pull_from(log, address, timeout=5.0):
+    """
+    Fetch and apply the entries a peer has past log.height.
+    Returns the number of bytes sent and received.
+    """
+    request = json.dumps({"since": log.height}).encode() + b"\n"
+    with socket.create_connection(address, timeout=timeout) as sock:
+        sock.sendall(request)
+        reply = sock.makefile("rb").readline()
+    response = json.loads(reply)
+    with log.lock:
+        log.apply(response["height"], response["entries"])
+    return len(request) + len(reply)
+
+# ----------------- Loopback Propagation Benchmark ---------------- #
+def rsu_node(node_id, peers, ports, reports, stop, poll_interval):
+    """
+    One RSU process: serve its own log and keep pulling from random peers.
+    """
+    log = RevocationLog()
+    server = SyncServer(log).start()
+    ports.put((node_id, server.address))
+    peer_addresses = [tuple(a) for a in peers.get()]
+    transferred = 0
+    last_height = -1
+    while not stop.is_set():
+        try:
+            transferred += pull_from(log, random.choice(peer_addresses))
+        except OSError:
+            pass
+        if log.height != last_height:
+            last_height = log.height
+            reports.put((node_id, log.height, transferred, time.time()))
+        time.sleep(poll_interval)
+    server.shutdown()
+
+def wait_for_height(reports, state, nodes, height):
+    while any(state[n][0] < height for n in range(nodes)):
+        node_id, node_height, transferred, when = reports.get()
+        state[node_id] = (node_height, transferred, when)
+
+def bench(nodes=8, sizes=(1000, 10000, 100000), burst=100, poll_interval=0.01):
+    origin = RevocationLog()
+    origin_server = SyncServer(origin).start()
+    ports, peers, reports, stop = Queue(), Queue(), Queue(), Event()
+    workers = [Process(target=rsu_node, args=(i, peers, ports, reports, stop, poll_interval))
+               for i in range(nodes)]
+    for w in workers:
+        w.start()
+    addresses = [origin_server.address] + [ports.get()[1] for _ in range(nodes)]
+    for _ in range(nodes):
+        peers.put(addresses)
+
+    state = {n: (0, 0, 0.0) for n in range(nodes)}
+    height = 0
+    print(f"{nodes} RSU processes gossiping over loopback, bursts of {burst} revocations")
+    for size in sizes:
+        # Grow the history, then let every RSU catch up before measuring
+        while len(origin.revoked) < size - burst:
+            height += 1
+            origin.add(height, f"PSN-{height}")
+        wait_for_height(reports, state, nodes, height)
+        bytes_before = sum(s[1] for s in state.values())
+
+        published = time.time()
+        for _ in range(burst):
+            height += 1
+            origin.add(height, f"PSN-{height}")
+        wait_for_height(reports, state, nodes, height)
+        propagation_ms = (max(s[2] for s in state.values()) - published) * 1000
+        delta_bytes = sum(s[1] for s in state.values()) - bytes_before
+        full_bytes = len(json.dumps(origin.entries_since(0)[1]))
+        print(f"list size {size:>7}: propagated to all RSUs in {propagation_ms:7.1f} ms, "
+              f"{delta_bytes / nodes:9.0f} bytes/RSU (full list {full_bytes} bytes)")
+
+    stop.set()
+    for w in workers:
+        w.join()
+    origin_server.shutdown()
+
+if __name__ == "__main__":
+    bench(nodes=int(sys.argv[1]) if len(sys.argv) > 1 else 8)
@@ -0,0 +1,148 @@
+import json
+import os
+import sys
+import tempfile
+import time
+
+from certificate_authority import Blockchain
+from key_registry import KeyRegistry
+from signatures import get_scheme
+from vanet_engine import RSU_POSITIONS, SimulationEngine
+
+# ----------------- Scenario Files ---------------- #
+# A scenario is a JSON object that pins down everything a run depends on:
+#   {"seed": 7, "vehicles": 500, "ticks": 300, "mobility": "lane",
+#    "rsus": [[100, 100], [600, 400]], "scheme": "ed25519",
+#    "revocations": [[30.0, "V12"], [95.5, "V40"]]}
+# Revocations are [seconds after the start, vehicle_id]. Simulated time always
+# starts at 0, so two runs of one scenario see the same clock, placements,
+# speeds and revocations. Missing keys take the values in DEFAULTS.
+
+DEFAULTS = {
+    "seed": 0,
+    "vehicles": 5,
+    "ticks": 100,
+    "mobility": "random_walk",
+    "rsus": [list(p) for p in RSU_POSITIONS],
+    "scheme": None,
+    "tick_interval": 1.0,
+    "revocations": []
+}
+
+def load_scenario(path):
+    with open(path) as f:
+        return dict(DEFAULTS, **json.load(f))
+
+def save_scenario(scenario, path):
+    with open(path, "w") as f:
+        json.dump(scenario, f, indent=4)
+
+def build_engine(scenario, blockchain=None, key_registry=None, beacons=True):
+    """
+    SimulationEngine set up from `scenario`, with its revocations scheduled.
+    """
+    engine = SimulationEngine(scenario["vehicles"], rsu_positions=[tuple(p) for p in scenario["rsus"]],
+                              blockchain=blockchain, key_registry=key_registry,
+                              scheme=get_scheme(scenario["scheme"]), seed=scenario["seed"],
+                              tick_interval=scenario["tick_interval"], start_time=0.0,
+                              mobility=scenario["mobility"], beacons=beacons)
+    by_id = {v.vehicle_id: v for v in engine.vehicles}
+    for offset, vehicle_id in scenario["revocations"]:
+        engine.scheduler.at(offset, engine.revoke, by_id[vehicle_id])
+    return engine
+
+# ----------------- Trace Record and Replay ---------------- #
+# A trace file is JSON lines: the scenario first, then one event per line,
+#   [time, "auth", vehicle_id, rsu index, result]
+#   [time, "revoke", vehicle_id]
+# Replaying feeds the recorded auths and revocations straight to a fresh
+# engine (no beacons, no mobility) at their recorded times, so a new build
+# is timed on exactly the same workload and every result is checked
+# against the recorded one.
+
+def save_trace(path, scenario, events):
+    with open(path, "w") as f:
+        f.write(json.dumps(scenario) + "\n")
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+def load_trace(path):
+    with open(path) as f:
+        scenario = dict(DEFAULTS, **json.loads(f.readline()))
+        return scenario, [json.loads(line) for line in f if line.strip()]
+
+def scratch_stores(tmp):
+    return (Blockchain(os.path.join(tmp, "blockchain.jsonl"), fsync_policy="never"),
+            KeyRegistry(os.path.join(tmp, "key_registry.db")))
+
+def run_scenario(scenario, record=True):
+    """
+    Run `scenario` in a scratch directory.
+    Returns (results, elapsed seconds, trace or None).
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        blockchain, key_registry = scratch_stores(tmp)
+        engine = build_engine(scenario, blockchain, key_registry)
+        engine.trace = [] if record else None
+        start = time.perf_counter()
+        results = engine.run(scenario["ticks"])
+        elapsed = time.perf_counter() - start
+        engine.close()
+        key_registry.close()
+    return dict(results), elapsed, engine.trace
+
+def replay_trace(scenario, events):
+    """
+    Replay recorded `events` against the current code.
+    Returns (results, elapsed seconds, mismatches), mismatches being
+    (event, new result) for every auth whose result changed.
+    """
+    mismatches = []
+
+    def replay_auth(engine, event):
+        _, _, vehicle_id, rsu_index, expected = event
+        result = engine.authenticate(by_id[vehicle_id], engine.rsus[rsu_index])
+        if result != expected:
+            mismatches.append((event, result))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        blockchain, key_registry = scratch_stores(tmp)
+        engine = build_engine(dict(scenario, revocations=[]), blockchain, key_registry, beacons=False)
+        by_id = {v.vehicle_id: v for v in engine.vehicles}
+        for event in events:
+            if event[1] == "auth":
+                engine.scheduler.at(event[0], replay_auth, engine, event)
+            elif event[1] == "revoke":
+                engine.scheduler.at(event[0], engine.revoke, by_id[event[2]])
+        start = time.perf_counter()
+        engine.scheduler.run()
+        elapsed = time.perf_counter() - start
+        engine.close()
+        key_registry.close()
+    return dict(engine.results), elapsed, mismatches
+
+def summary(results):
+    return ", ".join(f"{result} {count}" for result, count in sorted(results.items())) or "no authentications"
+
+if __name__ == "__main__":
+    # python scenario.py run <scenario.json> [trace.jsonl]
+    # python scenario.py replay <trace.jsonl>
+    if len(sys.argv) < 3 or sys.argv[1] not in ("run", "replay"):
+        print("usage: python scenario.py run <scenario.json> [trace.jsonl] | replay <trace.jsonl>")
+        sys.exit(1)
+    if sys.argv[1] == "run":
+        scenario = load_scenario(sys.argv[2])
+        results, elapsed, trace = run_scenario(scenario, record=len(sys.argv) > 3)
+        print(f"{scenario['vehicles']} vehicles, {scenario['ticks']} ticks in {elapsed:.2f} s: {summary(results)}")
+        if trace is not None:
+            save_trace(sys.argv[3], scenario, trace)
+            print(f"Recorded {len(trace)} events to {sys.argv[3]}")
+    else:
+        scenario, events = load_trace(sys.argv[2])
+        results, elapsed, mismatches = replay_trace(scenario, events)
+        print(f"Replayed {len(events)} events in {elapsed:.2f} s ({len(events) / elapsed:,.0f} events/sec): "
+              f"{summary(results)}")
+        for (t, _, vehicle_id, rsu_index, expected), result in mismatches[:10]:
+            print(f"  t={t:.3f} {vehicle_id} at RSU {rsu_index}: recorded {expected}, now {result}")
+        print(f"{len(mismatches)} mismatched results")
+        sys.exit(1 if mismatches else 0)
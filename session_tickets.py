@@ -0,0 +1,64 @@
+import hashlib
+import hmac
+import os
+import time
+
+# ----------------- RSU Session Tickets ---------------- #
+# After a full signature check an RSU hands the vehicle a ticket and a session
+# key. Any RSU holding the same domain key can then re-authenticate the vehicle
+# with two HMACs instead of a public-key sign + verify:
+#
+#   ticket       = "<issued>|<vehicle_id>" + HMAC(domain_key, body)
+#   session_key  = HMAC(domain_key, "session" + ticket)
+#   proof        = HMAC(session_key, message), computed by the vehicle
+#
+# RSUs keep no per-ticket state; everything is recomputed from the ticket.
+
+TICKET_LIFETIME = 30.0  # seconds
+TAG_SIZE = hashlib.sha256().digest_size
+
+def mac(key, message):
+    return hmac.new(key, message, hashlib.sha256).digest()
+
+class TicketDomain:
+    """
+    Ticket key shared by the RSUs of one domain. invalidate() rejects every
+    ticket a vehicle was issued up to that moment, e.g. when it is revoked.
+    """
+
+    def __init__(self, key=None, lifetime=TICKET_LIFETIME):
+        self.key = key or os.urandom(32)
+        self.lifetime = lifetime
+        self.invalidated = {}  # vehicle_id -> time its older tickets stopped counting
+
+    def issue(self, vehicle_id, now=None):
+        """
+        Returns (ticket, session_key) for a vehicle that just passed a full check.
+        """
+        issued = time.time() if now is None else now
+        body = f"{issued:.6f}|{vehicle_id}".encode()
+        ticket = body + mac(self.key, body)
+        return ticket, self.session_key(ticket)
+
+    def session_key(self, ticket):
+        return mac(self.key, b"session" + ticket)
+
+    def validate(self, ticket, vehicle_id, message, proof, now=None):
+        now = time.time() if now is None else now
+        body, tag = ticket[:-TAG_SIZE], ticket[-TAG_SIZE:]
+        if not hmac.compare_digest(mac(self.key, body), tag):
+            return False
+        issued, ticket_vehicle = body.decode().split("|", 1)
+        issued = float(issued)
+        if ticket_vehicle != vehicle_id or not 0 <= now - issued <= self.lifetime:
+            return False
+        if issued <= self.invalidated.get(vehicle_id, -1.0):
+            return False
+        return hmac.compare_digest(mac(self.session_key(ticket), message), proof)
+
+    def invalidate(self, vehicle_id, now=None):
+        now = time.time() if now is None else now
+        # Entries older than one lifetime only cover tickets that have expired anyway
+        for stale in [v for v, t in self.invalidated.items() if now - t > self.lifetime]:
+            del self.invalidated[stale]
+        self.invalidated[vehicle_id] = now
@@ -0,0 +1,144 @@
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from certificate_authority import Blockchain, CertificateAuthority
+from key_registry import KeyRegistry
+from signatures import get_scheme
+from vanet_engine import LANES, RSU_POSITIONS, SimulationEngine
+
+# ----------------- Region-Sharded Simulation ---------------- #
+# The map is a row of regions, each REGION_WIDTH wide with the GUI map's RSU
+# layout. The regions are split into contiguous blocks, one per shard, and
+# every shard runs in its own worker process as a SimulationEngine with only
+# its regions' vehicles and RSUs. The shards advance in lockstep epochs;
+# between epochs the coordinator
+#   - moves vehicles that crossed into another region to that region's shard
+#   - broadcasts the central CA's new revocations to every shard, whose CA
+#     replica records them and has its RSUs sync
+# Each shard's CA replica also enrolls the vehicles that start in its region.
+
+REGION_WIDTH = 800
+HEIGHT = 600
+
+def shard_of(xs, regions, shards):
+    region = np.clip((np.asarray(xs) // REGION_WIDTH).astype(np.int64), 0, regions - 1)
+    return region * shards // regions
+
+def shard_rsus(index, regions, shards):
+    return [(x + region * REGION_WIDTH, y) for region in range(regions)
+            if region * shards // regions == index for x, y in RSU_POSITIONS]
+
+def shard_worker(index, regions, shards, conn, placements, seed, mobility, scheme_name):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = SimulationEngine(0, rsu_positions=shard_rsus(index, regions, shards),
+                                  blockchain=Blockchain(os.path.join(tmp, "chain.jsonl"), fsync_policy="never"),
+                                  key_registry=KeyRegistry(os.path.join(tmp, "keys.db")),
+                                  scheme=get_scheme(scheme_name), seed=seed, start_time=0.0,
+                                  mobility=mobility, width=regions * REGION_WIDTH, height=HEIGHT)
+        for vehicle_id, x, y in placements:
+            engine.add_vehicle(vehicle_id, x, y)
+        conn.send(len(engine.vehicles))
+        while True:
+            message = conn.recv()
+            if message is None:
+                break
+            ticks, revoked, arrivals = message
+            engine.apply_revocations(revoked)
+            for state, motion in arrivals:
+                engine.adopt_vehicle(state, **motion)
+            engine.run(ticks)
+            departures = engine.release_vehicles(shard_of(engine.mobility.x, regions, shards) != index)
+            conn.send(departures)
+        conn.send((dict(engine.results), len(engine.vehicles)))
+        engine.close()
+        engine.blockchain.journal.close()
+        engine.ca.public_key_registry.close()
+
+def run_sharded(vehicles, ticks, regions, shards, epoch_ticks=10, revocations=10, seed=0, mobility="lane",
+                scheme_name=None):
+    """
+    Run `vehicles` vehicles on a map of `regions` regions split over
+    `shards` worker processes for `ticks` ticks, revoking `revocations` of
+    them at evenly spaced epochs. Returns (results, elapsed seconds
+    excluding setup, handoffs).
+    """
+    scheme_name = get_scheme(scheme_name).name
+    rng = random.Random(seed)
+    placements = [[] for _ in range(shards)]
+    for i in range(vehicles):
+        x = rng.uniform(0, regions * REGION_WIDTH)
+        y = rng.choice(LANES) if mobility == "lane" else rng.randint(100, HEIGHT - 100)
+        placements[int(shard_of([x], regions, shards)[0])].append((f"V{i+1}", x, y))
+
+    epochs = -(-ticks // epoch_ticks)
+    to_revoke = rng.sample([f"V{i+1}" for i in range(vehicles)], min(revocations, vehicles))
+    revoke_at = {}  # epoch -> vehicles revoked at its start; several share one when epochs are few
+    for e, vehicle_id in enumerate(to_revoke):
+        revoke_at.setdefault((e + 1) * epochs // (len(to_revoke) + 1), []).append(vehicle_id)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ca = CertificateAuthority(Blockchain(os.path.join(tmp, "chain.jsonl"), fsync_policy="never"),
+                                  get_scheme(scheme_name), KeyRegistry(os.path.join(tmp, "keys.db")))
+        pipes, workers = [], []
+        for index in range(shards):
+            parent, child = multiprocessing.Pipe()
+            worker = multiprocessing.Process(target=shard_worker, args=(
+                index, regions, shards, child, placements[index], seed + index, mobility, scheme_name))
+            worker.start()
+            pipes.append(parent)
+            workers.append(worker)
+        for conn in pipes:
+            conn.recv()  # enrolled
+
+        start = time.perf_counter()
+        arrivals = [[] for _ in range(shards)]
+        handoffs = 0
+        done = 0
+        for epoch in range(epochs):
+            revoked = revoke_at.get(epoch, [])
+            if revoked:
+                ca.revoke_certificates(revoked)
+            step = min(epoch_ticks, ticks - done)
+            for conn, incoming in zip(pipes, arrivals):
+                conn.send((step, revoked, incoming))
+            arrivals = [[] for _ in range(shards)]
+            for conn in pipes:
+                for state, motion in conn.recv():
+                    arrivals[int(shard_of([motion["x"]], regions, shards)[0])].append((state, motion))
+                    handoffs += 1
+            done += step
+        elapsed = time.perf_counter() - start
+
+        results = {}
+        for conn in pipes:
+            conn.send(None)
+            shard_results, _ = conn.recv()
+            for result, count in shard_results.items():
+                results[result] = results.get(result, 0) + count
+        for worker in workers:
+            worker.join()
+        ca.blockchain.journal.close()
+        ca.public_key_registry.close()
+    return results, elapsed, handoffs
+
+if __name__ == "__main__":
+    # python sharded_sim.py [vehicles] [ticks] [regions] [max shards]
+    vehicles = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    ticks = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    regions = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    max_shards = int(sys.argv[4]) if len(sys.argv) > 4 else min(regions, os.cpu_count() or 1)
+    print(f"{vehicles} vehicles on {regions} regions, {ticks} ticks, {os.cpu_count()} cores")
+    base = None
+    shards = 1
+    while shards <= max_shards:
+        results, elapsed, handoffs = run_sharded(vehicles, ticks, regions, shards)
+        base = base or elapsed
+        print(f"{shards:>2} shards: {elapsed:6.2f} s ({base / elapsed:4.1f}x), {handoffs} handoffs, "
+              f"{sum(results.values())} authentications")
+        shards *= 2
@@ -0,0 +1,100 @@
+import os
+from abc import ABC, abstractmethod
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, padding, rsa
+
+# ----------------- Pluggable Signature Schemes ---------------- #
+# Vehicles, RSUs and the CA sign and verify only through a scheme object, so
+# a deployment picks its algorithm in one place: the VANET_SIGNATURE_SCHEME
+# environment variable, or an explicit get_scheme(name).
+
+DEFAULT_SCHEME = "rsa2048"
+
+class SignatureScheme(ABC):
+    name = None
+
+    @abstractmethod
+    def generate_private_key(self):
+        pass
+
+    @abstractmethod
+    def sign(self, private_key, message):
+        pass
+
+    def verify(self, public_key, signature, message):
+        """
+        True if `signature` over `message` is valid for `public_key`.
+        """
+        try:
+            self.check(public_key, signature, message)
+            return True
+        except (InvalidSignature, ValueError, TypeError):
+            return False
+
+    @abstractmethod
+    def check(self, public_key, signature, message):
+        """
+        Raise InvalidSignature (or ValueError/TypeError) unless the signature is valid.
+        """
+
+    def public_bytes(self, public_key):
+        return public_key.public_bytes(encoding=serialization.Encoding.PEM,
+                                       format=serialization.PublicFormat.SubjectPublicKeyInfo)
+
+    def load_public_key(self, data):
+        return serialization.load_pem_public_key(data)
+
+    def private_bytes(self, private_key):
+        # Unencrypted PKCS#8 DER, for moving a simulated vehicle between processes
+        return private_key.private_bytes(encoding=serialization.Encoding.DER,
+                                         format=serialization.PrivateFormat.PKCS8,
+                                         encryption_algorithm=serialization.NoEncryption())
+
+    def load_private_key(self, data):
+        return serialization.load_der_private_key(data, password=None)
+
+class RSA2048Scheme(SignatureScheme):
+    name = "rsa2048"
+
+    def generate_private_key(self):
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    def sign(self, private_key, message):
+        return private_key.sign(message, padding.PKCS1v15(), hashes.SHA256())
+
+    def check(self, public_key, signature, message):
+        public_key.verify(signature, message, padding.PKCS1v15(), hashes.SHA256())
+
+class ECDSAP256Scheme(SignatureScheme):
+    name = "ecdsa-p256"
+
+    def generate_private_key(self):
+        return ec.generate_private_key(ec.SECP256R1())
+
+    def sign(self, private_key, message):
+        return private_key.sign(message, ec.ECDSA(hashes.SHA256()))
+
+    def check(self, public_key, signature, message):
+        public_key.verify(signature, message, ec.ECDSA(hashes.SHA256()))
+
+class Ed25519Scheme(SignatureScheme):
+    name = "ed25519"
+
+    def generate_private_key(self):
+        return ed25519.Ed25519PrivateKey.generate()
+
+    def sign(self, private_key, message):
+        return private_key.sign(message)
+
+    def check(self, public_key, signature, message):
+        public_key.verify(signature, message)
+
+SCHEMES = {scheme.name: scheme for scheme in (RSA2048Scheme(), ECDSAP256Scheme(), Ed25519Scheme())}
+
+def get_scheme(name=None):
+    name = name or os.environ.get("VANET_SIGNATURE_SCHEME", DEFAULT_SCHEME)
+    if name not in SCHEMES:
+        raise ValueError(f"Unknown signature scheme {name!r}; choose from {', '.join(SCHEMES)}")
+    return SCHEMES[name]
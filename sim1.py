@@ -3,6 +3,7 @@ import sys
 import random
 import csv
 import datetime
+from mobility import LaneFollowing
 
 pygame.init()
 WIDTH, HEIGHT = 900, 500
@@ -31,22 +32,18 @@ RSUS = [(100, 170), (450, 170), (800, 170)]
 
 # Car class
 class Car:
-    def __init__(self, x, y, color, name):
-        self.x = x
-        self.y = y
+    # Position and speed live in the shared LaneFollowing arrays, moved all at once per frame
+    def __init__(self, fleet, index, color, name):
+        self.fleet = fleet
+        self.index = index
         self.color = color
         self.name = name
-        self.speed = random.uniform(1.0, 2.5)
-
-    def move(self):
-        self.x += self.speed
-        if self.x > WIDTH:
-            self.x = -70  # reset to left off-screen
 
     def draw(self, surface):
-        pygame.draw.rect(surface, self.color, (int(self.x), self.y, 60, 30))
+        x, y = int(self.fleet.x[self.index]), int(self.fleet.y[self.index])
+        pygame.draw.rect(surface, self.color, (x, y, 60, 30))
         text = font.render(self.name, True, WHITE)
-        surface.blit(text, (int(self.x)+5, self.y+5))
+        surface.blit(text, (x+5, y+5))
 
 # Simple Button class
 class Button:
@@ -112,11 +109,15 @@ def export_logs(log):
     except Exception as e:
         print("Failed to export logs:", e)
 
-def main():
+def main(seed=0):
+    # Lane-following cars, re-entering at x = -70 once they leave the screen.
+    # Speeds and anchor ids come from `seed`, so a run can be repeated exactly.
+    random.seed(seed)
+    fleet = LaneFollowing([150, 400, 650], [230, 230, 230], WIDTH, rng=seed)
     cars = [
-        Car(150, 230, RED, "Car1"),
-        Car(400, 230, GREEN, "Car2"),
-        Car(650, 230, ORANGE, "Car3"),
+        Car(fleet, 0, RED, "Car1"),
+        Car(fleet, 1, GREEN, "Car2"),
+        Car(fleet, 2, ORANGE, "Car3"),
     ]
     logs = []
 
@@ -202,8 +203,8 @@ def main():
                 elif buttons["quit"].is_clicked(pos):
                     running = False
 
+        fleet.step()
         for car in cars:
-            car.move()
             car.draw(screen)
 
         # Display the latest status message on screen (above buttons)
@@ -231,4 +232,5 @@ def main():
     sys.exit()
 
 if __name__ == "__main__":
-    main()
+    # python sim1.py [seed]
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 0)
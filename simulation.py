@@ -1,124 +1,28 @@
 import tkinter as tk
 from tkinter import messagebox
-import random
-import datetime
-import hashlib
 import csv
-import time
-import json
+import sys
 from PIL import Image, ImageTk
-from cryptography.hazmat.primitives.asymmetric import rsa, padding
-from cryptography.hazmat.primitives import serialization, hashes
 import matplotlib.pyplot as plt
 from collections import defaultdict
-# Blockchain components
-class Block:
-    def __init__(self, vehicle_id, certificate, previous_hash):
-        self.vehicle_id = vehicle_id
-        self.certificate = certificate
-        self.timestamp = datetime.datetime.now().isoformat()
-        self.previous_hash = previous_hash
-        self.hash = self.compute_hash()
-
-    def compute_hash(self):
-        block_string = f"{self.vehicle_id}{self.certificate}{self.timestamp}{self.previous_hash}"
-        return hashlib.sha256(block_string.encode()).hexdigest()
-
-class Blockchain:
-    def __init__(self):
-        self.chain = [Block("Genesis", "Initial Block", "0")]
-
-    def add_block(self, vehicle_id, certificate):
-        prev_hash = self.chain[-1].hash
-        new_block = Block(vehicle_id, certificate, prev_hash)
-        self.chain.append(new_block)
-        self.save_to_json()
-
-    def save_to_json(self):
-        data = [{"vehicle_id": b.vehicle_id, "certificate": b.certificate, "timestamp": b.timestamp, "hash": b.hash} for b in self.chain]
-        with open("blockchain.json", "w") as f:
-            json.dump(data, f, indent=4)
-
-# Certificate Authority
-class CertificateAuthority:
-    def __init__(self, blockchain):
-        self.revoked_certs = set()
-        self.blockchain = blockchain
-        self.public_key_registry = set()
-
-    def issue_certificate(self, vehicle_id, public_key):
-        serialized_key = public_key.public_bytes(encoding=serialization.Encoding.PEM,
-                                                 format=serialization.PublicFormat.SubjectPublicKeyInfo)
-        if serialized_key in self.public_key_registry:
-            return "Sybil-Detected"
-        self.public_key_registry.add(serialized_key)
-        cert = f"Cert-{vehicle_id}"
-        self.blockchain.add_block(vehicle_id, cert)
-        return cert
-
-    def revoke_certificate(self, vehicle_id):
-        start_time = time.time()
-        self.revoked_certs.add(vehicle_id)
-        self.blockchain.save_to_json()
-        latency = round((time.time() - start_time)*1000, 2)  # in ms
-        return latency
-
-    def is_revoked(self, vehicle_id):
-        return vehicle_id in self.revoked_certs
-
-# Vehicle
-class Vehicle:
-    def __init__(self, canvas, x, y, vehicle_id, car_img):
-        self.canvas = canvas
-        self.vehicle_id = vehicle_id
-        self.x = x
-        self.y = y
-        self.car_image = car_img
-        self.image_id = canvas.create_image(x, y, image=car_img, anchor='nw')
-        self.label = canvas.create_text(x + 15, y - 10, text=vehicle_id, fill="black")
-        self.cert = None
-        self.private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
-        self.public_key = self.private_key.public_key()
-        self.last_auth_time = 0
-        self.auth_count = 0
-
-    def move(self):
-        dx = random.randint(-5, 5)
-        dy = random.randint(-5, 5)
-        self.canvas.move(self.image_id, dx, dy)
-        self.canvas.move(self.label, dx, dy)
-        self.x += dx
-        self.y += dy
-
-# RSU
-class RSU:
-    def __init__(self, canvas, x, y):
-        self.canvas = canvas
-        self.x = x
-        self.y = y
-        self.rect = canvas.create_rectangle(x, y, x + 30, y + 30, fill="green")
-
-    def authenticate(self, vehicle, ca):
-        now = time.time()
-        if now - vehicle.last_auth_time < 1:
-            return "DoS"
-        vehicle.last_auth_time = now
-        vehicle.auth_count += 1
-
-        if ca.is_revoked(vehicle.vehicle_id):
-            return "Revoked"
-
-        message = b"auth_request"
-        try:
-            signature = vehicle.private_key.sign(message, padding.PKCS1v15(), hashes.SHA256())
-            vehicle.public_key.verify(signature, message, padding.PKCS1v15(), hashes.SHA256())
-            return "Authenticated"
-        except:
-            return "Failed"
+# Chain and CA now live in certificate_authority.py; re-exported for existing imports
+from certificate_authority import (Block, Blockchain, CertificateAuthority, JOURNAL_PATH,
+                                   CHECKPOINT_INTERVAL, SNAPSHOT_INTERVAL)
+from log_view import LogView
+from scenario import build_engine, load_scenario
+from vanet_engine import RSU, SimulationEngine, Vehicle
+from signatures import get_scheme
 
 # VANET Simulation GUI
 class VANETSimulation:
-    def __init__(self, root):
+    """
+    Tk front end for SimulationEngine: draws the engine's vehicles and RSUs
+    after every beacon and shows its log. The engine runs the same without it.
+    Given a scenario (see scenario.py) it plays that seeded run instead of a
+    random five-vehicle one.
+    """
+
+    def __init__(self, root, scenario=None):
         self.root = root
         self.root.title("Secure VANET with Blockchain")
         self.canvas = tk.Canvas(root, width=800, height=600, bg="white")
@@ -127,22 +31,22 @@ class VANETSimulation:
         for y in range(0, 600, 100):
             self.canvas.create_rectangle(380, y, 420, y + 20, fill="black")
 
-        self.blockchain = Blockchain()
-        self.ca = CertificateAuthority(self.blockchain)
+        if scenario is None:
+            self.scheme = get_scheme()  # set VANET_SIGNATURE_SCHEME to rsa2048, ecdsa-p256 or ed25519
+            # The GUI keeps its chain in blockchain.jsonl across runs, as before the engine split
+            self.engine = SimulationEngine(vehicles=5, blockchain=Blockchain(), scheme=self.scheme)
+        else:
+            self.engine = build_engine(scenario)
+            self.scheme = self.engine.scheme
         self.car_img = Image.open("car2.jpg").resize((30, 30))
         self.car_img = ImageTk.PhotoImage(self.car_img)
 
-        self.vehicles = []
-        self.rsus = [RSU(self.canvas, 100, 100), RSU(self.canvas, 600, 400)]
-
-        for i in range(5):
-            v = Vehicle(self.canvas, random.randint(100, 700), random.randint(100, 500), f"V{i+1}", self.car_img)
-            cert = self.ca.issue_certificate(v.vehicle_id, v.public_key)
-            if cert == "Sybil-Detected":
-                self.log(f"[!] Sybil Attack Detected for {v.vehicle_id}")
-            else:
-                v.cert = cert
-                self.vehicles.append(v)
+        for rsu in self.engine.rsus:
+            self.canvas.create_rectangle(rsu.x, rsu.y, rsu.x + 30, rsu.y + 30, fill="green")
+        self.sprites = {}  # vehicle_id -> (image item, label item)
+        for v in self.engine.vehicles:
+            self.sprites[v.vehicle_id] = (self.canvas.create_image(v.x, v.y, image=self.car_img, anchor='nw'),
+                                          self.canvas.create_text(v.x + 15, v.y - 10, text=v.vehicle_id, fill="black"))
 
         self.btn_frame = tk.Frame(root)
         self.btn_frame.pack(pady=5)
@@ -152,54 +56,46 @@ class VANETSimulation:
         tk.Button(self.btn_frame, text="Show Graphs", command=self.plot_graphs).pack(side=tk.LEFT, padx=5)
         tk.Button(self.btn_frame, text="Simulate Attacks", command=self.simulate_attacks).pack(side=tk.LEFT, padx=5)
 
-        self.log_box = tk.Text(root, height=10, width=100)
+        self.log_box = LogView(root, height=10, width=100)  # recent lines; all of them go to its history file
         self.log_box.pack(pady=5)
-        self.auth_times = []
-        self.auth_labels = []
-        self.revocation_latencies = []
-        self.revocation_counts = []
-        self.revoked_count = 0
+        self.engine.observers.append(self)
+
+    # Engine observer callbacks
+    def on_log(self, msg):
+        self.log(msg)
+
+    def on_tick(self, engine):
+        # Positions are read from the engine's mobility arrays only here, when drawing
+        xs, ys = engine.mobility.x.tolist(), engine.mobility.y.tolist()
+        for v, x, y in zip(engine.vehicles, xs, ys):
+            image_id, label = self.sprites[v.vehicle_id]
+            self.canvas.coords(image_id, x, y)
+            self.canvas.coords(label, x + 15, y - 10)
 
     def log(self, msg):
-        self.log_box.insert(tk.END, msg + "\n")
-        self.log_box.see(tk.END)
+        self.log_box.write(msg)
 
     def start_simulation(self):
         self.simulate()
 
     def simulate(self):
-        for v in self.vehicles:
-            v.move()
-            for rsu in self.rsus:
-                if abs(v.x - rsu.x) < 50 and abs(v.y - rsu.y) < 50:
-                    t0 = time.time()
-                    result = rsu.authenticate(v, self.ca)
-                    latency = round((time.time() - t0)*1000, 2)
-                    self.auth_times.append(latency)
-                    self.auth_labels.append(v.vehicle_id)
-                    ts = datetime.datetime.now().strftime("%H:%M:%S")
-                    if result == "Authenticated":
-                        self.log(f"[{ts}] {v.vehicle_id} authenticated in {latency} ms")
-                    elif result == "Revoked":
-                        self.log(f"[{ts}] {v.vehicle_id} is revoked")
-                    elif result == "DoS":
-                        self.log(f"[{ts}] DoS Detected from {v.vehicle_id}")
-                    else:
-                        self.log(f"[{ts}] {v.vehicle_id} authentication failed")
-        self.root.after(1000, self.simulate)
+        # Run the engine's next due events, then wait (one simulated second
+        # per wall second) until the event after them is due
+        scheduler = self.engine.scheduler
+        when = scheduler.next_time()
+        if when is not None:
+            scheduler.run(until=when)
+        when = scheduler.next_time()
+        delay = 1000 if when is None else int((when - scheduler.now) * 1000)
+        self.root.after(delay, self.simulate)
 
     def revoke_random(self):
-        v = random.choice(self.vehicles)
-        latency = self.ca.revoke_certificate(v.vehicle_id)
-        self.revoked_count += 1
-        self.revocation_latencies.append(latency)
-        self.revocation_counts.append(self.revoked_count)
-        self.log(f"[!] {v.vehicle_id} has been revoked. Revocation Latency: {latency} ms")
+        self.engine.revoke_random()
 
     def export_logs(self):
         with open("vanet_log.csv", "w", newline='') as f:
             writer = csv.writer(f)
-            for line in self.log_box.get("1.0", tk.END).splitlines():
+            for line in self.log_box.history_lines():
                 writer.writerow([line])
         messagebox.showinfo("Exported", "Logs saved to vanet_log.csv")
 
@@ -208,7 +104,7 @@ class VANETSimulation:
     def plot_graphs(self):
         # Group and average authentication time per vehicle
         vehicle_times = defaultdict(list)
-        for vid, t in zip(self.auth_labels, self.auth_times):
+        for vid, t in zip(self.engine.auth_labels, self.engine.auth_times):
             vehicle_times[vid].append(t)
 
         avg_times = {vid: sum(times) / len(times) for vid, times in vehicle_times.items()}
@@ -229,7 +125,7 @@ class VANETSimulation:
 
         # --------- Plot 2: Revocation Latency --------- #
         plt.subplot(1, 2, 2)
-        plt.plot(self.revocation_counts, self.revocation_latencies, marker='x', color='red')
+        plt.plot(self.engine.revocation_counts, self.engine.revocation_latencies, marker='x', color='red')
         plt.title("Revocation Latency vs Revoked Vehicles")
         plt.xlabel("Revoked Vehicle Count")
         plt.ylabel("Latency (ms)")
@@ -239,28 +135,10 @@ class VANETSimulation:
         plt.show()
 
     def simulate_attacks(self):
-        ts = datetime.datetime.now().strftime("%H:%M:%S")
-        self.log(f"[{ts}]  Simulating Sybil Attack...")
-        fake_vehicle = Vehicle(self.canvas, 400, 300, "V1", self.car_img)  # duplicate ID
-        cert = self.ca.issue_certificate(fake_vehicle.vehicle_id, fake_vehicle.public_key)
-        if cert == "Sybil-Detected":
-            self.log(f"[{ts}]  Sybil Attack Detected and Blocked")
-
-        self.log(f"[{ts}] Simulating Replay Attack...")
-        v = self.vehicles[0]
-        v.last_auth_time = time.time() - 5  # accept
-        rsu = self.rsus[0]
-        result = rsu.authenticate(v, self.ca)
-        if result == "Authenticated":
-            self.log(f"[{ts}]  Replay Attack Prevented (Fresh Timestamp Verified)")
-
-        self.log(f"[{ts}] Simulating DoS Attack...")
-        v.last_auth_time = time.time()
-        result = rsu.authenticate(v, self.ca)
-        if result == "DoS":
-            self.log(f"[{ts}]  DoS Attack Detected and Blocked")
+        self.engine.simulate_attacks()
 
 if __name__ == "__main__":
+    # python simulation.py [scenario.json]
     root = tk.Tk()
-    app = VANETSimulation(root)
+    app = VANETSimulation(root, load_scenario(sys.argv[1]) if len(sys.argv) > 1 else None)
     root.mainloop()
@@ -0,0 +1,54 @@
+import collections
+import math
+
+import numpy as np
+
+# ----------------- RSU Coverage Grid ---------------- #
+class RSUGrid:
+    """
+    Uniform grid over the RSUs' coverage squares, so finding the RSUs a
+    vehicle can reach looks at one cell instead of every RSU.
+
+    An RSU at (x, y) covers the open square |dx| < radius, |dy| < radius.
+    Cells are 2 * radius wide, so each RSU is listed in at most four cells
+    and a vehicle only has to check the RSUs listed in its own cell.
+    """
+
+    def __init__(self, rsus=(), radius=50):
+        self.radius = radius
+        self.cell_size = 2 * radius
+        self.cells = collections.defaultdict(list)  # (column, row) -> RSUs whose coverage touches the cell
+        self.cell_keys = None  # sorted keys of the non-empty cells, for near()
+        for rsu in rsus:
+            self.add(rsu)
+
+    def cell(self, x, y):
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def add(self, rsu):
+        first_col, first_row = self.cell(rsu.x - self.radius, rsu.y - self.radius)
+        last_col, last_row = self.cell(rsu.x + self.radius, rsu.y + self.radius)
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                self.cells[col, row].append(rsu)
+        self.cell_keys = None
+
+    def covering(self, x, y):
+        """
+        RSUs whose coverage contains (x, y), in the order they were added.
+        """
+        candidates = self.cells.get(self.cell(x, y))
+        if not candidates:
+            return []
+        radius = self.radius
+        return [rsu for rsu in candidates if abs(x - rsu.x) < radius and abs(y - rsu.y) < radius]
+
+    def near(self, xs, ys):
+        """
+        Indices of the positions (NumPy arrays) that fall in a cell with any
+        RSU listed; only those need covering().
+        """
+        if self.cell_keys is None:
+            self.cell_keys = np.array(sorted((col << 32) + row for col, row in self.cells), dtype=np.int64)
+        keys = (np.floor(xs / self.cell_size).astype(np.int64) << 32) + np.floor(ys / self.cell_size).astype(np.int64)
+        return np.flatnonzero(np.isin(keys, self.cell_keys))
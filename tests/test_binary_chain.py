@@ -0,0 +1,47 @@
+import json
+
+from binary_chain import BinaryChainJournal, BinaryChainReader, StringTable, convert, read_records
+
+def make_records(count):
+    records = [{"vehicle_id": "Genesis", "action": "init", "timestamp": "2025-06-30T23:00:00.000001",
+                "previous_hash": "0", "hash": "ab" * 32}]
+    for i in range(1, count):
+        records.append({"vehicle_id": f"V{i}", "action": "revoked",
+                        "timestamp": f"2025-06-30T23:00:{i % 60:02d}.{i:06d}",
+                        "previous_hash": records[-1]["hash"], "hash": f"{i:064x}"})
+    records[-1]["entries"] = [["V1", "revoked"], ["PC-é", "revoked"]]
+    return records
+
+def test_vbc_round_trip(tmp_path):
+    src = tmp_path / "chain.json"
+    records = make_records(20)
+    src.write_text(json.dumps(records))
+    assert convert(str(src), str(tmp_path / "chain.vbc")) == 20
+    reader = BinaryChainReader(str(tmp_path / "chain.vbc"))
+    assert len(reader) == 20
+    assert [reader[i] for i in range(20)] == read_records(str(src))
+    assert reader[-1]["entries"] == [["V1", "revoked"], ["PC-é", "revoked"]]
+    reader.close()
+
+def test_torn_string_tail_does_not_shift_ids(tmp_path):
+    path = str(tmp_path / "chain.vbc")
+    journal = BinaryChainJournal(path, fsync_policy="never")
+    journal.append_many(make_records(5))
+    journal.close()
+    with open(path + ".strings", "ab") as f:
+        f.write(b"V9")  # a string whose index entry never made it to disk
+
+    table = StringTable(path + ".strings")
+    strings = table.count
+    table.close()
+    journal = BinaryChainJournal(path, fsync_policy="never")
+    assert len(journal.load()) == 5
+    record = dict(make_records(6)[-1], vehicle_id="V-new")
+    del record["entries"]
+    journal.append(record)
+    journal.close()
+
+    reader = BinaryChainReader(path)
+    assert len(reader.strings) == strings + 1
+    assert [reader[i]["vehicle_id"] for i in range(6)] == ["Genesis", "V1", "V2", "V3", "V4", "V-new"]
+    reader.close()
@@ -0,0 +1,46 @@
+import pytest
+
+from blockchain import Blockchain, verify_revocation_proof
+
+def make_chain(tmp_path):
+    return Blockchain(str(tmp_path / "revocations.jsonl"), fsync_policy="never")
+
+def test_batch_proofs_verify_for_their_own_vehicle_only(tmp_path):
+    chain = make_chain(tmp_path)
+    vehicle_ids = [f"V{i}" for i in range(13)]  # odd sizes exercise carried-up nodes
+    block = chain.add_revocation_batch(vehicle_ids)
+    for vehicle_id in vehicle_ids:
+        proof = chain.revocation_proof(vehicle_id)
+        assert verify_revocation_proof(proof, vehicle_id, block.hash)
+        assert not verify_revocation_proof(proof, "V99", block.hash)
+    assert chain.revocation_proof("V99") is None
+
+def test_tampered_proof_is_rejected(tmp_path):
+    chain = make_chain(tmp_path)
+    block = chain.add_revocation_batch(["V1", "V2", "V3"])
+    proof = chain.revocation_proof("V2")
+    proof["proof"][0][0] = "00" * 32
+    assert not verify_revocation_proof(proof, "V2", block.hash)
+    assert not verify_revocation_proof(chain.revocation_proof("V2"), "V2", "00" * 32)
+
+def test_single_block_revocation_has_a_proof(tmp_path):
+    chain = make_chain(tmp_path)
+    chain.add_block("V7", "revoked")
+    proof = chain.revocation_proof("V7")
+    assert proof["proof"] == []
+    assert verify_revocation_proof(proof, "V7", chain.chain[-1].hash)
+    assert not verify_revocation_proof(proof, "V8", chain.chain[-1].hash)
+
+def test_empty_batch_is_rejected(tmp_path):
+    chain = make_chain(tmp_path)
+    with pytest.raises(ValueError):
+        chain.add_revocation_batch([])
+    assert len(chain.chain) == 1
+    assert "Batch" not in chain.revoked
+
+def test_only_revoked_entries_have_proofs(tmp_path):
+    chain = make_chain(tmp_path)
+    chain.add_revocation_batch(["V1", "V2"], action="suspended")
+    assert chain.revocation_proof("V1") is None
+    block = chain.add_revocation_batch(["V2", "V3"])
+    assert verify_revocation_proof(chain.revocation_proof("V2"), "V2", block.hash)
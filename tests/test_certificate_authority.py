@@ -0,0 +1,51 @@
+from certificate_authority import Blockchain, CertificateAuthority
+from key_registry import KeyRegistry
+from signatures import get_scheme
+
+def make_ca(tmp_path, snapshot_interval=10000):
+    blockchain = Blockchain(str(tmp_path / "chain.jsonl"), fsync_policy="never", snapshot_interval=snapshot_interval)
+    return CertificateAuthority(blockchain, key_registry=KeyRegistry(str(tmp_path / "keys.db")))
+
+def test_revoked_vehicles_get_an_empty_pool(tmp_path):
+    ca = make_ca(tmp_path)
+    ca.revoke_certificate("V2")
+    pools = ca.issue_pseudonyms(["V1", "V2", "V3"], 4)
+    assert sorted(pools) == ["V1", "V2", "V3"]
+    assert pools["V2"] == []
+    assert len(pools["V1"]) == len(set(pools["V1"])) == 4
+    ca.public_key_registry.close()
+
+def test_whole_pool_survives_snapshot_and_journal_resume(tmp_path):
+    ca = make_ca(tmp_path, snapshot_interval=5)
+    pools = ca.issue_pseudonyms(["V1", "V2"], 4)  # snapshot taken inside this batch
+    more = ca.issue_pseudonyms(["V1"], 2)
+    ca.public_key_registry.close()
+
+    resumed = make_ca(tmp_path, snapshot_interval=5)
+    assert resumed.blockchain.snapshot_height > 0
+    assert resumed.blockchain.certificates["V1"] == pools["V1"] + more["V1"]
+    assert resumed.blockchain.certificates["V2"] == pools["V2"]
+    resumed.public_key_registry.close()
+
+def test_key_registry_defaults_to_memory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    registry = KeyRegistry()
+    assert registry.register(b"key", "V1")
+    assert not registry.register(b"key", "V2")
+    assert registry.owner(b"key") == "V1"
+    registry.close()
+    assert list(tmp_path.iterdir()) == []
+
+def test_default_registry_persists_beside_the_chain(tmp_path):
+    scheme = get_scheme("ed25519")
+    key = scheme.generate_private_key().public_key()
+    blockchain = Blockchain(str(tmp_path / "chain.jsonl"), fsync_policy="never")
+    ca = CertificateAuthority(blockchain, scheme)
+    assert ca.issue_certificate("V1", key) == "Cert-V1"
+    ca.public_key_registry.close()
+    blockchain.journal.close()
+
+    assert (tmp_path / ("chain.jsonl" + ".keys.db")).exists()
+    restarted = CertificateAuthority(Blockchain(str(tmp_path / "chain.jsonl"), fsync_policy="never"), scheme)
+    assert restarted.issue_certificate("V2", key) == "Sybil-Detected"
+    restarted.public_key_registry.close()
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from blockchain import Blockchain
+
+def make_chain(path, **intervals):
+    return Blockchain(str(path), fsync_policy="never", **intervals)
+
+def tamper(path, line_number):
+    with open(path) as f:
+        lines = f.readlines()
+    record = json.loads(lines[line_number])
+    record["action"] = "restored"
+    lines[line_number] = json.dumps(record) + "\n"
+    with open(path, "w") as f:
+        f.writelines(lines)
+
+def test_blocks_after_the_checkpoint_are_verified(tmp_path):
+    path = tmp_path / "revocations.jsonl"
+    chain = make_chain(path, checkpoint_interval=4)
+    for i in range(6):
+        chain.add_block(f"V{i}", "revoked")
+    assert chain.checkpoint_height == 4
+    chain.journal.close()
+
+    tamper(path, 5)
+    with pytest.raises(ValueError, match="Block 5"):
+        make_chain(path, checkpoint_interval=4)
+
+def test_blocks_up_to_the_checkpoint_are_trusted(tmp_path):
+    path = tmp_path / "revocations.jsonl"
+    chain = make_chain(path, checkpoint_interval=4)
+    for i in range(6):
+        chain.add_block(f"V{i}", "revoked")
+    chain.journal.close()
+
+    tamper(path, 2)  # not re-hashed on restart
+    resumed = make_chain(path, checkpoint_interval=4)
+    assert len(resumed.chain) == 7
+    resumed.journal.close()
+
+def test_resume_from_snapshot_replays_only_the_tail(tmp_path):
+    path = tmp_path / "revocations.jsonl"
+    chain = make_chain(path, snapshot_interval=5)
+    for i in range(12):
+        chain.add_block(f"V{i}", "revoked")
+    chain.add_revocation_batch(["V20", "V21"])
+    revoked, tip = dict(chain.revoked), chain.chain[-1].hash
+    chain.journal.close()
+
+    resumed = make_chain(path, snapshot_interval=5)
+    assert resumed.snapshot_height == 10
+    assert resumed.revoked == revoked
+    assert len(resumed.chain) == 14
+    assert resumed.chain[-1].hash == tip
+    assert resumed.chain[3].vehicle_id == "V2"  # blocks before the snapshot load on demand
+    assert resumed.revocation_proof("V21") is not None
+    resumed.journal.close()
+
+def test_stale_snapshot_falls_back_to_full_replay(tmp_path):
+    path = tmp_path / "revocations.jsonl"
+    chain = make_chain(path, snapshot_interval=5)
+    for i in range(6):
+        chain.add_block(f"V{i}", "revoked")
+    chain.journal.close()
+    snapshot_path = str(path) + ".snapshot"
+    with open(snapshot_path) as f:
+        snapshot = json.load(f)
+    snapshot["tip"]["hash"] = "00" * 32
+    with open(snapshot_path, "w") as f:
+        json.dump(snapshot, f)
+
+    resumed = make_chain(path, snapshot_interval=5)
+    assert sorted(resumed.revoked) == [f"V{i}" for i in range(6)]
+    resumed.journal.close()
@@ -0,0 +1,54 @@
+from event_scheduler import EventScheduler
+
+def test_events_run_in_time_then_schedule_order():
+    scheduler = EventScheduler(start_time=10.0)
+    ran = []
+    scheduler.schedule(2.0, ran.append, "c")
+    scheduler.schedule(1.0, ran.append, "a")
+    scheduler.at(11.0, ran.append, "b")
+    scheduler.schedule(0.5, ran.append, "first")
+    assert scheduler.run() == 4
+    assert ran == ["first", "a", "b", "c"]
+    assert scheduler.now == 12.0
+
+def test_handlers_can_schedule_more_events():
+    scheduler = EventScheduler()
+    ran = []
+
+    def ping(n):
+        ran.append((scheduler.now, n))
+        if n < 3:
+            scheduler.schedule(1.0, ping, n + 1)
+            scheduler.schedule(0, ran.append, (scheduler.now, "now"))
+
+    scheduler.schedule(0, ping, 0)
+    scheduler.run()
+    assert ran == [(0.0, 0), (0.0, "now"), (1.0, 1), (1.0, "now"), (2.0, 2), (2.0, "now"), (3.0, 3)]
+
+def test_run_until_leaves_later_events_and_advances_the_clock():
+    scheduler = EventScheduler()
+    ran = []
+    for t in (1.0, 2.0, 3.0):
+        scheduler.at(t, ran.append, t)
+    assert scheduler.run(until=2.0) == 2
+    assert ran == [1.0, 2.0]
+    assert scheduler.now == 2.0
+    assert scheduler.run(until=2.5) == 0
+    assert scheduler.now == 2.5
+    assert scheduler.next_time() == 3.0
+
+def test_cancelled_events_never_run():
+    scheduler = EventScheduler()
+    ran = []
+    event = scheduler.at(1.0, ran.append, "cancelled")
+    scheduler.at(2.0, ran.append, "kept")
+    scheduler.cancel(event)
+    assert scheduler.next_time() == 2.0
+    scheduler.run()
+    assert ran == ["kept"]
+    assert scheduler.processed == 1
+
+def test_past_events_run_now():
+    scheduler = EventScheduler(start_time=5.0)
+    event = scheduler.at(1.0, lambda: None)
+    assert event[0] == 5.0
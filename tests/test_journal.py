@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+import journal as journal_module
+from journal import ChainJournal
+
+def records(count):
+    return [{"vehicle_id": f"V{i}", "action": "revoked"} for i in range(count)]
+
+def test_torn_tail_is_cut_off_and_appends_start_clean(tmp_path):
+    path = str(tmp_path / "chain.jsonl")
+    journal = ChainJournal(path, fsync_policy="never")
+    journal.append_many(records(3))
+    journal.file.write(b'{"vehicle_id":"V3","act')  # crash mid-write
+    journal.file.flush()
+
+    assert journal.load() == records(3)
+    journal.append(records(5)[4])
+    journal.close()
+    with open(path, "rb") as f:
+        lines = f.read().split(b"\n")
+    assert lines[-1] == b""
+    assert [json.loads(line) for line in lines[:-1]] == records(3) + [records(5)[4]]
+
+def test_load_resumes_from_an_offset(tmp_path):
+    journal = ChainJournal(str(tmp_path / "chain.jsonl"), fsync_policy="never")
+    journal.append_many(records(2))
+    offset = journal.tell()
+    journal.append_many(records(4)[2:])
+    assert journal.load(offset) == records(4)[2:]
+    assert journal.load(0, offset) == records(2)
+    journal.close()
+
+@pytest.mark.parametrize("policy, interval, appends_synced, close_synced", [
+    ("always", 1.0, 3, 1),
+    ("interval", 0.0, 3, 1),
+    ("interval", 3600.0, 0, 1),
+    ("never", 1.0, 0, 0),
+])
+def test_fsync_policies(tmp_path, monkeypatch, policy, interval, appends_synced, close_synced):
+    synced = []
+    monkeypatch.setattr(journal_module.os, "fsync", synced.append)
+    journal = ChainJournal(str(tmp_path / "chain.jsonl"), fsync_policy=policy, fsync_interval=interval)
+    for record in records(3):
+        journal.append(record)
+    assert len(synced) == appends_synced
+    journal.close()
+    assert len(synced) == appends_synced + close_synced
+
+def test_unknown_fsync_policy_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        ChainJournal(str(tmp_path / "chain.jsonl"), fsync_policy="sometimes")
+
+def test_load_tail_reads_back_from_the_end(tmp_path, monkeypatch):
+    monkeypatch.setattr(journal_module, "TAIL_CHUNK", 16)  # many chunks, records split across them
+    journal = ChainJournal(str(tmp_path / "chain.jsonl"), fsync_policy="never")
+    journal.append_many(records(20))
+    offset = journal.tell()
+    journal.append_many(records(25)[20:])
+    assert journal.load_tail(3) == records(25)[22:]
+    assert journal.load_tail(4, offset) == records(20)[16:]
+    assert journal.load_tail(100) == records(25)
+    assert journal.load_tail(0) == []
+    journal.file.write(b'{"torn')
+    assert journal.load_tail(2) == records(25)[23:]
+    journal.close()
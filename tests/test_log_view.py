@@ -0,0 +1,99 @@
+import tkinter as tk
+from types import SimpleNamespace
+
+import pytest
+
+import log_view
+from blockchain import Blockchain, RevocationApp
+
+class FakeText:
+    """Just enough of tk.Text to run LogView without a display."""
+
+    def __init__(self, root, **options):
+        self.content = ""
+
+    def offset(self, index):
+        if index == tk.END:
+            return len(self.content)
+        line = int(index.split(".")[0])
+        pos = 0
+        for _ in range(line - 1):
+            pos = self.content.index("\n", pos) + 1
+        return pos
+
+    def insert(self, index, text):
+        pos = self.offset(index)
+        self.content = self.content[:pos] + text + self.content[pos:]
+
+    def delete(self, start, end):
+        self.content = self.content[:self.offset(start)] + self.content[self.offset(end):]
+
+    def see(self, index):
+        pass
+
+class FakeRoot:
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, callback):
+        self.callbacks.append(callback)
+        return len(self.callbacks)
+
+    def after_cancel(self, event):
+        pass
+
+    def run(self):
+        redraws = 0
+        while self.callbacks:
+            self.callbacks.pop(0)()
+            redraws += 1
+        return redraws
+
+@pytest.fixture
+def view(monkeypatch, tmp_path):
+    monkeypatch.setattr(log_view.tk, "Text", FakeText)
+    root = FakeRoot()
+    view = log_view.LogView(root, lines=10, history_path=str(tmp_path / "history.log"))
+    yield view
+    view.close()
+
+def test_view_is_bounded_and_redraws_coalesce(view):
+    for i in range(1000):
+        view.write(f"line {i}")
+    assert view.root.run() == 1
+    assert view.text.content == "".join(f"line {i}\n" for i in range(990, 1000))
+    for i in range(1000, 1003):
+        view.write(f"line {i}")
+    view.root.run()
+    assert view.text.content == "".join(f"line {i}\n" for i in range(993, 1003))
+
+def test_history_is_complete_and_on_disk(view, tmp_path):
+    for i in range(100):
+        view.write(f"line {i}")
+    assert list(view.history_lines()) == [f"line {i}" for i in range(100)]
+    view.write("after export")  # reading back must not disturb appends
+    assert list(view.history_lines())[-2:] == ["line 99", "after export"]
+    assert (tmp_path / "history.log").read_text().count("\n") == 101
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".vbc"])
+def test_show_blockchain_reads_only_the_tail(view, tmp_path, suffix):
+    path = str(tmp_path / ("revocations" + suffix))
+    blockchain = Blockchain(path, fsync_policy="never", snapshot_interval=100)
+    for i in range(200):
+        blockchain.add_block(f"V{i}", "revoked")
+    blockchain.add_revocation_batch(["P1", "P2"])
+    blockchain.add_block("V200", "revoked")
+    blockchain.journal.close()
+
+    resumed = Blockchain(path, fsync_policy="never", snapshot_interval=100)
+    base = resumed.chain.base
+    assert base == 200  # the tail below crosses it
+    app = SimpleNamespace(blockchain=resumed, output_box=view)
+    RevocationApp.show_blockchain(app)
+    view.root.run()
+    lines = view.text.content.splitlines()
+    assert lines[:2] == ["Blockchain Revocation Log:", ""]
+    expected = [f"V{i}" for i in range(195, 200)] + ["P1", "P2", "V200"]  # the 8 newest entries
+    assert [line.split("] ")[1] for line in lines[2:]] == [f"{v} => revoked" for v in expected]
+    assert resumed.chain.base == base  # history was never loaded
+    resumed.journal.close()
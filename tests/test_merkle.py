@@ -0,0 +1,22 @@
+from merkle import build_levels, entry_leaf, merkle_proof, merkle_root, proof_from_levels, verify_proof
+
+def leaves(count):
+    return [entry_leaf(f"V{i}", "revoked") for i in range(count)]
+
+def test_every_leaf_proves_against_the_root():
+    for count in range(1, 18):
+        data = leaves(count)
+        root = merkle_root(data)
+        levels = build_levels(data)
+        for index, leaf in enumerate(data):
+            proof = merkle_proof(data, index)
+            assert proof == proof_from_levels(levels, index)
+            assert len(proof) <= max(1, (count - 1).bit_length())
+            assert verify_proof(leaf, proof, root)
+
+def test_proof_does_not_carry_over_to_another_leaf():
+    data = leaves(6)
+    root = merkle_root(data)
+    proof = merkle_proof(data, 2)
+    assert not verify_proof(data[3], proof, root)
+    assert not verify_proof(entry_leaf("V2", "restored"), proof, root)
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from mobility import LaneFollowing, Mobility, RandomWalk
+
+def test_model_without_step_fails_at_construction():
+    class Parked(Mobility):
+        pass
+
+    with pytest.raises(TypeError):
+        Parked([0.0], [0.0])
+
+def test_same_seed_same_moves():
+    walks = [RandomWalk([100.0] * 50, [200.0] * 50, rng=7) for _ in range(2)]
+    for walk in walks:
+        for _ in range(10):
+            walk.step()
+    assert np.array_equal(walks[0].x, walks[1].x)
+    assert np.array_equal(walks[0].y, walks[1].y)
+
+def test_lane_remove_keeps_speed_for_add():
+    lanes = LaneFollowing([10.0, 20.0, 30.0], [130.0] * 3, 800, rng=1)
+    speed = float(lanes.speed[1])
+    removed = lanes.remove(np.array([False, True, False]))
+    assert removed == [{"x": 20.0, "y": 130.0, "speed": speed}]
+    index = lanes.add(**removed[0])
+    assert lanes.speed[index] == speed
+    assert list(lanes.x) == [10.0, 30.0, 20.0]
@@ -0,0 +1,37 @@
+from rate_limiter import RateLimiter
+
+def test_burst_then_steady_rate():
+    limiter = RateLimiter(rate=2.0, burst=3)
+    assert [limiter.allow("V1", now=0.0) for _ in range(4)] == [True, True, True, False]
+    assert not limiter.allow("V1", now=0.4)
+    assert limiter.allow("V1", now=0.5)  # one token back every 1/rate seconds
+    assert not limiter.allow("V1", now=0.5)
+
+def test_identities_have_separate_buckets():
+    limiter = RateLimiter(rate=1.0, burst=1)
+    assert limiter.allow("V1", now=0.0)
+    assert not limiter.allow("V1", now=0.1)
+    assert limiter.allow("V2", now=0.1)
+
+def test_denied_requests_do_not_drain_the_bucket():
+    limiter = RateLimiter(rate=1.0, burst=1)
+    assert limiter.allow("V1", now=0.0)
+    for t in (0.2, 0.4, 0.6, 0.8):
+        assert not limiter.allow("V1", now=t)
+    assert limiter.allow("V1", now=1.0)
+
+def test_full_buckets_are_evicted():
+    limiter = RateLimiter(rate=1.0, burst=2)
+    for i in range(100):
+        limiter.allow(f"V{i}", now=0.0)
+    assert len(limiter) == 100
+    limiter.allow("V-late", now=10.0)
+    assert len(limiter) == 1
+
+def test_memory_is_bounded():
+    limiter = RateLimiter(rate=1.0, burst=1, max_entries=10)
+    for i in range(50):
+        limiter.allow(f"V{i}", now=0.0)
+    assert len(limiter) == 10
+    assert limiter.allow("V0", now=0.0)  # forgotten, so let through early
+    assert not limiter.allow("V49", now=0.0)
@@ -0,0 +1,52 @@
+from replay_cache import MIN_CAPACITY, ReplayCache, auth_request, is_challenge, issue_challenge, parse_request
+
+def test_replayed_nonce_is_rejected():
+    cache = ReplayCache(window=30.0, capacity=1000)
+    assert cache.check("V1|nonce-a", 100.0, now=100.0)
+    assert not cache.check("V1|nonce-a", 100.0, now=101.0)
+    assert cache.check("V1|nonce-b", 100.0, now=101.0)
+    assert cache.check("V2|nonce-a", 100.0, now=101.0)
+
+def test_stale_and_future_timestamps_are_rejected():
+    cache = ReplayCache(window=30.0, capacity=1000)
+    assert not cache.check("V1|old", 60.0, now=100.0)
+    assert not cache.check("V1|future", 140.0, now=100.0)
+    assert cache.check("V1|edge", 70.0, now=100.0)
+
+def test_nonce_is_remembered_for_as_long_as_its_timestamp_is_fresh():
+    cache = ReplayCache(window=30.0, capacity=1000)
+    assert cache.check("V1|n", 100.0, now=100.0)
+    for now in range(100, 131, 5):
+        assert not cache.check("V1|n", 100.0, now=float(now))
+    assert not cache.check("V1|n", 100.0, now=131.0)  # now rejected as stale
+
+def test_memory_does_not_grow_with_traffic():
+    cache = ReplayCache(window=30.0, capacity=1000)
+    size = cache.nbytes()
+    for i in range(5000):
+        cache.check(f"V{i}|n", 100.0 + i / 100, now=100.0 + i / 100)
+    assert cache.nbytes() == size
+
+def test_challenges_are_bound_to_key_and_vehicle():
+    key = b"k" * 32
+    nonce = issue_challenge(key, "V1")
+    assert is_challenge(key, "V1", nonce)
+    assert not is_challenge(key, "V2", nonce)
+    assert not is_challenge(b"x" * 32, "V1", nonce)
+    assert issue_challenge(key, "V1") != nonce
+
+def test_request_round_trip():
+    assert parse_request(auth_request("ab" * 16, now=12.5)) == (12.5, "ab" * 16)
+    assert parse_request(b"hello|1.0|ab") is None
+    assert parse_request(b"garbage") is None
+
+def test_non_finite_timestamps_are_malformed():
+    for timestamp in ("nan", "inf", "-inf"):
+        assert parse_request(f"auth_request|{timestamp}|{'ab' * 16}".encode()) is None
+
+def test_cache_is_sized_from_the_request_rate():
+    quiet, busy = ReplayCache.for_rate(1.0), ReplayCache.for_rate(1000.0)
+    assert quiet.capacity == MIN_CAPACITY
+    assert busy.capacity == 1000 * 15  # 60 s of freshness over 4 slices
+    assert quiet.nbytes() < 2048
+    assert ReplayCache.for_rate(100.0, window=10.0).window == 10.0
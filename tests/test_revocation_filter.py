@@ -0,0 +1,54 @@
+from revocation_filter import BloomFilter, RevocationFilter, item_hashes
+from rsu_sync import RevocationFilterLog
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000, fp_rate=0.01)
+    ids = [f"PSN-{i}" for i in range(1000)]
+    for vehicle_id in ids:
+        bloom.add(vehicle_id)
+    assert all(vehicle_id in bloom for vehicle_id in ids)
+
+def test_bloom_filter_false_positive_rate_is_near_target():
+    bloom = BloomFilter(1000, fp_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"PSN-{i}")
+    false_positives = sum(f"other-{i}" in bloom for i in range(20000))
+    assert false_positives / 20000 < 0.02
+
+def test_growing_filter_keeps_every_id_and_its_rate():
+    revocation_filter = RevocationFilter(initial_capacity=64, fp_rate=0.01)
+    ids = [f"PSN-{i}" for i in range(2000)]
+    for vehicle_id in ids:
+        revocation_filter.add(vehicle_id)
+    assert len(revocation_filter.stages) > 1
+    assert len(revocation_filter) == 2000
+    assert all(revocation_filter.might_contain(vehicle_id) for vehicle_id in ids)
+    # The stages' rates add up to about fp_rate; tiny early stages run a
+    # little over their share, so allow some slack
+    false_positives = sum(f"other-{i}" in revocation_filter for i in range(20000))
+    assert false_positives / 20000 < 0.02
+
+def test_stages_share_one_digest():
+    revocation_filter = RevocationFilter(initial_capacity=16, fp_rate=0.01)
+    for i in range(100):
+        revocation_filter.add(f"PSN-{i}")
+    for i in range(2000):
+        probe = f"other-{i}"
+        h1, h2, h3 = item_hashes(probe)
+        per_stage = [stage.contains_hashes(h1, h2, h3) for stage in revocation_filter.stages]
+        assert per_stage == [probe in stage for stage in revocation_filter.stages]
+        assert revocation_filter.might_contain(probe) == any(per_stage)
+
+def test_low_fp_rate_holds():
+    # With plain double hashing items sharing a step overlapped almost
+    # completely, so a filter asked for 2e-7 answered wrongly about 1 in 10^5
+    bloom = BloomFilter(1500, 2e-7)
+    for i in range(1500):
+        bloom.add(f"V{i}|{i:032x}")
+    assert not any(f"other-{i}" in bloom for i in range(300000))
+
+def test_rsu_log_takes_the_filter_settings():
+    log = RevocationFilterLog(capacity=5000, fp_rate=0.001)
+    stage = log.revocation_filter.stages[0]
+    assert stage.capacity == 5000
+    assert log.revocation_filter.fp_rate == 0.001
@@ -0,0 +1,57 @@
+import json
+
+from rsu_sync import RevocationFilterLog, RevocationLog, SyncServer, pull_from
+
+def test_entries_since_returns_only_the_delta():
+    log = RevocationLog()
+    for height in range(1, 6):
+        log.add(height, f"V{height}")
+    assert log.entries_since(3) == (5, [[4, "V4"], [5, "V5"]])
+    assert log.entries_since(5) == (5, [])
+
+def test_apply_skips_old_and_duplicate_entries():
+    log = RevocationLog()
+    log.apply(4, [[2, "V1"], [4, "V2"]])
+    log.apply(6, [[3, "V3"], [5, "V2"], [6, "V4"]])
+    assert log.entries_since(0) == (6, [[2, "V1"], [4, "V2"], [6, "V4"]])
+    assert log.is_revoked("V4") and not log.is_revoked("V3")
+
+def test_pull_transfers_only_missing_entries():
+    origin = RevocationLog()
+    for height in range(1, 101):
+        origin.add(height, f"V{height}")
+    server = SyncServer(origin).start()
+    try:
+        rsu = RevocationLog()
+        full = pull_from(rsu, server.address)
+        assert rsu.height == 100 and rsu.is_revoked("V1") and rsu.is_revoked("V100")
+
+        origin.add(101, "V101")
+        delta = pull_from(rsu, server.address)
+        assert rsu.entries_since(100) == (101, [[101, "V101"]])
+        reply = json.dumps({"height": 101, "entries": [[101, "V101"]]}, separators=(",", ":"))
+        assert delta == len(json.dumps({"since": 100})) + len(reply) + 2
+        assert delta < full / 10
+
+        assert pull_from(rsu, server.address) < delta  # already up to date
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_rsu_keeps_only_height_and_filter():
+    origin = RevocationLog()
+    for height in range(1, 2001):
+        origin.add(height, f"V{height}")
+    server = SyncServer(origin).start()
+    try:
+        rsu = RevocationFilterLog(capacity=2000)
+        pull_from(rsu, server.address)
+        origin.add(2001, "V2001")
+        pull_from(rsu, server.address)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert rsu.height == 2001
+    assert all(rsu.might_be_revoked(f"V{height}") for height in range(1, 2002))
+    assert not hasattr(rsu, "revoked")
+    assert rsu.nbytes() < 8 * 2001  # a few bytes per revocation, not the ids
@@ -0,0 +1,42 @@
+from session_tickets import TicketDomain, mac
+
+def present(domain, vehicle_id, now, message=b"auth_request"):
+    ticket, session_key = domain.issue(vehicle_id, now)
+    return ticket, mac(session_key, message)
+
+def test_ticket_is_accepted_across_the_domain():
+    key = b"k" * 32
+    ticket, proof = present(TicketDomain(key), "V1", 100.0)
+    assert TicketDomain(key).validate(ticket, "V1", b"auth_request", proof, now=110.0)
+    assert not TicketDomain(b"x" * 32).validate(ticket, "V1", b"auth_request", proof, now=110.0)
+
+def test_ticket_expires_after_its_lifetime():
+    domain = TicketDomain(lifetime=30.0)
+    ticket, proof = present(domain, "V1", 100.0)
+    assert domain.validate(ticket, "V1", b"auth_request", proof, now=130.0)
+    assert not domain.validate(ticket, "V1", b"auth_request", proof, now=130.5)
+    assert not domain.validate(ticket, "V1", b"auth_request", proof, now=99.0)  # issued in the future
+
+def test_ticket_is_bound_to_vehicle_message_and_tag():
+    domain = TicketDomain()
+    ticket, proof = present(domain, "V1", 100.0)
+    assert not domain.validate(ticket, "V2", b"auth_request", proof, now=101.0)
+    assert not domain.validate(ticket, "V1", b"other", proof, now=101.0)
+    forged = ticket.replace(b"|V1", b"|V2")
+    assert not domain.validate(forged, "V2", b"auth_request", proof, now=101.0)
+
+def test_invalidate_rejects_earlier_tickets_only():
+    domain = TicketDomain()
+    old_ticket, old_proof = present(domain, "V1", 100.0)
+    other_ticket, other_proof = present(domain, "V2", 100.0)
+    domain.invalidate("V1", now=105.0)
+    assert not domain.validate(old_ticket, "V1", b"auth_request", old_proof, now=106.0)
+    assert domain.validate(other_ticket, "V2", b"auth_request", other_proof, now=106.0)
+    new_ticket, new_proof = present(domain, "V1", 107.0)
+    assert domain.validate(new_ticket, "V1", b"auth_request", new_proof, now=108.0)
+
+def test_stale_invalidations_are_dropped():
+    domain = TicketDomain(lifetime=30.0)
+    domain.invalidate("V1", now=100.0)
+    domain.invalidate("V2", now=200.0)
+    assert list(domain.invalidated) == ["V2"]
@@ -0,0 +1,59 @@
+import numpy as np
+
+import sharded_sim
+from sharded_sim import REGION_WIDTH, run_sharded, shard_of, shard_rsus
+from signatures import get_scheme
+from vanet_engine import SimulationEngine
+
+SCHEME = get_scheme("ed25519")
+
+def test_regions_map_to_contiguous_shards():
+    xs = [0, REGION_WIDTH - 1, REGION_WIDTH, 3 * REGION_WIDTH + 5, 99 * REGION_WIDTH, -5]
+    assert shard_of(xs, 4, 2).tolist() == [0, 0, 0, 1, 1, 0]
+    assert all(x < 2 * REGION_WIDTH for x, _ in shard_rsus(0, 4, 2))
+    assert all(x >= 2 * REGION_WIDTH for x, _ in shard_rsus(1, 4, 2))
+
+def test_handoff_keeps_vehicle_state_and_motion():
+    source = SimulationEngine(4, scheme=SCHEME, seed=1, start_time=0.0, mobility="lane")
+    target = SimulationEngine(0, rsu_positions=[(900, 130)], scheme=SCHEME, seed=2, start_time=0.0,
+                              mobility="lane")
+    source.run(3)
+    leaving = source.vehicles[1]
+    position, speed = (leaving.x, leaving.y), source.mobility.speed[1]
+    mask = np.zeros(len(source.vehicles), dtype=bool)
+    mask[1] = True
+    [(state, motion)] = source.release_vehicles(mask)
+    assert [v.vehicle_id for v in source.vehicles] == ["V1", "V3", "V4"]
+    assert [v.index for v in source.vehicles] == [0, 1, 2]
+    assert len(source.mobility) == len(source.due) == 3
+
+    arrived = target.adopt_vehicle(state, **motion)
+    assert arrived.vehicle_id == leaving.vehicle_id
+    assert arrived.cert == leaving.cert
+    assert (arrived.x, arrived.y) == position
+    assert target.mobility.speed[0] == speed
+    assert target.scheme.public_bytes(arrived.public_key) == SCHEME.public_bytes(leaving.public_key)
+    source.close()
+    target.close()
+
+def test_vehicles_cross_shards_and_authenticate():
+    results, _, handoffs = run_sharded(60, 40, 4, 2, epoch_ticks=10, revocations=2, seed=1,
+                                       scheme_name="ed25519")
+    assert handoffs > 0
+    assert results.get("Authenticated", 0) > 0
+    single, _, no_handoffs = run_sharded(60, 40, 4, 1, epoch_ticks=10, revocations=2, seed=1,
+                                         scheme_name="ed25519")
+    assert no_handoffs == 0
+    assert single.get("Authenticated", 0) > 0
+
+def test_every_revocation_is_made_when_epochs_are_few(monkeypatch):
+    revoked = []
+    revoke_certificates = sharded_sim.CertificateAuthority.revoke_certificates
+
+    def recording(ca, vehicle_ids):
+        revoked.extend(vehicle_ids)
+        return revoke_certificates(ca, vehicle_ids)
+
+    monkeypatch.setattr(sharded_sim.CertificateAuthority, "revoke_certificates", recording)
+    run_sharded(20, 40, 2, 1, epoch_ticks=10, revocations=10, seed=3, scheme_name="ed25519")
+    assert len(set(revoked)) == 10  # 4 epochs, 10 revocations
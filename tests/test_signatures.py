@@ -0,0 +1,22 @@
+import pytest
+
+from signatures import SCHEMES, SignatureScheme
+
+class HalfScheme(SignatureScheme):
+    name = "half"
+
+    def generate_private_key(self):
+        return None
+
+def test_incomplete_scheme_fails_at_construction():
+    with pytest.raises(TypeError):
+        HalfScheme()
+
+@pytest.mark.parametrize("name", ["ecdsa-p256", "ed25519"])
+def test_sign_verify(name):
+    scheme = SCHEMES[name]
+    key = scheme.generate_private_key()
+    signature = scheme.sign(key, b"auth_request")
+    public_key = scheme.load_public_key(scheme.public_bytes(key.public_key()))
+    assert scheme.verify(public_key, signature, b"auth_request")
+    assert not scheme.verify(public_key, signature, b"auth_request!")
@@ -0,0 +1,146 @@
+import os
+from concurrent.futures import Future
+
+import pytest
+
+from signatures import get_scheme
+from rsu_sync import RevocationFilterLog
+from vanet_engine import RSU, SimulationEngine, Vehicle
+
+SCHEME = get_scheme("ed25519")
+
+class FailingVerifier:
+    """Stands in for a VerificationEngine whose batch raised."""
+
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, public_key_bytes, message, signature):
+        future = Future()
+        self.pending.append(future)
+        return future
+
+    def fail(self, error):
+        for future in self.pending:
+            future.set_exception(error)
+
+class NoRevocations:
+    def is_revoked(self, vehicle_id):
+        return False
+
+class Revocations:
+    def __init__(self, *vehicle_ids):
+        self.revoked = set(vehicle_ids)
+        self.lookups = 0
+
+    def is_revoked(self, vehicle_id):
+        self.lookups += 1
+        return vehicle_id in self.revoked
+
+def test_authenticate_async_forwards_failed_batch():
+    rsu = RSU(100, 100, scheme=SCHEME)
+    vehicle = Vehicle(100, 100, "V1", SCHEME)
+    verifier = FailingVerifier()
+    outcome = rsu.authenticate_async(vehicle, NoRevocations(), verifier, now=1000.0)
+    assert not outcome.done()
+    verifier.fail(RuntimeError("worker died"))
+    assert outcome.done()
+    with pytest.raises(RuntimeError, match="worker died"):
+        outcome.result(timeout=0)
+
+def test_captured_request_is_rejected_at_every_rsu():
+    first, second = RSU(100, 100, scheme=SCHEME), RSU(600, 400, scheme=SCHEME)
+    vehicle = Vehicle(100, 100, "V1", SCHEME)
+    message = vehicle.auth_request(first.challenge(vehicle), 1000.0)
+    signature = vehicle.sign(message)
+    assert first.authenticate(vehicle, NoRevocations(), message, signature, 1000.0) == "Authenticated"
+    first.rate_limiter.forget("V1")
+    assert first.authenticate(vehicle, NoRevocations(), message, signature, 1001.0) == "Replay"
+    assert second.authenticate(vehicle, NoRevocations(), message, signature, 1001.0) == "Replay"
+
+def test_challenge_is_bound_to_the_vehicle():
+    rsu = RSU(100, 100, scheme=SCHEME)
+    vehicle, other = Vehicle(100, 100, "V1", SCHEME), Vehicle(100, 100, "V2", SCHEME)
+    message = other.auth_request(rsu.challenge(vehicle), 1000.0)
+    assert rsu.authenticate(other, NoRevocations(), message, other.sign(message), 1000.0) == "Replay"
+
+def test_engine_defaults_to_scratch_stores(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    engine = SimulationEngine(3, scheme=SCHEME, seed=1, start_time=0.0)
+    engine.run(5)
+    scratch = engine.scratch.name
+    engine.close()
+    assert list(tmp_path.iterdir()) == []
+    assert not os.path.exists(scratch)
+
+class Watcher:
+    """Any observer makes the engine beacon on every tick."""
+
+    def on_tick(self, engine):
+        pass
+
+    def on_log(self, msg):
+        pass
+
+def run_traced(mobility, observed, ticks=400):
+    engine = SimulationEngine(6, scheme=SCHEME, seed=3, start_time=0.0, mobility=mobility)
+    if observed:
+        engine.observers.append(Watcher())
+    engine.trace = []
+    beacons = []
+    steps_to_reach = engine.mobility.steps_to_reach
+    def counted(index, *args):
+        beacons.append(engine.ticks)
+        return steps_to_reach(index, *args)
+    engine.mobility.steps_to_reach = counted
+    engine.run(ticks)
+    positions = engine.mobility.x.tolist(), engine.mobility.y.tolist()
+    engine.close()
+    return engine.trace, positions, len(beacons)
+
+@pytest.mark.parametrize("mobility", ["random_walk", "lane"])
+def test_skipped_beacons_change_nothing(mobility):
+    every_tick = run_traced(mobility, observed=True)
+    skipping = run_traced(mobility, observed=False)
+    assert skipping[:2] == every_tick[:2]
+    assert every_tick[2] == 400
+    assert skipping[2] < every_tick[2]
+
+def test_fleet_catches_up_on_skipped_ticks():
+    engine = SimulationEngine(2, rsu_positions=[], scheme=SCHEME, seed=1, start_time=0.0)
+    engine.run(10)
+    assert engine.beacon_event is None  # nothing to reach, so nothing scheduled
+    assert engine.ticks == 10
+    engine.add_vehicle("V3", 500, 300)
+    engine.run(5)
+    assert engine.ticks == 15
+    engine.close()
+
+def test_nan_timestamp_request_is_never_accepted():
+    rsu = RSU(100, 100, scheme=SCHEME)
+    vehicle = Vehicle(100, 100, "V1", SCHEME)
+    message = vehicle.auth_request(rsu.challenge(vehicle), float("nan"))
+    signature = vehicle.sign(message)
+    for now in (1000.0, 1100.0, 5000.0, 100000.0):
+        rsu.rate_limiter.forget("V1")
+        assert rsu.authenticate(vehicle, NoRevocations(), message, signature, now) == "Failed"
+
+def test_rsu_confirms_filter_hits_with_the_ca():
+    log = RevocationFilterLog()
+    log.add(1, "V1")
+    rsu = RSU(100, 100, log, SCHEME)
+    ca = Revocations("V1")
+    assert rsu.precheck(Vehicle(100, 100, "V1", SCHEME), ca, now=1.0) == "Revoked"
+    assert ca.lookups == 1
+    # A hit the CA does not back up (a false positive) lets the vehicle through
+    assert rsu.precheck(Vehicle(100, 100, "V1", SCHEME), Revocations(), now=2.0) is None
+    # A miss is settled without asking the CA
+    assert rsu.precheck(Vehicle(100, 100, "V2", SCHEME), ca, now=3.0) is None
+    assert ca.lookups == 1
+
+def test_engine_sizes_rsu_replay_caches():
+    engine = SimulationEngine(0, scheme=SCHEME, seed=1, start_time=0.0, rsu_request_rate=10.0, replay_window=5.0)
+    for rsu in engine.rsus:
+        assert rsu.replay_cache.window == 5.0
+        assert rsu.replay_cache.nbytes() < 10 * 1024
+    engine.close()
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from binary_chain import convert
+from blockchain import Block
+from verify_chain import verify_chain
+
+def make_records(count):
+    blocks = [Block("Genesis", "Init", "0", timestamp="2025-06-30T23:00:00.000001")]
+    for i in range(1, count):
+        entries = [[f"V{i}", "revoked"], [f"V{i}b", "revoked"]] if i % 5 == 0 else None
+        blocks.append(Block(f"V{i}", "revoked", blocks[-1].hash,
+                            timestamp=f"2025-06-30T23:00:{i % 60:02d}.{i:06d}", entries=entries))
+    return [b.to_record() for b in blocks]
+
+def forge_from(records, index):
+    # Relink the chain from `index` on, so every block hashes correctly and
+    # only the link into `index` is broken
+    records = [dict(r) for r in records]
+    previous_hash = "ff" * 32
+    for record in records[index:]:
+        record["previous_hash"] = previous_hash
+        record["hash"] = Block.from_record(record).compute_hash()
+        previous_hash = record["hash"]
+    return records
+
+def write_chain(tmp_path, records, fmt):
+    export = tmp_path / "chain.json"
+    export.write_text(json.dumps(records))
+    if fmt == "json":
+        return str(export)
+    if fmt == "vbc":
+        convert(str(export), str(tmp_path / "chain.vbc"))
+        return str(tmp_path / "chain.vbc")
+    path = tmp_path / "chain.jsonl"
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+    return str(path)
+
+@pytest.mark.parametrize("fmt", ["jsonl", "json", "vbc"])
+def test_intact_chain_verifies(tmp_path, fmt):
+    count, broken, _ = verify_chain(write_chain(tmp_path, make_records(40), fmt), workers=2)
+    assert (count, broken) == (40, None)
+
+@pytest.mark.parametrize("fmt", ["jsonl", "json", "vbc"])
+def test_broken_link_is_found_at_and_between_segment_boundaries(tmp_path, fmt):
+    # 2 workers split 24 blocks into 8 segments; for an export or .vbc those
+    # are 3 blocks each, so breaks at 3 and 6 are only caught when the
+    # segments are stitched together
+    records = make_records(24)
+    for index in (1, 3, 6, 7, 23):
+        _, broken, _ = verify_chain(write_chain(tmp_path, forge_from(records, index), fmt), workers=2)
+        assert broken == index
+
+def test_tampered_batch_entry_breaks_its_block(tmp_path):
+    records = make_records(12)
+    records[10]["entries"][1][0] = "V99"
+    _, broken, _ = verify_chain(write_chain(tmp_path, records, "jsonl"), workers=2)
+    assert broken == 10
@@ -0,0 +1,574 @@
+import collections
+import datetime
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from certificate_authority import Blockchain, CertificateAuthority
+from event_scheduler import EventScheduler
+from key_registry import KeyRegistry, registry_path
+from mobility import MODELS
+from rate_limiter import RateLimiter
+from replay_cache import REPLAY_WINDOW, ReplayCache, auth_request, is_challenge, issue_challenge, parse_request
+from rsu_sync import REVOCATION_FP_RATE, RevocationFilterLog, pull_from
+from session_tickets import TicketDomain, mac
+from signatures import get_scheme
+from spatial_index import RSUGrid
+
+# ----------------- Headless Simulation Core ---------------- #
+# Vehicles, RSUs and the CA with no GUI attached, driven by a discrete-event
+# scheduler on its own simulated clock, so a run goes as fast as the events
+# can be processed. A GUI (see simulation.py) attaches as an observer and
+# redraws from the engine's state.
+
+WIDTH, HEIGHT = 800, 600
+RSU_POSITIONS = [(100, 100), (600, 400)]
+RSU_RANGE = 50  # a vehicle within this many units (each axis) of an RSU authenticates
+LANES = (130, 430)  # y of the lanes for the "lane" mobility model, past both RSUs
+SYNC_DELAY = 0.1  # seconds from a revocation until the RSUs pull it
+RSU_REQUEST_RATE = 100.0  # auth requests per second one RSU is sized for (replay cache)
+GRID_PREFILTER_MIN = 32  # vehicles to check before RSUGrid.near beats checking each one
+
+# Vehicle
+class Vehicle:
+    def __init__(self, x, y, vehicle_id, scheme=None):
+        self.vehicle_id = vehicle_id
+        self.fleet = None  # Mobility arrays holding this vehicle's position, once attached
+        self.index = None
+        self._x = x
+        self._y = y
+        self.cert = None
+        self.scheme = scheme or get_scheme()
+        self.private_key = self.scheme.generate_private_key()
+        self.public_key = self.private_key.public_key()
+        self.session_ticket = None  # from the last full authentication, see TicketDomain
+        self.session_key = None
+
+    def to_state(self):
+        """
+        Everything but the position needed to rebuild this vehicle in another process.
+        """
+        return {"vehicle_id": self.vehicle_id, "cert": self.cert,
+                "private_key": self.scheme.private_bytes(self.private_key),
+                "session_ticket": self.session_ticket, "session_key": self.session_key}
+
+    @classmethod
+    def from_state(cls, state, x, y, scheme=None):
+        vehicle = cls.__new__(cls)
+        vehicle.vehicle_id = state["vehicle_id"]
+        vehicle.fleet = vehicle.index = None
+        vehicle._x = x
+        vehicle._y = y
+        vehicle.cert = state["cert"]
+        vehicle.scheme = scheme or get_scheme()
+        vehicle.private_key = vehicle.scheme.load_private_key(state["private_key"])
+        vehicle.public_key = vehicle.private_key.public_key()
+        vehicle.session_ticket = state["session_ticket"]
+        vehicle.session_key = state["session_key"]
+        return vehicle
+
+    def attach(self, fleet, index):
+        self.fleet = fleet
+        self.index = index
+
+    @property
+    def x(self):
+        return self._x if self.fleet is None else float(self.fleet.x[self.index])
+
+    @x.setter
+    def x(self, value):
+        if self.fleet is None:
+            self._x = value
+        else:
+            self.fleet.x[self.index] = value
+
+    @property
+    def y(self):
+        return self._y if self.fleet is None else float(self.fleet.y[self.index])
+
+    @y.setter
+    def y(self, value):
+        if self.fleet is None:
+            self._y = value
+        else:
+            self.fleet.y[self.index] = value
+
+    def auth_request(self, challenge, now=None):
+        # Fresh timestamp and the RSU's challenge, so a captured request cannot be replayed
+        return auth_request(challenge, now)
+
+    def sign(self, message):
+        return self.scheme.sign(self.private_key, message)
+
+    def prove(self, message):
+        # Possession of the session key, for re-authenticating with a ticket
+        return mac(self.session_key, message)
+
+# RSU
+class RSU:
+    def __init__(self, x, y, revocation_log=None, scheme=None, tickets=None, rsu_id=None, replay_cache=None):
+        self.rsu_id = rsu_id
+        self.x = x
+        self.y = y
+        self.revocation_log = revocation_log  # RSU-local RevocationFilterLog kept current by sync_from
+        self.scheme = scheme or get_scheme()
+        self.tickets = tickets  # TicketDomain shared with the other RSUs of this domain
+        self.challenge_key = os.urandom(32)  # only this RSU can issue or recognise its challenges
+        self.replay_cache = replay_cache or ReplayCache.for_rate(RSU_REQUEST_RATE)
+        self.rate_limiter = RateLimiter(rate=1.0, burst=1)  # one request per second per vehicle
+
+    def in_range(self, vehicle):
+        return abs(vehicle.x - self.x) < RSU_RANGE and abs(vehicle.y - self.y) < RSU_RANGE
+
+    def precheck(self, vehicle, ca, now=None):
+        # Cheap checks that settle a request before any signature work
+        if not self.rate_limiter.allow(vehicle.vehicle_id, now):
+            return "DoS"
+
+        if self.revocation_log is not None:
+            # A filter miss is definite; only a possible hit costs a CA lookup
+            revoked = (self.revocation_log.might_be_revoked(vehicle.vehicle_id) and
+                       ca.is_revoked(vehicle.vehicle_id))
+        else:
+            revoked = ca.is_revoked(vehicle.vehicle_id)
+        if revoked:
+            return "Revoked"
+        return None
+
+    def challenge(self, vehicle):
+        return issue_challenge(self.challenge_key, vehicle.vehicle_id)
+
+    def check_fresh(self, vehicle, message, now=None):
+        # Answers this RSU's challenge, timestamp within the window and nonce
+        # not seen from this vehicle before
+        request = parse_request(message)
+        if request is None:
+            return "Failed"
+        timestamp, nonce = request
+        if not is_challenge(self.challenge_key, vehicle.vehicle_id, nonce):
+            return "Replay"  # signed for another RSU (or another vehicle)
+        if not self.replay_cache.check(f"{vehicle.vehicle_id}|{nonce}", timestamp, now):
+            return "Replay"
+        return None
+
+    def check_ticket(self, vehicle, message, now=None):
+        # Repeat authentications and handoffs skip the signature when the ticket holds
+        return (self.tickets is not None and vehicle.session_ticket is not None and
+                self.tickets.validate(vehicle.session_ticket, vehicle.vehicle_id, message,
+                                      vehicle.prove(message), now))
+
+    def issue_ticket(self, vehicle, now=None):
+        if self.tickets is not None:
+            vehicle.session_ticket, vehicle.session_key = self.tickets.issue(vehicle.vehicle_id, now)
+
+    def authenticate(self, vehicle, ca, message=None, signature=None, now=None):
+        """
+        Authenticate a fresh request from the vehicle, or the given signed
+        message (e.g. one captured earlier) when message/signature are passed.
+        `now` is the caller's clock; wall-clock time if not given.
+        """
+        result = self.precheck(vehicle, ca, now)
+        if result:
+            return result
+
+        message = message or vehicle.auth_request(self.challenge(vehicle), now)
+        result = self.check_fresh(vehicle, message, now)
+        if result:
+            return result
+        if signature is None:
+            if self.check_ticket(vehicle, message, now):
+                return "Authenticated"
+            signature = vehicle.sign(message)
+        if self.scheme.verify(vehicle.public_key, signature, message):
+            self.issue_ticket(vehicle, now)
+            return "Authenticated"
+        return "Failed"
+
+    def authenticate_async(self, vehicle, ca, engine, now=None):
+        """
+        Like authenticate, but the signature is checked by a VerificationEngine
+        batch; returns a Future that resolves to the same result strings.
+        """
+        outcome = Future()
+        result = self.precheck(vehicle, ca, now)
+        if result:
+            outcome.set_result(result)
+            return outcome
+        message = vehicle.auth_request(self.challenge(vehicle), now)
+        result = self.check_fresh(vehicle, message, now)
+        if result:
+            outcome.set_result(result)
+            return outcome
+        if self.check_ticket(vehicle, message, now):
+            outcome.set_result("Authenticated")
+            return outcome
+        signature = vehicle.sign(message)
+        verified = engine.submit(self.scheme.public_bytes(vehicle.public_key), message, signature)
+        verified.add_done_callback(lambda f: self.finish_async(vehicle, f, outcome, now))
+        return outcome
+
+    def finish_async(self, vehicle, verified, outcome, now=None):
+        # An exception raised in a done callback is only logged, so a failed
+        # batch has to be handed on explicitly or the caller waits forever
+        error = verified.exception()
+        if error is not None:
+            outcome.set_exception(error)
+            return
+        valid = verified.result()
+        if valid:
+            self.issue_ticket(vehicle, now)
+        outcome.set_result("Authenticated" if valid else "Failed")
+
+    def sync_from(self, address):
+        # Pull only the revocations recorded after this RSU's last known height
+        return pull_from(self.revocation_log, address)
+
+# ----------------- Simulation Engine ---------------- #
+class SimulationEngine:
+    """
+    Runs the vehicle/RSU/CA simulation without a display.
+
+    Vehicle positions live in a vectorized mobility model ("random_walk" or
+    "lane", see mobility.py) that moves the whole fleet in one step.
+
+    Everything happens as an event on self.scheduler:
+      beacon      on a tick (a multiple of tick_interval): the fleet moves and
+                  vehicles in RSU range send an auth request
+      auth        one vehicle authenticating at one RSU
+      revocation  the CA revokes a vehicle and triggers an RSU sync
+      sync        an RSU pulls new revocations from the CA
+
+    A beacon only looks at the vehicles that are due: self.due[i] is the
+    first tick on which vehicle i could be in range, from the mobility
+    model's bound on how fast it closes in on an RSU. The next beacon goes
+    on the earliest due tick, so ticks on which nobody can reach an RSU
+    cost nothing; the fleet is moved through them when the next beacon,
+    run() or a joining vehicle needs current positions (catch_up), with
+    the same positions and results as visiting every tick.
+
+    Observers are objects with on_log(message) and on_tick(engine) methods;
+    they are told about every log line and called after every beacon. Log
+    lines are only formatted while at least one observer is attached, and
+    while one is, every tick gets a beacon so it can redraw.
+
+    Without a blockchain the engine keeps its own in a scratch directory
+    that close() removes, so nothing lands in the working directory unless
+    the caller asks for it. Without a key_registry it opens one beside the
+    blockchain's journal, so Sybil detection lasts exactly as long as the
+    chain does.
+
+    revocation_fp_rate is the false-positive rate of the revocation filter
+    each RSU keeps in place of the revocation list. Each RSU's replay cache
+    is sized for rsu_request_rate requests per second within replay_window
+    seconds of its clock; busier RSUs reject more fresh requests as replays.
+
+    Set self.trace to a list to record every auth and revocation as it
+    happens; scenario.py saves and replays these traces.
+    """
+
+    def __init__(self, vehicles=5, rsu_positions=RSU_POSITIONS, blockchain=None, key_registry=None,
+                 scheme=None, seed=None, tick_interval=1.0, start_time=None, mobility="random_walk",
+                 width=WIDTH, height=HEIGHT, beacons=True, revocation_fp_rate=REVOCATION_FP_RATE,
+                 rsu_request_rate=RSU_REQUEST_RATE, replay_window=REPLAY_WINDOW):
+        self.scheme = scheme or get_scheme()  # set VANET_SIGNATURE_SCHEME to rsa2048, ecdsa-p256 or ed25519
+        self.scratch = None
+        self.owned = []  # stores created here, closed by close()
+        if blockchain is None:
+            self.scratch = tempfile.TemporaryDirectory()
+            blockchain = Blockchain(os.path.join(self.scratch.name, "blockchain.jsonl"), fsync_policy="never")
+            self.owned.append(blockchain.journal)
+        if key_registry is None:
+            key_registry = KeyRegistry(registry_path(blockchain.journal.path))  # persists with the chain
+            self.owned.append(key_registry)
+        self.blockchain = blockchain
+        self.ca = CertificateAuthority(self.blockchain, self.scheme, key_registry)
+        self.rng = random.Random(seed)
+        self.width = width
+        self.height = height
+        self.tick_interval = tick_interval
+        self.scheduler = EventScheduler(time.time() if start_time is None else start_time)
+        self.beacons = beacons  # False when auth events are fed in directly, e.g. replaying a trace
+        self.beacon_event = None
+        self.beacon_steps = 0  # ticks the pending beacon moves the fleet
+        self.ticks = 0  # ticks the fleet has been moved through
+        self.tick_time = self.now  # time of tick self.ticks
+        self.observers = []
+        self.trace = None
+
+        self.sync_server = self.ca.serve_revocations()
+        self.ticket_domain = TicketDomain()  # every RSU accepts the others' session tickets
+        self.rsus = [RSU(x, y, RevocationFilterLog(fp_rate=revocation_fp_rate), self.scheme, self.ticket_domain, i,
+                         ReplayCache.for_rate(rsu_request_rate, replay_window))
+                     for i, (x, y) in enumerate(rsu_positions)]
+        self.rsu_grid = RSUGrid(self.rsus, RSU_RANGE)
+        self.rsu_xs = np.array([rsu.x for rsu in self.rsus], dtype=np.float64)
+        self.rsu_ys = np.array([rsu.y for rsu in self.rsus], dtype=np.float64)
+        self.vehicles = []
+        self.mobility = None
+        for i in range(vehicles):
+            y = self.rng.choice(LANES) if mobility == "lane" else self.rng.randint(100, height - 100)
+            self.add_vehicle(f"V{i+1}", self.rng.randint(100, width - 100), y)
+        xs = [v.x for v in self.vehicles]
+        ys = [v.y for v in self.vehicles]
+        if mobility == "lane":
+            self.mobility = MODELS[mobility](xs, ys, width, rng=seed)
+        else:
+            self.mobility = MODELS[mobility](xs, ys, rng=seed)
+        for i, v in enumerate(self.vehicles):
+            v.attach(self.mobility, i)
+        self.due = np.zeros(len(self.vehicles))
+        self.schedule_beacon()
+        self.schedule_sync()  # pick up revocations already on the chain
+
+        self.results = collections.Counter()
+        self.auth_times = []
+        self.auth_labels = []
+        self.revocation_latencies = []
+        self.revocation_counts = []
+        self.revoked_count = 0
+
+    @property
+    def now(self):
+        return self.scheduler.now
+
+    def log(self, msg):
+        for observer in self.observers:
+            observer.on_log(msg)
+
+    def timestamp(self):
+        return datetime.datetime.fromtimestamp(self.now).strftime("%H:%M:%S")
+
+    def add_vehicle(self, vehicle_id, x, y):
+        v = Vehicle(x, y, vehicle_id, self.scheme)
+        cert = self.ca.issue_certificate(v.vehicle_id, v.public_key)
+        if cert == "Sybil-Detected":
+            self.log(f"[!] Sybil Attack Detected for {v.vehicle_id}")
+            return None
+        v.cert = cert
+        if self.mobility is not None:
+            self.join(v, v.x, v.y)
+        self.vehicles.append(v)
+        return v
+
+    def adopt_vehicle(self, state, x, y, **motion):
+        """
+        Take over a vehicle handed off by another engine (see Vehicle.to_state).
+        """
+        v = Vehicle.from_state(state, x, y, self.scheme)
+        self.join(v, x, y, **motion)
+        self.vehicles.append(v)
+        return v
+
+    def join(self, v, x, y, **motion):
+        # Bring the fleet up to date before it grows; the newcomer may
+        # already be in range, so it is due on the very next tick
+        if self.beacon_event is None and not self.vehicles:
+            self.tick_time = self.now  # an idle, empty fleet's ticks restart now
+        else:
+            self.catch_up()
+        v.attach(self.mobility, self.mobility.add(x, y, **motion))
+        self.due = np.append(self.due, self.ticks + 1)
+        if self.beacon_event is not None and self.beacon_steps > 1:
+            self.scheduler.cancel(self.beacon_event)
+            self.beacon_event = None
+        self.schedule_beacon()
+
+    def release_vehicles(self, mask):
+        """
+        Remove the vehicles where the NumPy `mask` is True and return
+        (state, motion) for each, motion being the keyword arguments
+        adopt_vehicle needs (position and, for lanes, speed). Positions are
+        current after run() and tick().
+        """
+        motion = self.mobility.remove(mask)
+        self.due = self.due[~mask]
+        leaving = [v for v, gone in zip(self.vehicles, mask) if gone]
+        self.vehicles = [v for v, gone in zip(self.vehicles, mask) if not gone]
+        for i, v in enumerate(self.vehicles):
+            v.attach(self.mobility, i)
+        return [(v.to_state(), m) for v, m in zip(leaving, motion)]
+
+    # Event handlers and their scheduling
+    def schedule_beacon(self, steps=1):
+        if self.beacon_event is None and self.vehicles and self.beacons:
+            self.beacon_steps = steps
+            self.beacon_event = self.scheduler.at(self.tick_time + steps * self.tick_interval, self.beacon)
+
+    def advance(self, steps):
+        if self.vehicles:
+            self.mobility.advance(steps)
+        self.ticks += steps
+        self.tick_time += steps * self.tick_interval
+
+    def catch_up(self):
+        """
+        Move the fleet through the ticks up to now that the pending beacon
+        skipped. Nobody could reach an RSU on those, so moving is all they
+        were owed.
+        """
+        steps = math.floor((self.now - self.tick_time) / self.tick_interval + 1e-9)
+        if self.beacon_event is not None:
+            steps = min(steps, self.beacon_steps - 1)
+        if steps <= 0:
+            return
+        self.advance(steps)
+        if self.beacon_event is not None:
+            remaining = self.beacon_steps - steps
+            self.scheduler.cancel(self.beacon_event)
+            self.beacon_event = None
+            self.schedule_beacon(remaining)
+
+    def beacon(self):
+        self.beacon_event = None
+        self.advance(self.beacon_steps)
+        if not self.vehicles:
+            return
+        due = np.flatnonzero(self.due <= self.ticks)
+        reach = self.mobility.steps_to_reach(due, self.rsu_xs, self.rsu_ys, RSU_RANGE)
+        self.due[due] = self.ticks + np.maximum(reach, 1)
+        # Only vehicles that may be in range now need a closer look; a long
+        # shortlist is narrowed to those in a grid cell with an RSU first
+        close = due[reach == 0]
+        xs, ys = self.mobility.x[close].tolist(), self.mobility.y[close].tolist()
+        nearby = self.rsu_grid.near(self.mobility.x[close], self.mobility.y[close]) \
+            if len(close) >= GRID_PREFILTER_MIN else range(len(close))
+        for j in nearby:
+            v = self.vehicles[close[j]]
+            for rsu in self.rsu_grid.covering(xs[j], ys[j]):
+                self.scheduler.schedule(0, self.authenticate, v, rsu)
+        for observer in self.observers:
+            observer.on_tick(self)
+        if self.observers:
+            self.schedule_beacon()
+        elif np.isfinite(self.due.min()):
+            self.schedule_beacon(int(self.due.min()) - self.ticks)
+
+    def schedule_sync(self, delay=0):
+        for rsu in self.rsus:
+            self.scheduler.schedule(delay, self.sync, rsu)
+
+    def sync(self, rsu):
+        rsu.sync_from(self.sync_server.address)
+
+    def schedule_revocation(self, delay, v):
+        return self.scheduler.schedule(delay, self.revoke, v)
+
+    def authenticate(self, v, rsu):
+        t0 = time.perf_counter()
+        result = rsu.authenticate(v, self.ca, now=self.now)
+        latency = round((time.perf_counter() - t0)*1000, 2)
+        self.results[result] += 1
+        if self.trace is not None:
+            self.trace.append((self.now, "auth", v.vehicle_id, rsu.rsu_id, result))
+        self.auth_times.append(latency)
+        self.auth_labels.append(v.vehicle_id)
+        if not self.observers:
+            return result
+        ts = self.timestamp()
+        if result == "Authenticated":
+            self.log(f"[{ts}] {v.vehicle_id} authenticated in {latency} ms")
+        elif result == "Revoked":
+            self.log(f"[{ts}] {v.vehicle_id} is revoked")
+        elif result == "DoS":
+            self.log(f"[{ts}] DoS Detected from {v.vehicle_id}")
+        elif result == "Replay":
+            self.log(f"[{ts}] Replayed request from {v.vehicle_id} rejected")
+        else:
+            self.log(f"[{ts}] {v.vehicle_id} authentication failed")
+        return result
+
+    def tick(self):
+        """
+        Run every event in the next tick_interval of simulated time.
+        """
+        self.scheduler.run(until=self.now + self.tick_interval)
+        self.catch_up()
+
+    def run(self, ticks):
+        self.scheduler.run(until=self.now + ticks * self.tick_interval)
+        self.catch_up()
+        return self.results
+
+    def revoke(self, v):
+        latency = self.ca.revoke_certificate(v.vehicle_id)
+        self.ticket_domain.invalidate(v.vehicle_id, self.now)
+        if self.trace is not None:
+            self.trace.append((self.now, "revoke", v.vehicle_id))
+        self.revoked_count += 1
+        self.revocation_latencies.append(latency)
+        self.revocation_counts.append(self.revoked_count)
+        self.log(f"[!] {v.vehicle_id} has been revoked. Revocation Latency: {latency} ms")
+        self.schedule_sync(SYNC_DELAY)
+
+    def apply_revocations(self, vehicle_ids):
+        """
+        Record revocations made elsewhere (e.g. by a central CA) in this
+        engine's CA replica, then let the RSUs sync.
+        """
+        if not vehicle_ids:
+            return
+        self.ca.revoke_certificates(vehicle_ids)
+        for vehicle_id in vehicle_ids:
+            self.ticket_domain.invalidate(vehicle_id, self.now)
+        self.schedule_sync(SYNC_DELAY)
+
+    def revoke_random(self):
+        self.revoke(self.rng.choice(self.vehicles))
+
+    def simulate_attacks(self):
+        ts = self.timestamp()
+        self.log(f"[{ts}]  Simulating Sybil Attack...")
+        fake_vehicle = Vehicle(400, 300, "V1", self.scheme)  # duplicate ID
+        cert = self.ca.issue_certificate(fake_vehicle.vehicle_id, fake_vehicle.public_key)
+        if cert == "Sybil-Detected":
+            self.log(f"[{ts}]  Sybil Attack Detected and Blocked")
+
+        self.log(f"[{ts}] Simulating Replay Attack...")
+        v = self.vehicles[0]
+        rsu = self.rsus[0]
+        # An eavesdropper captures a signed request and sends it again later
+        message = v.auth_request(rsu.challenge(v), self.now)
+        signature = v.sign(message)
+        rsu.rate_limiter.forget(v.vehicle_id)  # each attempt arrives outside the rate limit
+        rsu.authenticate(v, self.ca, message, signature, self.now)
+        rsu.rate_limiter.forget(v.vehicle_id)
+        result = rsu.authenticate(v, self.ca, message, signature, self.now)
+        if result == "Replay":
+            self.log(f"[{ts}]  Replay Attack Detected and Blocked (Nonce Already Seen)")
+
+        self.log(f"[{ts}] Simulating DoS Attack...")
+        rsu.authenticate(v, self.ca, now=self.now)
+        result = rsu.authenticate(v, self.ca, now=self.now)  # back to back, over the limit
+        if result == "DoS":
+            self.log(f"[{ts}]  DoS Attack Detected and Blocked")
+
+    def close(self):
+        self.sync_server.shutdown()
+        self.sync_server.server_close()
+        for store in self.owned:
+            store.close()
+        if self.scratch is not None:
+            self.scratch.cleanup()
+
+if __name__ == "__main__":
+    # python vanet_engine.py [vehicles] [ticks] [seed] [random_walk|lane]; chain and key registry go to a scratch directory
+    vehicles = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    ticks = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    mobility = sys.argv[4] if len(sys.argv) > 4 else "random_walk"
+    start = time.perf_counter()
+    engine = SimulationEngine(vehicles, seed=seed, mobility=mobility)
+    setup = time.perf_counter() - start
+    start = time.perf_counter()
+    results = engine.run(ticks)
+    elapsed = time.perf_counter() - start
+    engine.close()
+    print(f"{vehicles} vehicles ({engine.scheme.name}), {len(engine.rsus)} RSUs: setup {setup:.1f} s, "
+          f"{ticks} ticks in {elapsed:.2f} s ({ticks / elapsed:,.1f} ticks/sec)")
+    print(", ".join(f"{result} {count}" for result, count in sorted(results.items())) or "no authentications")
@@ -1,14 +1,15 @@
+import functools
 import tkinter as tk
 from tkinter import messagebox
 import sqlite3
-from cryptography.hazmat.primitives.asymmetric import rsa
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import padding
-from cryptography.hazmat.primitives import serialization
+from signatures import get_scheme
+
+DB_PATH = 'vanet.db'
+KEY_CACHE_SIZE = 4096  # deserialized public keys kept in memory
 
 # Database setup function
-def create_db():
-    conn = sqlite3.connect('vanet.db')
+def create_db(db_path=DB_PATH):
+    conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
     # Create table if not exists
@@ -21,41 +22,53 @@ def create_db():
 
 # Vehicle class to hold vehicle information and generate keys
 class Vehicle:
-    def __init__(self, vehicle_id):
+    def __init__(self, vehicle_id, scheme=None):
         self.vehicle_id = vehicle_id
-        # Generate RSA public/private key pair for authentication
-        self.private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=2048,
-        )
-        self.public_key = self.private_key.public_key()
+        # Generate a key pair for the deployment's signature scheme (RSA-2048 by default)
+        self.scheme = scheme or get_scheme()
+        self.private_key = self.scheme.generate_private_key()
+        self._public_key = self.private_key.public_key()
+        self.key_loader = None
         self.revoked = False
 
+    @classmethod
+    def from_db(cls, vehicle_id, revoked, key_loader, scheme=None):
+        """
+        A registered vehicle read back from the database. No key pair is
+        generated: the private key stays with the vehicle, and the public key
+        is fetched through key_loader(vehicle_id) when it is first needed.
+        """
+        vehicle = cls.__new__(cls)
+        vehicle.vehicle_id = vehicle_id
+        vehicle.scheme = scheme or get_scheme()
+        vehicle.private_key = None
+        vehicle._public_key = None
+        vehicle.key_loader = key_loader
+        vehicle.revoked = revoked
+        return vehicle
+
+    @property
+    def public_key(self):
+        if self._public_key is None:
+            return self.key_loader(self.vehicle_id)
+        return self._public_key
+
+    @public_key.setter
+    def public_key(self, public_key):
+        self._public_key = public_key
+
     def sign_message(self, message):
         """
         Sign a message using the vehicle's private key
         """
-        signature = self.private_key.sign(
-            message.encode(),
-            padding.PKCS1v15(),
-            hashes.SHA256()
-        )
+        signature = self.scheme.sign(self.private_key, message.encode())
         return signature
 
     def verify_signature(self, message, signature, public_key):
         """
         Verify a message signature using the provided public key
         """
-        try:
-            public_key.verify(
-                signature,
-                message.encode(),
-                padding.PKCS1v15(),
-                hashes.SHA256()
-            )
-            return True
-        except:
-            return False
+        return self.scheme.verify(public_key, signature, message.encode())
 
     def revoke(self):
         """
@@ -64,47 +77,94 @@ class Vehicle:
         self.revoked = True
         print(f"Vehicle {self.vehicle_id} has been revoked!")
 
+# Registry of vehicles known to the VANET
+class VehicleRegistry:
+    """
+    vehicle_id -> Vehicle, filled from (vehicle_id, revoked) rows. Vehicle
+    objects for loaded rows are only built when looked up.
+    """
+
+    def __init__(self, key_loader, scheme=None):
+        self.key_loader = key_loader
+        self.scheme = scheme
+        self.rows = {}      # vehicle_id -> revoked flag, not yet looked up
+        self.vehicles = {}  # vehicle_id -> Vehicle
+
+    def load(self, rows):
+        self.rows.update(rows)
+
+    def get(self, vehicle_id, default=None):
+        vehicle = self.vehicles.get(vehicle_id)
+        if vehicle is None:
+            if vehicle_id not in self.rows:
+                return default
+            revoked = bool(self.rows.pop(vehicle_id))
+            vehicle = Vehicle.from_db(vehicle_id, revoked, self.key_loader, self.scheme)
+            self.vehicles[vehicle_id] = vehicle
+        return vehicle
+
+    def __getitem__(self, vehicle_id):
+        vehicle = self.get(vehicle_id)
+        if vehicle is None:
+            raise KeyError(vehicle_id)
+        return vehicle
+
+    def __setitem__(self, vehicle_id, vehicle):
+        self.rows.pop(vehicle_id, None)
+        self.vehicles[vehicle_id] = vehicle
+
+    def __contains__(self, vehicle_id):
+        return vehicle_id in self.vehicles or vehicle_id in self.rows
+
+    def __len__(self):
+        return len(self.vehicles) + len(self.rows)
+
 # VANET system class to handle vehicle registration, messages, and revocation
 class VANET:
-    def __init__(self):
-        self.vehicles = {}
+    def __init__(self, db_path=DB_PATH, scheme=None):
+        self.db_path = db_path
+        self.scheme = scheme or get_scheme()
+        # Public keys are parsed on first use and kept in a bounded LRU
+        self.public_key_for = functools.lru_cache(maxsize=KEY_CACHE_SIZE)(self.load_public_key)
+        self.vehicles = VehicleRegistry(self.public_key_for, self.scheme)
         self.revocation_list = []
         self.load_vehicles_from_db()
 
     def load_vehicles_from_db(self):
         """
-        Load vehicles from the database and initialize vehicle objects
+        Load vehicle ids and revocation flags; keys are read on first use
         """
-        conn = sqlite3.connect('vanet.db')
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM vehicles")
-        rows = cursor.fetchall()
-
-        for row in rows:
-            vehicle_id, public_key, revoked = row
-            vehicle = Vehicle(vehicle_id)
-            vehicle.public_key = serialization.load_pem_public_key(public_key.encode())
-            vehicle.revoked = bool(revoked)
-            self.vehicles[vehicle_id] = vehicle
+        conn = sqlite3.connect(self.db_path)
+        self.vehicles.load(conn.execute("SELECT vehicle_id, revoked FROM vehicles"))
+        conn.close()
 
+    def load_public_key(self, vehicle_id):
+        """
+        Read and deserialize one vehicle's public key from the database
+        """
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute("SELECT public_key FROM vehicles WHERE vehicle_id = ?",
+                           (vehicle_id,)).fetchone()
         conn.close()
+        if row is None:
+            raise KeyError(vehicle_id)
+        return self.scheme.load_public_key(row[0].encode())
 
     def register_vehicle(self, vehicle):
         """
         Register a new vehicle to the VANET network and store it in the database
         """
-        conn = sqlite3.connect('vanet.db')
+        conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
         cursor.execute("INSERT OR REPLACE INTO vehicles (vehicle_id, public_key, revoked) VALUES (?, ?, ?)",
-                       (vehicle.vehicle_id, vehicle.public_key.public_bytes(
-                           encoding=serialization.Encoding.PEM,
-                           format=serialization.PublicFormat.SubjectPublicKeyInfo).decode(), vehicle.revoked))
+                       (vehicle.vehicle_id, vehicle.scheme.public_bytes(vehicle.public_key).decode(), vehicle.revoked))
 
         conn.commit()
         conn.close()
 
+        # A re-registration replaces the stored key
+        self.public_key_for.cache_clear()
         self.vehicles[vehicle.vehicle_id] = vehicle
         print(f"Vehicle {vehicle.vehicle_id} registered.")
 
@@ -116,6 +176,10 @@ class VANET:
             print(f"Vehicle {vehicle.vehicle_id} is revoked and cannot send messages.")
             return None  # Vehicle is revoked, return None
 
+        if vehicle.private_key is None:
+            print(f"Vehicle {vehicle.vehicle_id} was loaded from the database; its private key is not held here.")
+            return None
+
         signature = vehicle.sign_message(message)
         return message, signature  # Return message and signature as a tuple
 
@@ -138,7 +202,7 @@ class VANET:
             vehicle.revoke()
 
             # Update revocation status in the database
-            conn = sqlite3.connect('vanet.db')
+            conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("UPDATE vehicles SET revoked = ? WHERE vehicle_id = ?",
                            (True, vehicle.vehicle_id))
@@ -231,7 +295,7 @@ class VehicleRegistrationApp:
             msg, signature = result
             self.status_label.config(text=f"Message signed: {msg}\nSignature: {signature.hex()}")
         else:
-            self.status_label.config(text="Message signing failed due to vehicle revocation.")
+            self.status_label.config(text="Message signing failed: the vehicle is revoked or its private key is not held here.")
 
     def revoke_vehicle(self):
         # Retrieve the entered vehicle ID from the entry widget
@@ -256,14 +320,15 @@ class VehicleRegistrationApp:
         # Clear the entry field
         self.vehicle_id_entry.delete(0, tk.END)
 
-# Create the main window for the GUI
-root = tk.Tk()
+if __name__ == "__main__":
+    # Create the main window for the GUI
+    root = tk.Tk()
 
-# Initialize the database
-create_db()
+    # Initialize the database
+    create_db()
 
-# Create an instance of the VehicleRegistrationApp
-app = VehicleRegistrationApp(root)
+    # Create an instance of the VehicleRegistrationApp
+    app = VehicleRegistrationApp(root)
 
-# Run the Tkinter event loop
-root.mainloop()
+    # Run the Tkinter event loop
+    root.mainloop()
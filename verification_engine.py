@@ -0,0 +1,88 @@
+import functools
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from signatures import get_scheme
+
+# ----------------- Worker Side ---------------- #
+@functools.lru_cache(maxsize=4096)
+def load_key(scheme_name, key_bytes):
+    # Vehicles re-authenticate often, so keep their parsed keys per worker
+    return get_scheme(scheme_name).load_public_key(key_bytes)
+
+def verify_batch(scheme_name, items):
+    """
+    Verify a batch of (public_key_bytes, message, signature) in one worker call.
+    """
+    scheme = get_scheme(scheme_name)
+    return [scheme.verify(load_key(scheme_name, key_bytes), signature, message)
+            for key_bytes, message, signature in items]
+
+# ----------------- RSU Verification Engine ---------------- #
+class VerificationEngine:
+    """
+    Queues signature checks from an RSU and verifies them in batches on a
+    process pool. submit() returns at once with a Future that resolves to
+    True/False when the batch holding the request has been verified.
+
+    A batch is sent once it has batch_size requests or its oldest request has
+    waited max_delay seconds, whichever comes first.
+    """
+
+    def __init__(self, scheme_name=None, workers=None, batch_size=64, max_delay=0.002):
+        self.scheme_name = get_scheme(scheme_name).name
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.pool = ProcessPoolExecutor(workers)
+        self.requests = queue.Queue()
+        self.dispatcher = threading.Thread(target=self.dispatch, daemon=True)
+        self.dispatcher.start()
+
+    def submit(self, public_key_bytes, message, signature):
+        future = Future()
+        self.requests.put((public_key_bytes, message, signature, future))
+        return future
+
+    def dispatch(self):
+        stopping = False
+        while not stopping:
+            request = self.requests.get()
+            if request is None:
+                break
+            batch = [request]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    request = self.requests.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+            futures = [r[3] for r in batch]
+            pending = self.pool.submit(verify_batch, self.scheme_name, [r[:3] for r in batch])
+            pending.add_done_callback(functools.partial(self.resolve, futures))
+
+    @staticmethod
+    def resolve(futures, pending):
+        error = pending.exception()
+        if error is not None:
+            for future in futures:
+                future.set_exception(error)
+            return
+        for future, valid in zip(futures, pending.result()):
+            future.set_result(valid)
+
+    def close(self):
+        """
+        Verify everything already submitted, then stop the workers.
+        """
+        self.requests.put(None)
+        self.dispatcher.join()
+        self.pool.shutdown(wait=True)
@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+from binary_chain import BinaryChainReader
+from merkle import entry_leaf, merkle_root
+
+# ----------------- Parallel Chain Integrity Verifier ---------------- #
+def block_fields(record):
+    """
+    (vehicle_id, payload, timestamp, merkle_root, previous_hash, hash) for a
+    record from either chain: revocation blocks carry "action", certificate
+    blocks "certificate". Merkle batch blocks also carry "entries".
+    """
+    payload = record["action"] if "action" in record else record["certificate"]
+    root = merkle_root([entry_leaf(v, a) for v, a in record["entries"]]) if record.get("entries") else ""
+    return (record["vehicle_id"], payload, record["timestamp"], root,
+            record.get("previous_hash"), record["hash"])
+
+def verify_segment(blocks, prev_hash=None):
+    """
+    Recompute Block.compute_hash for a run of consecutive blocks and check the
+    links inside it. prev_hash is the hash of the block before the segment if
+    known; it is only needed for exports written before previous_hash was saved.
+
+    Returns (count, head_previous_hash, tail_hash, first_broken_local_index).
+    """
+    count = 0
+    head_prev = None
+    broken = None
+    sha256 = hashlib.sha256
+    for vehicle_id, payload, timestamp, root, previous_hash, block_hash in blocks:
+        if previous_hash is None:
+            previous_hash = prev_hash
+        if count == 0:
+            head_prev = previous_hash
+        elif broken is None and previous_hash != prev_hash:
+            broken = count
+        # Same preimage as Block.compute_hash in blockchain.py / simulation.py
+        digest = sha256(f"{vehicle_id}{payload}{timestamp}{previous_hash}{root}".encode()).hexdigest()
+        if broken is None and digest != block_hash:
+            broken = count
+        prev_hash = block_hash
+        count += 1
+    return count, head_prev, prev_hash, broken
+
+def verify_journal_range(path, start, end):
+    """
+    Verify the journal lines that start inside the byte range [start, end).
+    """
+    def blocks():
+        with open(path, "rb") as f:
+            if start:
+                f.seek(start - 1)
+                f.readline()  # skip to the first line starting at or after `start`
+            while f.tell() < end:
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    return
+                yield block_fields(json.loads(line))
+    return verify_segment(blocks())
+
+def verify_binary_range(path, start, end):
+    """
+    Verify blocks [start, end) of a binary (.vbc) chain straight from its mmap.
+    """
+    reader = BinaryChainReader(path)
+    result = verify_segment(block_fields(reader.record(i)) for i in range(start, min(end, len(reader))))
+    reader.close()
+    return result
+
+def verify_chain(path, workers=None):
+    """
+    Verify every hash and previous_hash link in a chain file.
+    Accepts a block journal (.jsonl), a binary chain (.vbc) or a full JSON export.
+
+    Returns (block_count, first_broken_index or None, elapsed_seconds).
+    """
+    workers = workers or os.cpu_count() or 1
+    start_time = time.perf_counter()
+    if path.endswith(".jsonl"):
+        size = os.path.getsize(path)
+        n_segments = workers * 4
+        bounds = [size * i // n_segments for i in range(n_segments + 1)]
+        tasks = [(path, bounds[i], bounds[i + 1]) for i in range(n_segments)]
+        with Pool(workers) as pool:
+            results = pool.starmap(verify_journal_range, tasks)
+    elif path.endswith(".vbc"):
+        reader = BinaryChainReader(path)
+        count = len(reader)
+        reader.close()
+        n_segments = workers * 4
+        step = max(1, -(-count // n_segments))
+        tasks = [(path, i, i + step) for i in range(0, count, step)]
+        with Pool(workers) as pool:
+            results = pool.starmap(verify_binary_range, tasks)
+    else:
+        with open(path) as f:
+            blocks = [block_fields(r) for r in json.load(f)]
+        n_segments = workers * 4
+        step = max(1, -(-len(blocks) // n_segments))
+        tasks = [(blocks[i:i + step], blocks[i - 1][5] if i else "0")
+                 for i in range(0, len(blocks), step)]
+        with Pool(workers) as pool:
+            results = pool.starmap(verify_segment, tasks)
+
+    # Stitch segments: each head must link to the previous segment's tail
+    total = 0
+    first_broken = None
+    prev_tail = None
+    for count, head_prev, tail_hash, broken in results:
+        if count == 0:
+            continue
+        if total and head_prev != prev_tail:
+            first_broken = total
+            break
+        if broken is not None:
+            first_broken = total + broken
+            break
+        total += count
+        prev_tail = tail_hash
+    if first_broken is not None:
+        total = sum(r[0] for r in results)
+    return total, first_broken, time.perf_counter() - start_time
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else "revocation_blockchain.jsonl"
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    count, first_broken, elapsed = verify_chain(path, workers)
+    rate = count / elapsed if elapsed else float("inf")
+    print(f"Verified {count} blocks in {elapsed:.2f}s ({rate:,.0f} blocks/sec)")
+    if first_broken is None:
+        print("Chain OK")
+    else:
+        print(f"First broken link at block {first_broken}")
+        sys.exit(1)